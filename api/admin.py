@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Article, Comment, ArticleCategory
+from .models import Article, Comment, ArticleCategory, ArchivedArticle
 
 
 @admin.register(ArticleCategory)
@@ -14,11 +14,17 @@ class ArticleCategoryAdmin(admin.ModelAdmin):
     
     @admin.action(description='Activate selected categories')
     def activate_categories(self, request, queryset):
-        queryset.update(is_active=True)
+        self._set_active(queryset, True)
     
     @admin.action(description='Deactivate selected categories')
     def deactivate_categories(self, request, queryset):
-        queryset.update(is_active=False)
+        self._set_active(queryset, False)
+    
+    def _set_active(self, queryset, is_active):
+        # Saved one by one so the signals propagate the change to the articles' copies
+        for category in queryset.exclude(is_active=is_active):
+            category.is_active = is_active
+            category.save(update_fields=['is_active'])
 
 
 @admin.register(Article)
@@ -29,6 +35,8 @@ class ArticleAdmin(admin.ModelAdmin):
     raw_id_fields = ('category',)
     list_select_related = ('category',)
     date_hierarchy = 'created_at'
+    # Maintained by the comment signals and the counter flushes (api/counters.py)
+    readonly_fields = ('view_count', 'reaction_count', 'comment_count')
 
 
 @admin.register(Comment)
@@ -38,6 +46,21 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = ('commenter_name', 'comment_text')
 
 
+@admin.register(ArchivedArticle)
+class ArchivedArticleAdmin(admin.ModelAdmin):
+    """Read-only: articles are moved here by `python manage.py archive_articles`"""
+    list_display = ('__str__', 'category', 'created_at', 'archived_at')
+    list_filter = ('main_category',)
+    search_fields = ('headline', 'headline_en', 'headline_fr')
+    list_select_related = ('category',)
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 from .models import FCMSubscription
 
 @admin.register(FCMSubscription)
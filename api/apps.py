@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api"
+
+    def ready(self):
+        # Full-text index objects live outside the migration graph (see api/search.py)
+        from .search import install_search_index
+        post_migrate.connect(install_search_index, sender=self)
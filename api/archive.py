@@ -0,0 +1,122 @@
+"""
+Cold-article archival.
+
+Almost all traffic reads recent articles, so articles older than
+settings.ARTICLE_ARCHIVE_AFTER_DAYS move, with their comments, from
+api_article/api_comment to ArchivedArticle/ArchivedComment (same IDs and
+fields). `archive_articles` moves them oldest first, one chunk per
+transaction. Articles whose deadline has not passed stay, as closing-soon
+lists them, and so do articles with assistance requests, which the team
+follows up on. In-app notifications lose their link to an archived article,
+as when it is deleted; they keep their own title and message.
+
+- The feed, list and category endpoints read the hot table only.
+- The article detail (API and web page) falls back to the archive.
+- Plain searches return the matching archived articles after the current
+  ones, through the archive's own full-text index (see api/search.py). Their
+  headline words stay in the suggestions. Searches with a filter or an
+  ordering (?search=x&mood=..., &ordering=...), and plain ones too broad for
+  the search result cache, read the hot table only.
+- Archived articles are read-only: views, reactions and comments on them are
+  not recorded.
+
+Run nightly with: python manage.py archive_articles
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+COMMENT_FIELDS = ('id', 'article_id', 'commenter_name', 'comment_text', 'timestamp')
+
+
+def _article_fields():
+    """Article columns copied to ArchivedArticle"""
+    from .models import ArchivedArticle
+
+    return [field.attname for field in ArchivedArticle._meta.concrete_fields if field.name != 'archived_at']
+
+
+def due_articles(days=None, now=None):
+    """Articles created more than `days` days ago (default: the setting), with no assistance request,
+    whose deadline, if any, has passed"""
+    from .models import Article, AssistanceRequest
+
+    now = now or timezone.now()
+    days = settings.ARTICLE_ARCHIVE_AFTER_DAYS if days is None else days
+    return Article.objects.filter(created_at__lt=now - timedelta(days=days)).exclude(
+        deadline__gte=timezone.localdate(now)
+    ).exclude(pk__in=AssistanceRequest.objects.values('article_id'))
+
+
+def archive_chunk(article_ids):
+    """Move `article_ids` and their comments to the archive in one transaction. Returns the number moved."""
+    from . import feed, response_cache, versions
+    from .models import (
+        ArchivedArticle, ArchivedComment, Article, AssistanceRequest, Comment, RenderedArticle, UserNotification,
+    )
+
+    with transaction.atomic():
+        articles = list(
+            Article.objects.filter(pk__in=article_ids)
+            .exclude(pk__in=AssistanceRequest.objects.values('article_id'))
+            .values(*_article_fields())
+        )
+        if not articles:
+            return 0
+        article_ids = [row['id'] for row in articles]
+        comments = list(Comment.objects.filter(article_id__in=article_ids).values(*COMMENT_FIELDS))
+        ArchivedArticle.objects.bulk_create([ArchivedArticle(**row) for row in articles])
+        ArchivedComment.objects.bulk_create([ArchivedComment(**row) for row in comments])
+
+        # Raw deletes: the model signals would re-rank the feed, drop the
+        # headline suggestions and bump the versions once per row
+        RenderedArticle.objects.filter(article_id__in=article_ids).delete()
+        UserNotification.objects.filter(article_id__in=article_ids).update(article=None)
+        Comment.objects.filter(article_id__in=article_ids)._raw_delete(Comment.objects.db)
+        Article.objects.filter(pk__in=article_ids)._raw_delete(Article.objects.db)
+
+        for category_id in {row['category_id'] for row in articles} - {None}:
+            feed.close_gaps(category_id)
+        versions.bump(versions.ARTICLES)
+        if comments:
+            versions.bump(versions.COMMENTS)
+        response_cache.evict(response_cache.FEED, response_cache.CATEGORY_ARTICLES)
+    return len(articles)
+
+
+def archive_articles(days=None, chunk_size=500, stdout=None):
+    """Move every due article (see `due_articles`) to the archive. Returns the number moved."""
+    from . import counters
+
+    # Buffered view/reaction counts are applied before their rows move
+    counters.flush()
+
+    due = due_articles(days).order_by('created_at', 'id').values_list('pk', flat=True)
+    moved = 0
+    while True:
+        article_ids = list(due[:chunk_size])
+        if not article_ids:
+            break
+        moved += archive_chunk(article_ids)
+        if stdout is not None:
+            stdout.write(f'  {moved} articles archived')
+    return moved
+
+
+def get_archived(pk):
+    """The archived article `pk` with its category, if listed (active category), else None"""
+    from .models import ArchivedArticle
+
+    try:
+        return ArchivedArticle.objects.select_related('category').filter(pk=pk, category_is_active=True).first()
+    except (TypeError, ValueError):
+        return None
+
+
+def in_bulk(pks):
+    """{pk: archived article} of the listed ones among `pks`, as Article.objects.in_bulk"""
+    from .models import ArchivedArticle
+
+    return ArchivedArticle.objects.select_related('category').filter(category_is_active=True).in_bulk(pks)
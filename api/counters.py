@@ -0,0 +1,226 @@
+"""
+Write-behind article view and reaction counters.
+
+Recording a view or a reaction only adds to a per-process buffer; the
+request path writes nothing. Every DRAIN_INTERVAL seconds, on its next
+increment, a process moves its buffer to the PendingArticleCounts rows in one
+transaction (one atomic F() update per article, creating the row for the
+first increment), so the database sees a write per process and interval
+rather than one per view. A process that exits first loses its last few
+increments, which only makes the counts approximate.
+
+The pending increments are applied to Article every few seconds by `flush()`,
+which groups articles by their pending amounts and issues one F() update per
+group, so a burst of traffic on many articles costs a handful of UPDATE
+statements in one transaction. It then subtracts what it applied from the
+pending rows, again with F(), so increments recorded meanwhile are kept for
+the next flush.
+
+A flush is scheduled as a django-q task, FLUSH_INTERVAL seconds ahead so
+increments pile up, by the first drain after the previous flush;
+`manage.py flush_article_counters` flushes whatever is left when the cluster
+isn't running.
+
+comment_count is kept exact by the Comment signals in api/models.py;
+`recompute_comment_counts()` repairs it after changes that bypass them.
+"""
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = 'counters'
+FIELDS = ('view_count', 'reaction_count')
+
+# Seconds a process buffers increments before writing them
+DRAIN_INTERVAL = 5
+# Seconds between an increment and the flush that applies it
+FLUSH_INTERVAL = 5
+
+_FLUSH_PENDING_KEY = 'flush:pending'
+
+_buffer_lock = threading.Lock()
+_buffer = Counter()  # (article_id, field) -> amount
+_drained_at = time.monotonic()
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def record(article_id, field, amount=1):
+    """Buffer `amount` more `field` ('view_count' or 'reaction_count') for an article"""
+    global _drained_at
+
+    if field not in FIELDS:
+        raise ValueError(f'Unknown counter field: {field}')
+
+    with _buffer_lock:
+        _buffer[article_id, field] += amount
+        due = time.monotonic() - _drained_at >= DRAIN_INTERVAL
+        if due:
+            _drained_at = time.monotonic()
+    if due:
+        drain()
+
+
+def drain(schedule=True):
+    """
+    Move this process's buffered increments to PendingArticleCounts, and
+    with `schedule`, schedule their flush. Returns the number of articles.
+    """
+    from .models import PendingArticleCounts
+
+    with _buffer_lock:
+        buffered = dict(_buffer)
+        _buffer.clear()
+    amounts = defaultdict(dict)
+    for (article_id, field), amount in buffered.items():
+        amounts[article_id][field] = amount
+    if not amounts:
+        return 0
+
+    with transaction.atomic():
+        for article_id, deltas in amounts.items():
+            # No row when flushed (or never counted); the loser of a concurrent create
+            # adds to the winner's row, unless a flush removed that in between too
+            while not PendingArticleCounts.objects.filter(article_id=article_id).update(
+                **{field: F(field) + amount for field, amount in deltas.items()}
+            ):
+                try:
+                    with transaction.atomic():
+                        PendingArticleCounts.objects.create(article_id=article_id, **deltas)
+                    break
+                except IntegrityError:
+                    continue
+    if schedule:
+        schedule_flush()
+    return len(amounts)
+
+
+def record_view(article_id):
+    record(article_id, 'view_count')
+
+
+def record_reaction(article_id):
+    record(article_id, 'reaction_count')
+
+
+def schedule_flush():
+    """Schedule a flush FLUSH_INTERVAL seconds ahead unless one is already waiting"""
+    if not _cache().add(_FLUSH_PENDING_KEY, 1, timeout=FLUSH_INTERVAL * 12):
+        return
+    try:
+        from django_q.tasks import schedule
+        schedule('api.counters.flush_scheduled', next_run=timezone.now() + timedelta(seconds=FLUSH_INTERVAL))
+    except Exception as e:
+        # Increments stay buffered until the next flush
+        _cache().delete(_FLUSH_PENDING_KEY)
+        logger.error(f"Could not schedule counter flush: {e}")
+
+
+def flush_scheduled():
+    # Increments from now on schedule the next flush
+    _cache().delete(_FLUSH_PENDING_KEY)
+    return flush()
+
+
+def pending():
+    """Increments not flushed yet (this process's buffer included), as {article_id: {field: amount}}"""
+    from .models import PendingArticleCounts
+
+    amounts = defaultdict(Counter)
+    for row in PendingArticleCounts.objects.values('article_id', *FIELDS):
+        amounts[row['article_id']].update({field: row[field] for field in FIELDS})
+    with _buffer_lock:
+        for (article_id, field), amount in _buffer.items():
+            amounts[article_id][field] += amount
+    return {
+        article_id: {field: amount for field, amount in deltas.items() if amount}
+        for article_id, deltas in amounts.items() if any(deltas.values())
+    }
+
+
+def flush(chunk_size=500):
+    """Apply the buffered increments (this process's too) to Article. Returns the number of articles updated."""
+    from .models import Article, PendingArticleCounts
+    from . import versions
+
+    drain(schedule=False)
+    # Read in the transaction that applies them: a concurrent flush waits for
+    # the row locks, or on SQLite fails to commit, rather than applying them twice
+    with transaction.atomic():
+        amounts = {
+            pk: deltas
+            for pk, *deltas in PendingArticleCounts.objects.select_for_update().order_by().values_list(
+                'article_id', *FIELDS
+            )
+        }
+        # Articles with the same pending amounts share one UPDATE
+        groups = defaultdict(list)
+        for pk, deltas in amounts.items():
+            groups[tuple(deltas)].append(pk)
+
+        updated = 0
+        for deltas, pks in groups.items():
+            if not any(deltas):
+                continue
+            for start in range(0, len(pks), chunk_size):
+                chunk = pks[start:start + chunk_size]
+                updated += Article.objects.filter(pk__in=chunk).update(
+                    **{field: F(field) + delta for field, delta in zip(FIELDS, deltas) if delta}
+                )
+                # Subtract what was applied rather than deleting, keeping concurrent increments
+                PendingArticleCounts.objects.filter(article_id__in=chunk).update(
+                    **{field: F(field) - delta for field, delta in zip(FIELDS, deltas) if delta}
+                )
+        if amounts:
+            PendingArticleCounts.objects.filter(article_id__in=amounts, view_count=0, reaction_count=0).delete()
+        # The cached feed pages (api/response_cache.py) are left to expire rather
+        # than evicted every few seconds; their counts lag by at most its timeout
+        if updated:
+            versions.bump(versions.ARTICLE_STATS)
+    return updated
+
+
+def recompute_comment_counts(chunk_size=2000, stdout=None):
+    """
+    Set every Article.comment_count from one grouped count of the comments.
+    Returns the number of articles that were corrected.
+    """
+    from .models import Article, Comment
+    from . import response_cache, versions
+
+    counts = dict(
+        Comment.objects.order_by().values('article').annotate(total=Count('id')).values_list('article', 'total')
+    )
+    # Articles needing the same count share an UPDATE: bulk_update() builds a
+    # CASE branch per row, which costs far more than the writes themselves
+    stale = defaultdict(list)
+    for pk, comment_count in Article.objects.order_by('pk').values_list('pk', 'comment_count').iterator(
+        chunk_size=chunk_size
+    ):
+        count = counts.get(pk, 0)
+        if comment_count != count:
+            stale[count].append(pk)
+
+    corrected = 0
+    with transaction.atomic():
+        for count, pks in stale.items():
+            for start in range(0, len(pks), chunk_size):
+                corrected += Article.objects.filter(pk__in=pks[start:start + chunk_size]).update(comment_count=count)
+
+    if corrected:
+        versions.bump(versions.ARTICLE_STATS)
+        response_cache.evict(response_cache.FEED, response_cache.CATEGORY_ARTICLES)
+    if stdout is not None:
+        stdout.write(f'  {len(counts)} articles have comments')
+    return corrected
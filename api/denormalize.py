@@ -0,0 +1,111 @@
+"""
+Category attributes copied onto Article.
+
+Feed queries filter on their category's is_active, main_category and slug,
+and every card shows its slug and names. Article keeps its own copies of
+them (category_is_active, main_category, category_slug, category_name_en,
+category_name_fr) so these queries read the article table alone, through
+its (<copy>, created_at) indexes, instead of joining ArticleCategory.
+
+- Article.save() copies them whenever the category is (re)assigned.
+- Saving a category runs `propagate` in the same transaction when a field
+  the articles copy or render changed: UPDATEs over chunks of primary keys
+  rewrite the copies of the category's articles (and of its archived ones),
+  then they are re-rendered and the cached feed is evicted. The feed never
+  lists them as of an older version of the category. A change to emoji or
+  order only re-renders them; other saves leave the articles alone.
+- Deleting a category clears the copies of its articles in the same
+  transaction, as their category is set to NULL.
+
+Archived articles (api/archive.py) keep copies too, updated along with them.
+
+Writes that bypass save() (queryset.update(category=...), bulk_create,
+raw imports) are caught up with: python manage.py sync_article_categories
+"""
+from django.db.models import Q
+
+FIELDS = ('category_slug', 'category_name_en', 'category_name_fr', 'main_category', 'category_is_active')
+# Category fields behind the copies, and those also embedded in the renderings (category_details)
+COPIED_FIELDS = ('slug', 'name_en', 'name_fr', 'main_category', 'is_active')
+RENDERED_FIELDS = ('slug', 'name_en', 'name_fr', 'main_category', 'emoji', 'order')
+
+
+def category_values(category):
+    """{field: value} of the copies for an article of `category` (None for no category)"""
+    if category is None:
+        return dict.fromkeys(FIELDS, None) | {'category_is_active': False}
+    return {
+        'category_slug': category.slug,
+        'category_name_en': category.name_en,
+        'category_name_fr': category.name_fr,
+        'main_category': category.main_category,
+        'category_is_active': category.is_active,
+    }
+
+
+def _stale(articles, values):
+    """`articles` whose copies differ from `values`"""
+    return articles.exclude(**values) if values['category_slug'] is not None else \
+        articles.filter(Q(category_slug__isnull=False) | Q(category_is_active=True))
+
+
+def propagate(category, changed=None, chunk_size=1000):
+    """
+    Copy a category's current attributes to its articles and re-render them,
+    as far as the `changed` category fields (default: all) require.
+    Returns the number of articles whose copies were updated.
+    """
+    from . import rendering, response_cache, versions
+    from .models import ArchivedArticle, Article
+
+    changed = set(COPIED_FIELDS + RENDERED_FIELDS if changed is None else changed)
+    updated = 0
+    if changed & set(COPIED_FIELDS):
+        values = category_values(category)
+        for model in (ArchivedArticle, Article):
+            article_ids = list(
+                model.objects.filter(category_id=category.pk).order_by('pk').values_list('pk', flat=True)
+            )
+            for start in range(0, len(article_ids), chunk_size):
+                chunk = model.objects.filter(pk__in=article_ids[start:start + chunk_size])
+                count = _stale(chunk, values).update(**values)
+                if model is Article:
+                    updated += count
+
+    # Cards also embed the category's emoji and order, which have no copy
+    if changed & set(RENDERED_FIELDS):
+        rendering.invalidate(category_id=category.pk, chunk_size=chunk_size)
+    if updated:
+        versions.bump(versions.ARTICLES)
+        response_cache.evict(response_cache.FEED, response_cache.CATEGORY_ARTICLES)
+    return updated
+
+
+def clear(category_id):
+    """Reset the copies of a category's articles (before it is deleted)"""
+    from .models import ArchivedArticle, Article
+
+    ArchivedArticle.objects.filter(category_id=category_id).update(**category_values(None))
+    return Article.objects.filter(category_id=category_id).update(**category_values(None))
+
+
+def sync_all(chunk_size=1000):
+    """Re-copy every article's category attributes. Returns the number of articles updated."""
+    from . import rendering, response_cache, versions
+    from .models import Article, ArticleCategory
+
+    updated = _stale(Article.objects.filter(category__isnull=True), category_values(None)) \
+        .update(**category_values(None))
+    for category in ArticleCategory.objects.all():
+        values = category_values(category)
+        article_ids = list(
+            _stale(Article.objects.filter(category=category), values).order_by('pk').values_list('pk', flat=True)
+        )
+        for start in range(0, len(article_ids), chunk_size):
+            updated += Article.objects.filter(pk__in=article_ids[start:start + chunk_size]).update(**values)
+        if article_ids:
+            rendering.invalidate(category_id=category.pk)
+    if updated:
+        versions.bump(versions.ARTICLES)
+        response_cache.evict(response_cache.FEED, response_cache.CATEGORY_ARTICLES)
+    return updated
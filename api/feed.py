@@ -0,0 +1,566 @@
+"""
+Interleaved feed order.
+
+The unfiltered article feed round-robins categories: the newest article of
+every category, then the second newest of every category, and so on, with
+categories ordered by their own newest article. Rather than loading every
+article to rebuild that order on each request, each Article stores its rank
+inside its category (``feed_rank``, counted from the oldest) and FeedBucket
+keeps the size, head (newest) article and head rank of every category. A new
+article is appended at head rank + 1, so publishing rewrites no other rank.
+Both are updated incrementally from the Article signals in api/models.py.
+
+The open feed (?open=true) is the same order without the articles whose
+deadline has passed, kept in ``open_feed_rank`` and the bucket's ``open_*``
+fields. Saves place articles in it by their deadline; deadlines pass at
+midnight without a save, so `refresh_open_feed` re-ranks it nightly.
+
+A page of the feed is resolved from the (small) bucket table, as offsets
+from each head, and then read with a single query of one rank range per
+category on the ``(category, feed_rank)`` index (or
+``(category, open_feed_rank)``).
+
+Inserting or removing an article at some offset from its head only moves
+the articles after it, so the cached first pages (api/response_cache.py)
+are evicted only for changes near the head.
+"""
+import base64
+import binascii
+import json
+import logging
+from collections import namedtuple
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Article rank field and FeedBucket fields of one feed order
+FeedOrder = namedtuple('FeedOrder', 'rank size head_created_at head_article_id head_rank')
+FULL = FeedOrder('feed_rank', 'size', 'head_created_at', 'head_article_id', 'head_rank')
+OPEN = FeedOrder('open_feed_rank', 'open_size', 'open_head_created_at', 'open_head_article_id', 'open_head_rank')
+
+def _cache_group(order):
+    from . import response_cache
+    return response_cache.FEED_FULL if order is FULL else response_cache.FEED_OPEN
+
+
+def _evict_near_head(order, offset):
+    """Evict the cached pages of `order` if they can reach `offset` from a head"""
+    from . import response_cache
+
+    if offset < response_cache.FEED_CACHED_DEPTH:
+        response_cache.evict(_cache_group(order))
+
+
+# A non-empty bucket of a feed order, as read by get_buckets
+Bucket = namedtuple('Bucket', 'category_id size head_rank')
+
+
+def open_filter(today=None):
+    """Q for articles without a deadline or with one not yet passed"""
+    return Q(deadline__isnull=True) | Q(deadline__gte=today or timezone.localdate())
+
+
+def _current_key(today):
+    return f'feed:open_ranks_current:{today.isoformat()}'
+
+
+def open_ranks_current(today=None):
+    """
+    Whether the open ranks leave out every passed deadline as of `today`:
+    from midnight until `refresh_open_feed` runs, they still count the
+    articles that expired, so pages can't be read by rank.
+    Checked once a day (per cache); ranks stay current through the day.
+    """
+    from django.core.cache import cache
+    from .models import Article
+
+    today = today or timezone.localdate()
+    if cache.get(_current_key(today)):
+        return True
+    current = not Article.objects.filter(deadline__lt=today, open_feed_rank__isnull=False).exists()
+    if current:
+        cache.set(_current_key(today), True, 24 * 60 * 60)
+    return current
+
+
+def is_open(article, today=None):
+    """Whether `article` belongs in the open feed"""
+    from .models import Article
+
+    deadline = Article._meta.get_field('deadline').to_python(article.deadline)
+    return deadline is None or deadline >= (today or timezone.localdate())
+
+
+def _newer_than(article):
+    """Q for articles that sort before `article` in the feed (newest first)"""
+    return Q(created_at__gt=article.created_at) | Q(created_at=article.created_at, id__gt=article.id)
+
+
+def _refresh_head(bucket, order=FULL):
+    """Point the bucket at the article at its head rank (or clear it when there is none)"""
+    from .models import Article
+
+    head = Article.objects.filter(
+        category_id=bucket.category_id, **{order.rank: getattr(bucket, order.head_rank)}
+    ).values('id', 'created_at').first()
+    setattr(bucket, order.head_article_id, head['id'] if head else None)
+    setattr(bucket, order.head_created_at, head['created_at'] if head else None)
+    bucket.save(update_fields=[order.head_article_id, order.head_created_at])
+
+
+def _insert(article, bucket, order):
+    """
+    Rank `article` among the ranked articles of its category in `order`.
+    Only the articles newer than it move up, so a new article moves none.
+    """
+    from .models import Article, FeedBucket
+
+    siblings = Article.objects.filter(
+        category_id=article.category_id, **{f'{order.rank}__isnull': False}
+    ).exclude(pk=article.pk)
+    if getattr(bucket, order.size):
+        head_rank = getattr(bucket, order.head_rank) + 1
+        rank = head_rank - siblings.filter(_newer_than(article)).count()
+        siblings.filter(**{f'{order.rank}__gte': rank}).update(**{order.rank: F(order.rank) + 1})
+    else:
+        head_rank = rank = 0
+    Article.objects.filter(pk=article.pk).update(**{order.rank: rank})
+    setattr(article, order.rank, rank)
+    _evict_near_head(order, head_rank - rank)
+
+    FeedBucket.objects.filter(pk=bucket.pk).update(**{order.size: F(order.size) + 1, order.head_rank: head_rank})
+    setattr(bucket, order.size, getattr(bucket, order.size) + 1)
+    setattr(bucket, order.head_rank, head_rank)
+    if rank == head_rank:
+        setattr(bucket, order.head_article_id, article.pk)
+        setattr(bucket, order.head_created_at, article.created_at)
+        bucket.save(update_fields=[order.head_article_id, order.head_created_at])
+
+
+def _remove(category_id, rank, bucket, order, exclude_pk=None):
+    """
+    Close the gap left at `rank` in `order`, moving whichever side of it is
+    shorter: the newer articles down or the older ones up.
+    """
+    from .models import Article, FeedBucket
+
+    if rank is None:
+        return
+    siblings = Article.objects.filter(category_id=category_id)
+    if exclude_pk is not None:
+        siblings = siblings.exclude(pk=exclude_pk)
+    if bucket is None:
+        siblings.filter(**{f'{order.rank}__gt': rank}).update(**{order.rank: F(order.rank) - 1})
+        _evict_near_head(order, 0)
+        return
+
+    head_rank = getattr(bucket, order.head_rank)
+    newer = head_rank - rank
+    older = getattr(bucket, order.size) - 1 - newer
+    _evict_near_head(order, newer)
+    if newer <= older:
+        siblings.filter(**{f'{order.rank}__gt': rank}).update(**{order.rank: F(order.rank) - 1})
+        head_rank = max(head_rank - 1, 0)
+    else:
+        siblings.filter(**{f'{order.rank}__lt': rank}).update(**{order.rank: F(order.rank) + 1})
+
+    FeedBucket.objects.filter(pk=bucket.pk, **{f'{order.size}__gt': 0}).update(
+        **{order.size: F(order.size) - 1, order.head_rank: head_rank}
+    )
+    setattr(bucket, order.size, max(getattr(bucket, order.size) - 1, 0))
+    setattr(bucket, order.head_rank, head_rank)
+    if newer == 0:
+        _refresh_head(bucket, order)
+
+
+def insert_article(article):
+    """Give `article` its ranks in its category bucket, shifting older articles down."""
+    from .models import Article, FeedBucket
+
+    if article.category_id is None:
+        if article.feed_rank is not None or article.open_feed_rank is not None:
+            Article.objects.filter(pk=article.pk).update(feed_rank=None, open_feed_rank=None)
+            article.feed_rank = article.open_feed_rank = None
+        return
+
+    with transaction.atomic():
+        bucket, _ = FeedBucket.objects.get_or_create(category_id=article.category_id)
+        _insert(article, bucket, FULL)
+        if is_open(article):
+            _insert(article, bucket, OPEN)
+        elif article.open_feed_rank is not None:
+            Article.objects.filter(pk=article.pk).update(open_feed_rank=None)
+            article.open_feed_rank = None
+
+
+def remove_article(category_id, rank, open_rank=None, exclude_pk=None):
+    """Close the gaps left at `rank` (and `open_rank`) in a category bucket."""
+    from .models import FeedBucket
+
+    if category_id is None or rank is None:
+        return
+
+    with transaction.atomic():
+        bucket = FeedBucket.objects.filter(category_id=category_id).first()
+        _remove(category_id, rank, bucket, FULL, exclude_pk)
+        _remove(category_id, open_rank, bucket, OPEN, exclude_pk)
+
+
+def update_openness(article, open_rank):
+    """Add `article` to the open feed, or drop it from `open_rank`, after its deadline changed"""
+    from .models import Article, FeedBucket
+
+    with transaction.atomic():
+        bucket, _ = FeedBucket.objects.get_or_create(category_id=article.category_id)
+        if open_rank is None:
+            _insert(article, bucket, OPEN)
+            return
+        _remove(article.category_id, open_rank, bucket, OPEN, exclude_pk=article.pk)
+        Article.objects.filter(pk=article.pk).update(open_feed_rank=None)
+        article.open_feed_rank = None
+
+
+def evict_cached_pages(article_id, counters=False):
+    """
+    Evict the cached feed pages that can show the article, and with
+    `counters` the cached category listings that can (for changes to what
+    they display of it, see api/response_cache.py).
+    """
+    from . import response_cache
+    from .models import Article, FeedBucket
+
+    article = Article.objects.filter(pk=article_id).values('category_id', FULL.rank, OPEN.rank).first()
+    if article is None or article['category_id'] is None:
+        return
+    bucket = FeedBucket.objects.filter(category_id=article['category_id']).first()
+    if bucket is None:
+        return
+    groups = []
+    for order in (FULL, OPEN):
+        rank = article[order.rank]
+        if rank is None:
+            continue
+        offset = getattr(bucket, order.head_rank) - rank
+        if offset < response_cache.FEED_CACHED_DEPTH:
+            groups.append(_cache_group(order))
+        if counters and order is FULL and offset < response_cache.CATEGORY_ARTICLES_DEPTH:
+            groups.append(response_cache.CATEGORY_ARTICLES)
+    response_cache.evict(*groups)
+
+
+def _rank(bucket, order, articles, chunk_size, keep_head=False):
+    """
+    Rank `articles` in `order`, the newest at the bucket's head rank (with
+    `keep_head`, so removals only move the articles older than them) or at
+    the number of articles - 1, and point the bucket at them.
+    Returns (number of articles, number re-ranked).
+    """
+    from .models import Article
+
+    rows = list(articles.order_by('-created_at', '-id').values_list('id', 'created_at', order.rank))
+    head_rank = max(len(rows) - 1, getattr(bucket, order.head_rank) if keep_head else 0, 0)
+    changed = [
+        Article(id=article_id, **{order.rank: head_rank - position})
+        for position, (article_id, _, current) in enumerate(rows)
+        if current != head_rank - position
+    ]
+    Article.objects.bulk_update(changed, [order.rank], batch_size=chunk_size)
+
+    setattr(bucket, order.size, len(rows))
+    setattr(bucket, order.head_rank, head_rank)
+    setattr(bucket, order.head_article_id, rows[0][0] if rows else None)
+    setattr(bucket, order.head_created_at, rows[0][1] if rows else None)
+    return len(rows), len(changed)
+
+
+def rebuild_feed_order(chunk_size=1000, stdout=None):
+    """Recompute every rank and bucket from scratch. Returns the number of ranked articles."""
+    from .models import Article, ArticleCategory, FeedBucket
+
+    total = 0
+    with transaction.atomic():
+        Article.objects.filter(category__isnull=True).exclude(feed_rank=None).update(feed_rank=None)
+        FeedBucket.objects.all().delete()
+
+        for category in ArticleCategory.objects.all():
+            bucket = FeedBucket(category=category)
+            size, changed = _rank(bucket, FULL, Article.objects.filter(category=category), chunk_size)
+            if not size:
+                continue
+            bucket.save(force_insert=True)
+            total += size
+            if stdout is not None:
+                stdout.write(f'  {category.slug}: {size} articles ({changed} re-ranked)')
+
+        refresh_open_feed(chunk_size=chunk_size)
+
+    return total
+
+
+def refresh_open_feed(today=None, chunk_size=1000, stdout=None):
+    """
+    Re-rank the open feed as of `today` (default: today), dropping the
+    articles whose deadline has passed. Meant to run just after midnight.
+    Returns the number of articles whose open rank changed.
+    """
+    from django.core.cache import cache
+    from . import response_cache, versions
+    from .models import Article, FeedBucket
+
+    today = today or timezone.localdate()
+    updated = Article.objects.filter(category__isnull=True).exclude(open_feed_rank=None).update(open_feed_rank=None)
+
+    # One transaction per bucket, so no lock is held across the whole table
+    for bucket in FeedBucket.objects.select_related('category'):
+        with transaction.atomic():
+            articles = Article.objects.filter(category_id=bucket.category_id)
+            changed = articles.filter(deadline__lt=today).exclude(open_feed_rank=None).update(open_feed_rank=None)
+            size, reranked = _rank(bucket, OPEN, articles.filter(open_filter(today)), chunk_size, keep_head=True)
+            bucket.save(update_fields=[OPEN.size, OPEN.head_article_id, OPEN.head_created_at, OPEN.head_rank])
+        updated += changed + reranked
+        if stdout is not None:
+            stdout.write(f'  {bucket.category.slug}: {size} open articles ({reranked} re-ranked)')
+
+    cache.set(_current_key(today), True, 24 * 60 * 60)
+    # Open feed pages list other articles now
+    if updated:
+        versions.bump(versions.ARTICLES)
+        response_cache.evict(response_cache.FEED_OPEN)
+    return updated
+
+
+def close_gaps(category_id, chunk_size=1000):
+    """
+    Re-rank the articles left in a category after others were removed
+    without the model signals (see api/archive.py). The open feed keeps its
+    members until the next `refresh_open_feed`.
+    """
+    from .models import Article, FeedBucket
+
+    with transaction.atomic():
+        bucket, _ = FeedBucket.objects.get_or_create(category_id=category_id)
+        articles = Article.objects.filter(category_id=category_id)
+        _rank(bucket, FULL, articles, chunk_size, keep_head=True)
+        _rank(bucket, OPEN, articles.exclude(open_feed_rank=None), chunk_size, keep_head=True)
+        bucket.save()
+
+
+def get_buckets(main_category=None, slug=None, order=FULL):
+    """
+    Active, non-empty buckets of `order` in feed order, as Bucket tuples.
+    Optional filters select whole categories, so they don't change ranks.
+    """
+    from .models import FeedBucket
+
+    buckets = FeedBucket.objects.filter(category__is_active=True, **{f'{order.size}__gt': 0})
+    if main_category:
+        buckets = buckets.filter(category__main_category=main_category)
+    if slug:
+        buckets = buckets.filter(category__slug=slug)
+    buckets = buckets.order_by(f'-{order.head_created_at}', f'-{order.head_article_id}')
+    return [Bucket(*row) for row in buckets.values_list('category_id', order.size, order.head_rank)]
+
+
+def _page_slots(buckets, start, end):
+    """
+    (offset, category_id) pairs for feed positions [start, end), offset 0
+    being the newest article of the category.
+    Skips whole runs of offsets arithmetically, so the cost is independent of depth.
+    """
+    offset = 0
+    position = 0
+    active = len(buckets)
+
+    for size in sorted({bucket.size for bucket in buckets}):
+        span = (size - offset) * active
+        if position + span > start:
+            skipped = (start - position) // active
+            offset += skipped
+            position += skipped * active
+            break
+        position += span
+        offset = size
+        active = sum(1 for bucket in buckets if bucket.size > size)
+
+    slots = []
+    while position < end:
+        row = [bucket.category_id for bucket in buckets if bucket.size > offset]
+        if not row:
+            break
+        for category_id in row:
+            if start <= position < end:
+                slots.append((offset, category_id))
+            position += 1
+        offset += 1
+    return slots
+
+
+def get_page(buckets, page_num, page_size, queryset, order=FULL):
+    """
+    Articles on page `page_num` of the interleaved feed (in `order`), in feed order.
+    `queryset` supplies select_related/only options; returns None if the
+    index is out of sync so the caller can fall back to the in-memory path.
+    """
+    total = sum(bucket.size for bucket in buckets)
+    start = (page_num - 1) * page_size
+    end = min(start + page_size, total)
+
+    slots = _page_slots(buckets, start, end)
+    if not slots:
+        return []
+
+    # Offsets from the head -> ranks: one range per category
+    head_ranks = {bucket.category_id: bucket.head_rank for bucket in buckets}
+    first, last = slots[0][0], slots[-1][0]
+    ranges = Q()
+    for category_id in {category_id for _, category_id in slots}:
+        head_rank = head_ranks[category_id]
+        ranges |= Q(category_id=category_id, **{
+            f'{order.rank}__gte': head_rank - last, f'{order.rank}__lte': head_rank - first,
+        })
+    rows = queryset.filter(ranges)
+    by_slot = {
+        (head_ranks[article.category_id] - getattr(article, order.rank), article.category_id): article
+        for article in rows
+    }
+
+    articles = [by_slot.get(slot) for slot in slots]
+    if None in articles:
+        logger.warning("Feed order index is out of sync; run 'python manage.py rebuild_feed_order'")
+        return None
+    return articles
+
+
+# ---------------------------------------------------------------------------
+# Cursor (keyset) pagination of the interleaved feed
+#
+# The cursor freezes the bucket order of the first page and stores, for every
+# bucket that still has articles, the key (created_at, id) of the last article
+# it delivered plus whether it was already served in the current round. Each
+# page then costs one indexed seek per bucket, however deep the client is,
+# and articles published mid-scroll never shift what comes next.
+# ---------------------------------------------------------------------------
+
+_AHEAD = 1       # bucket already served in the current round
+_INCLUSIVE = 2   # key article itself has not been delivered yet
+
+
+def encode_cursor(buckets):
+    payload = [
+        [b.category_id, b.key[0].isoformat(), b.key[1], b.flags]
+        for b in buckets
+    ]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(encoded):
+    """Parse a cursor produced by encode_cursor. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+        payload = json.loads(raw)
+        return [
+            _CursorBucket(int(category_id), (datetime.fromisoformat(created_at), int(pk)), int(flags))
+            for category_id, created_at, pk, flags in payload
+        ]
+    except (TypeError, ValueError, binascii.Error):
+        raise ValueError('Invalid cursor')
+
+
+class _CursorBucket:
+    """Read-ahead buffer over one category, newest first, below `key`."""
+
+    def __init__(self, category_id, key=None, flags=0):
+        self.category_id = category_id
+        self.key = key
+        self.flags = flags
+        self.buffer = []
+        self.exhausted = False
+
+    @property
+    def finished(self):
+        return self.exhausted and not self.buffer
+
+    def fetch(self, queryset, limit):
+        rows = queryset.filter(category_id=self.category_id)
+        if self.key is not None:
+            created_at, pk = self.key
+            last = Q(id__lte=pk) if self.flags & _INCLUSIVE else Q(id__lt=pk)
+            rows = rows.filter(Q(created_at__lt=created_at) | (Q(created_at=created_at) & last))
+        rows = list(rows.order_by('-created_at', '-id')[:limit + 1])
+        self.exhausted = len(rows) <= limit
+        self.buffer.extend(rows)
+        # Later reads continue after the buffered rows
+        if rows:
+            self.key = (rows[-1].created_at, rows[-1].id)
+            self.flags &= ~_INCLUSIVE
+
+    def pop(self, queryset, limit):
+        if not self.buffer and not self.exhausted:
+            self.fetch(queryset, limit)
+        if not self.buffer:
+            return None
+        return self.buffer.pop(0)
+
+
+def get_cursor_page(queryset, page_size, cursor=None, category_ids=()):
+    """
+    One page of the interleaved feed in cursor mode.
+    Without a cursor, `category_ids` are the candidate buckets and their head
+    articles fix the bucket order. Returns (articles, next_cursor or None).
+    """
+    if cursor is None:
+        buckets = [_CursorBucket(category_id) for category_id in category_ids]
+        limit = -(-page_size // max(len(buckets), 1))
+        for bucket in buckets:
+            bucket.fetch(queryset, limit)
+        buckets = [b for b in buckets if b.buffer]
+        buckets.sort(key=lambda b: (b.buffer[0].created_at, b.buffer[0].id), reverse=True)
+    else:
+        buckets = cursor
+        limit = -(-page_size // max(len(buckets), 1))
+        for bucket in buckets:
+            bucket.fetch(queryset, limit)
+
+    articles = []
+    delivered = {}
+    while len(articles) < page_size:
+        live = [b for b in buckets if not b.finished]
+        if not live:
+            break
+        round_ = [b for b in live if not b.flags & _AHEAD]
+        if not round_:
+            for b in live:
+                b.flags &= ~_AHEAD
+            continue
+        for bucket in round_:
+            if len(articles) >= page_size:
+                break
+            article = bucket.pop(queryset, page_size - len(articles))
+            if article is None:
+                continue
+            articles.append(article)
+            delivered[bucket.category_id] = article
+            bucket.flags |= _AHEAD
+
+    # Rewind every bucket to its last delivered article so unread buffered rows come next time
+    remaining = []
+    for bucket in buckets:
+        if bucket.finished:
+            continue
+        if bucket.category_id in delivered:
+            last = delivered[bucket.category_id]
+            bucket.key = (last.created_at, last.id)
+            bucket.flags &= ~_INCLUSIVE
+        elif bucket.buffer:
+            first = bucket.buffer[0]
+            bucket.key = (first.created_at, first.id)
+            bucket.flags |= _INCLUSIVE
+        remaining.append(bucket)
+
+    next_cursor = encode_cursor(remaining) if remaining and len(articles) >= page_size else None
+    return articles, next_cursor
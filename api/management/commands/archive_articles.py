@@ -0,0 +1,33 @@
+"""
+Management command to move cold articles (and their comments) to the archive.
+Run with: python manage.py archive_articles [--days 365]
+
+Meant to run nightly (see DEPLOY.md). Articles older than --days (default
+settings.ARTICLE_ARCHIVE_AFTER_DAYS) move in chunks, one transaction each,
+so it can be interrupted and resumed; see api/archive.py.
+"""
+from django.core.management.base import BaseCommand
+from api.archive import archive_articles
+
+
+class Command(BaseCommand):
+    help = 'Moves articles older than the archive age, with their comments, to the archive tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Archive articles created more than this many days ago (default: ARTICLE_ARCHIVE_AFTER_DAYS)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of articles moved per transaction',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Archiving articles...')
+        moved = archive_articles(days=options['days'], chunk_size=options['chunk_size'], stdout=self.stdout)
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'Done! Archived {moved} articles.'))
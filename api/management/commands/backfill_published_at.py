@@ -0,0 +1,69 @@
+"""
+Management command to fill Article.published_at from the free-text
+Article.timestamp (formats in api/utils/timestamps.py).
+Run with: python manage.py backfill_published_at
+
+Articles are walked in primary key order, one short bulk update per chunk.
+Only articles without a published_at are parsed unless --all is given
+(e.g. after changing GISTFINDER_TIME_ZONE). Changed articles get a new
+render_version; run build_rendered_articles --stale afterwards.
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from api import response_cache, versions
+from api.models import Article
+from api.utils.timestamps import parse_timestamp, published_at
+
+
+class Command(BaseCommand):
+    help = 'Parses Article.timestamp into the indexed Article.published_at'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of articles per bulk update',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Re-parse articles that already have a published_at',
+        )
+
+    def handle(self, *args, **options):
+        articles = Article.objects.order_by('pk')
+        if not options['all']:
+            articles = articles.filter(published_at__isnull=True)
+
+        self.stdout.write('Backfilling published_at...')
+        last_pk, seen, updated, unparsed = 0, 0, 0, 0
+        while True:
+            rows = list(
+                articles.filter(pk__gt=last_pk)
+                .values_list('pk', 'timestamp', 'created_at', 'published_at')[:options['chunk_size']]
+            )
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+            seen += len(rows)
+
+            changed = []
+            for pk, timestamp, created_at, current in rows:
+                if parse_timestamp(timestamp) is None:
+                    unparsed += 1
+                value = published_at(timestamp, created_at)
+                if value != current:
+                    changed.append(Article(pk=pk, published_at=value, render_version=F('render_version') + 1))
+            Article.objects.bulk_update(changed, ['published_at', 'render_version'])
+            updated += len(changed)
+            self.stdout.write(f'  {seen} articles read, {updated} updated')
+
+        if updated:
+            versions.bump(versions.ARTICLES)
+            response_cache.evict(response_cache.FEED, response_cache.CATEGORY_ARTICLES)
+        if unparsed:
+            self.stdout.write(self.style.WARNING(
+                f'{unparsed} timestamps not recognized: their published_at is the creation time.'
+            ))
+        self.stdout.write(self.style.SUCCESS(f'Done! Updated {updated} articles.'))
@@ -0,0 +1,134 @@
+"""
+Management command comparing the cost of a 20-article list page: the
+serializers (before api/rendering.py) against the precomputed card JSON.
+Run with: python manage.py benchmark_article_rendering --articles 2000
+
+Reports the representation step alone (rows already loaded) and the whole
+page including its queries. Synthetic articles are inserted inside a
+transaction that is rolled back, so the database is left untouched.
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework import serializers
+from api import rendering
+from api.denormalize import category_values
+from api.models import Article, ArticleCategory, RenderedArticle
+from api.serializers import ArticleListSerializer, RenderedArticleListSerializer
+
+PAGE_SIZE = 20
+LANGUAGES = (None, 'fr')
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks serializing article list pages against serving precomputed JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--articles', type=int, default=2000, help='Synthetic articles to insert')
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per page')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                ids = self._insert_articles(options['articles'])
+                self._run(ids, options['repeat'])
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write('Synthetic articles rolled back.')
+
+    def _insert_articles(self, count):
+        categories = [
+            ArticleCategory.objects.create(
+                name_en=f'Benchmark {i}', name_fr=f'Benchmark {i}', slug=f'benchmark-render-{i}',
+                main_category='ACTUALITY', emoji='📰',
+            )
+            for i in range(5)
+        ]
+        self.stdout.write(f'Inserting and rendering {count} synthetic articles...')
+        started = time.perf_counter()
+        Article.objects.bulk_create([
+            Article(
+                category=categories[i % len(categories)],
+                **category_values(categories[i % len(categories)]),
+                headline_en=f'Scholarship programme {i} opens applications for 2025',
+                headline_fr=f'Le programme de bourses {i} ouvre les candidatures pour 2025',
+                english_summary='Applications are open to students across the country. ' * 12,
+                french_summary='Les candidatures sont ouvertes aux étudiants de tout le pays. ' * 12,
+                mood='hopeful',
+                source_urls=['https://example.com/a', 'https://example.com/b'],
+                source_names=['Example', 'Other'],
+                thumbnails=['https://example.com/thumb.jpg'],
+                timestamp='2025-01-01',
+            )
+            for i in range(count)
+        ], batch_size=500)
+        ids = list(Article.objects.filter(category__in=categories).order_by('-pk').values_list('pk', flat=True))
+        rendering.build(ids)
+        self.stdout.write(f'  done in {time.perf_counter() - started:.1f}s')
+        return ids
+
+    def _child(self, language):
+        child = ArticleListSerializer(context={'projection_language': language})
+        child.fields
+        return child
+
+    def _serialized(self, page_ids, language):
+        """The list path before: full rows with the category joined, then the serializers"""
+        articles = Article.objects.select_related('category').filter(pk__in=page_ids)
+        return serializers.ListSerializer(articles, child=self._child(language)).data
+
+    def _rendered(self, page_ids, language):
+        articles = Article.objects.filter(pk__in=page_ids).only('category', 'created_at', *rendering.ROW_FIELDS)
+        return RenderedArticleListSerializer(articles, child=self._child(language)).data
+
+    def _median_ms(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def _representation_ms(self, pages, language, repeat):
+        """Median ms turning an already loaded page into its representation"""
+        child = self._child(language)
+        before, after = [], []
+        for page_ids in pages:
+            full = list(Article.objects.select_related('category').filter(pk__in=page_ids))
+            rows = list(Article.objects.filter(pk__in=page_ids).only('category', 'created_at', *rendering.ROW_FIELDS))
+            rendered = rendering.fetch(rows, RenderedArticle.CARD, language)
+            before.append(self._median_ms(lambda: [child.to_representation(article) for article in full], repeat))
+            after.append(self._median_ms(
+                lambda: [rendering.finish(rendered[article.pk], article, child) for article in rows], repeat
+            ))
+        return statistics.median(before), statistics.median(after)
+
+    def _page_ms(self, func, pages, language, repeat):
+        """Median ms for a whole page: queries, serializer setup and representation"""
+        return statistics.median(
+            self._median_ms(lambda: func(page_ids, language), repeat) for page_ids in pages
+        )
+
+    def _run(self, ids, repeat):
+        pages = [ids[start:start + PAGE_SIZE] for start in range(0, min(len(ids), PAGE_SIZE * 10), PAGE_SIZE)]
+        for language in LANGUAGES:
+            assert self._serialized(pages[0], language) == self._rendered(pages[0], language)
+
+        self.stdout.write(f'Per {PAGE_SIZE}-article page (median ms):')
+        self.stdout.write(f'{"payload":<10}{"step":<16}{"serializers":>12}{"precomputed":>12}{"speedup":>9}')
+        for language in LANGUAGES:
+            rows = [
+                ('representation', *self._representation_ms(pages, language, repeat)),
+                ('whole page', self._page_ms(self._serialized, pages, language, repeat),
+                 self._page_ms(self._rendered, pages, language, repeat)),
+            ]
+            for step, before, after in rows:
+                self.stdout.write(
+                    f'{language or "en+fr":<10}{step:<16}{before:>12.2f}{after:>12.2f}{before / max(after, 0.001):>8.1f}x'
+                )
@@ -0,0 +1,82 @@
+"""
+Management command reporting what CompressionMiddleware saves on
+representative pages: feed pages of the API (with and without ?lang=), the
+bootstrap payload and the home page (the other HTML pages need a login),
+as sent to a client accepting nothing, gzip, or brotli.
+Run with: python manage.py benchmark_compression --article 42
+
+Pages are requested through the full middleware stack against the current
+database; nothing is written.
+"""
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from api.models import Article
+
+ENCODINGS = ('identity', 'gzip', 'br')
+
+
+class Command(BaseCommand):
+    help = 'Reports response sizes with and without gzip/brotli compression on feed pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--article', type=int, help='Article page to include (default: the newest)')
+        parser.add_argument('--repeat', type=int, default=5, help='Requests per page and encoding')
+
+    def handle(self, *args, **options):
+        article_id = options['article'] or Article.objects.order_by('-created_at').values_list('pk', flat=True).first()
+        pages = [
+            '/api/articles/?page_size=20',
+            '/api/articles/?page_size=20&lang=fr',
+            '/api/articles/?page_size=20&main_category=OPPORTUNITY',
+            '/api/articles/?cursor=&page_size=10',
+            '/api/bootstrap/',
+            '/api/categories/',
+            '/en/',
+            '/fr/',
+        ]
+        if article_id:
+            pages.append(f'/api/articles/{article_id}/')
+
+        client = Client(HTTP_HOST=self._host())
+        self.stdout.write('Bytes sent (median ms per request):')
+        self.stdout.write(
+            f'{"page":<56}' + ''.join(f'{encoding:>18}' for encoding in ENCODINGS) + f'{"saved":>8}'
+        )
+        totals = dict.fromkeys(ENCODINGS, 0)
+        for page in pages:
+            sizes, timings = {}, {}
+            for encoding in ENCODINGS:
+                runs = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    response = client.get(page, HTTP_ACCEPT_ENCODING=encoding)
+                    runs.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    break
+                sizes[encoding], timings[encoding] = len(response.content), statistics.median(runs)
+            else:
+                for encoding in ENCODINGS:
+                    totals[encoding] += sizes[encoding]
+                self.stdout.write(
+                    f'{page:<56}'
+                    + ''.join(f'{sizes[e]:>10,} {f"({timings[e]:.0f})":>7}' for e in ENCODINGS)
+                    + f'{1 - sizes["br"] / sizes["identity"]:>8.0%}'
+                )
+                continue
+            self.stdout.write(f'{page:<56}  skipped: HTTP {response.status_code}')
+
+        if totals['identity']:
+            self.stdout.write(
+                f'{"total":<56}' + ''.join(f'{totals[e]:>10,} {"":>7}' for e in ENCODINGS)
+                + f'{1 - totals["br"] / totals["identity"]:>8.0%}'
+            )
+
+    def _host(self):
+        for host in settings.ALLOWED_HOSTS:
+            if host != '*':
+                return host.lstrip('.')
+        return 'localhost'
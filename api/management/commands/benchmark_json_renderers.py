@@ -0,0 +1,134 @@
+"""
+Management command comparing DRF's stdlib JSONRenderer/JSONParser with the
+orjson ones (api/renderers.py) on the two largest API payloads: article
+list pages and the /api/users/sync/ dump.
+Run with: python manage.py benchmark_json_renderers --users 5000
+
+Payloads are built once (articles inserted inside a transaction that is
+rolled back; the sync dump is synthetic, shaped like UserSyncView's) and
+only rendering to bytes and parsing them back are timed.
+"""
+import io
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from api.denormalize import category_values
+from api.models import Article, ArticleCategory
+from api.renderers import ORJSONParser, ORJSONRenderer
+from api.serializers import ArticleListSerializer
+
+PAGE_SIZES = (20, 100)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the stdlib and orjson JSON renderers/parsers on article pages and the user sync dump'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=5000, help='Users in the synthetic sync dump')
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per payload')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                payloads = [
+                    (f'articles x{size}', self._article_page(size)) for size in PAGE_SIZES
+                ] + [(f'users/sync x{options["users"]}', self._user_sync(options['users']))]
+                self._run(payloads, options['repeat'])
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write('Synthetic articles rolled back.')
+
+    def _article_page(self, size):
+        category = ArticleCategory.objects.create(
+            name_en='Benchmark', name_fr='Benchmark', slug=f'benchmark-json-{size}',
+            main_category='OPPORTUNITY', emoji='🎓',
+        )
+        Article.objects.bulk_create([
+            Article(
+                category=category,
+                **category_values(category),
+                headline_en=f'Scholarship programme {i} opens applications for 2025',
+                headline_fr=f'Le programme de bourses {i} ouvre les candidatures pour 2025',
+                english_summary='Applications are open to students across the country. ' * 12,
+                french_summary='Les candidatures sont ouvertes aux étudiants de tout le pays. ' * 12,
+                mood='hopeful',
+                source_urls=['https://example.com/a', 'https://example.com/b'],
+                source_names=['Example', 'Other'],
+                thumbnails=['https://example.com/thumb.jpg'],
+                timestamp='2025-01-01',
+            )
+            for i in range(size)
+        ])
+        request = Request(APIRequestFactory().get('/api/articles/'))
+        articles = Article.objects.select_related('category').filter(category=category)
+        return {
+            'count': size,
+            'next': 'http://testserver/api/articles/?page=2',
+            'previous': None,
+            'results': ArticleListSerializer(articles, many=True, context={'request': request}).data,
+        }
+
+    def _user_sync(self, count):
+        return {
+            'count': count,
+            'users': [
+                {
+                    'id': i,
+                    'email': f'student{i}@example.com',
+                    'profile': {
+                        'interests': ['scholarships', 'jobs', 'tech'],
+                        'education_level': 'university',
+                        'background': 'Étudiante en informatique à Douala',
+                        'region': 'Littoral',
+                        'quote_category': 'MOTIVATION',
+                        'receive_quotes': True,
+                        'custom_desires': 'Bourses de master en Europe',
+                        'notification_time': '08:00:00',
+                    },
+                    'subscription': {'is_pro': i % 7 == 0, 'gist_preferences': ''},
+                    'fcm': {
+                        'token': f'd{i}Xk:APA91bH' + 'q7Zr-Kx2Lm9_Tw4' * 9,
+                        'preferred_language': 'fr',
+                        'preferred_categories': ['scholarships', 'jobs'],
+                    },
+                }
+                for i in range(count)
+            ],
+        }
+
+    def _median_ms(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def _run(self, payloads, repeat):
+        self.stdout.write('Median ms per payload:')
+        self.stdout.write(f'{"payload":<22}{"KB":>7}{"step":>8}{"stdlib":>10}{"orjson":>10}{"speedup":>9}')
+        for name, data in payloads:
+            body = JSONRenderer().render(data)
+            assert ORJSONRenderer().render(data) == body
+            assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+            steps = [
+                ('render', lambda: JSONRenderer().render(data), lambda: ORJSONRenderer().render(data)),
+                ('parse', lambda: JSONParser().parse(io.BytesIO(body)),
+                 lambda: ORJSONParser().parse(io.BytesIO(body))),
+            ]
+            for step, stdlib, fast in steps:
+                before, after = self._median_ms(stdlib, repeat), self._median_ms(fast, repeat)
+                self.stdout.write(
+                    f'{name:<22}{len(body) / 1024:>7.0f}{step:>8}{before:>10.2f}{after:>10.2f}'
+                    f'{before / max(after, 0.001):>8.1f}x'
+                )
@@ -0,0 +1,117 @@
+"""
+Management command comparing article search latency: the icontains
+SearchFilter lookups used before api/search.py against the indexed backend.
+Run with: python manage.py benchmark_search --articles 100000
+
+Synthetic articles are inserted inside a transaction that is rolled back,
+so the database is left untouched (it is locked for writes meanwhile, so
+run it against a copy of production data).
+"""
+import random
+import statistics
+import time
+from functools import reduce
+from operator import or_
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from api.denormalize import category_values
+from api.models import Article, ArticleCategory
+from api.search import SEARCH_COLUMNS, get_search_backend, tokenize
+
+WORDS = (
+    'concours bourse bourses scholarship scholarships université university étudiants students '
+    'recrutement recruitment emploi job santé health économie economy éducation education '
+    'gouvernement government élection election ministère ministry développement development '
+    'stage internship formation training ENS école school médecine medicine ingénieur engineer '
+    'Cameroun Cameroon Yaoundé Douala Afrique Africa marché market sécurité security région region '
+    'annonce announcement résultats results inscription registration candidats candidates date deadline'
+).split()
+
+QUERIES = ['concours', 'bourses', 'scholarship', 'ENS', 'etudiants', 'recrutement ministere', 'universit', 'zzzz']
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks icontains search against the full-text search backend on synthetic articles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--articles', type=int, default=100000, help='Synthetic articles to insert')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per query')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if backend is None or backend.vendor != connection.vendor:
+            raise CommandError(f'No indexed search backend for the {connection.vendor} database')
+        
+        try:
+            with transaction.atomic():
+                self._insert_articles(options['articles'], random.Random(options['seed']))
+                self._run(backend, options['repeat'])
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write('Synthetic articles rolled back.')
+
+    def _sentence(self, rng, length):
+        # Mostly filler vocabulary (Zipf-like), with the topical words sprinkled in
+        return ' '.join(
+            rng.choice(WORDS) if rng.random() < 0.02 else self.filler[min(int(rng.paretovariate(1.0)) - 1, len(self.filler) - 1)]
+            for _ in range(length)
+        )
+
+    def _insert_articles(self, count, rng):
+        letters = 'abcdefghijklmnopqrstuvwxyzéè'
+        self.filler = [''.join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(20000)]
+        category = ArticleCategory.objects.create(
+            name_en='Benchmark', name_fr='Benchmark', slug='benchmark-search', main_category='ACTUALITY'
+        )
+        copies = category_values(category)
+        self.stdout.write(f'Inserting {count} synthetic articles...')
+        started = time.perf_counter()
+        batch = []
+        for _ in range(count):
+            batch.append(Article(
+                category=category,
+                **copies,
+                headline_en=self._sentence(rng, 10),
+                headline_fr=self._sentence(rng, 10),
+                english_summary=self._sentence(rng, 60),
+                french_summary=self._sentence(rng, 60),
+            ))
+            if len(batch) == 1000:
+                Article.objects.bulk_create(batch)
+                batch = []
+        Article.objects.bulk_create(batch)
+        self.stdout.write(f'  done in {time.perf_counter() - started:.1f}s')
+
+    def _icontains(self, queryset, terms):
+        for term in terms:
+            queryset = queryset.filter(reduce(or_, (Q(**{f'{column}__icontains': term}) for column in SEARCH_COLUMNS)))
+        return queryset.order_by('-created_at')
+
+    def _time(self, queryset, repeat):
+        """Median ms for what a search page costs: the count plus the first 20 ids"""
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            total = queryset.count()
+            list(queryset.values_list('id', flat=True)[:20])
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), total
+
+    def _run(self, backend, repeat):
+        articles = Article.objects.all()
+        self.stdout.write(f'{"query":<24}{"matches":>9}{"icontains ms":>14}{"indexed ms":>12}{"speedup":>9}')
+        for query in QUERIES:
+            terms = tokenize(query)
+            legacy_ms, total = self._time(self._icontains(articles, terms), repeat)
+            indexed_ms, indexed_total = self._time(backend.search(articles, terms), repeat)
+            self.stdout.write(
+                f'{query:<24}{indexed_total:>9}{legacy_ms:>14.1f}{indexed_ms:>12.1f}'
+                f'{legacy_ms / max(indexed_ms, 0.001):>8.1f}x'
+            )
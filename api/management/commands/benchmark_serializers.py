@@ -0,0 +1,127 @@
+"""
+Management command comparing DRF's field-by-field to_representation with
+the compiled fast path (FastRepresentationMixin) on the hot read serializers.
+Run with: python manage.py benchmark_serializers --repeat 10
+
+Rows are loaded once and only the representation step is timed, for pages
+of 20, 100 and 1000 rows. Synthetic rows are inserted inside a transaction
+that is rolled back, so the database is left untouched.
+"""
+import datetime
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from api.denormalize import category_values
+from api.models import Article, ArticleCategory, DailyQuote, UserNotification
+from api.serializers import (
+    ArticleListSerializer, ArticleSerializer, DailyQuoteSerializer, UserNotificationSerializer,
+)
+
+PAGE_SIZES = (20, 100, 1000)
+ROWS = max(PAGE_SIZES)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks DRF serialization against the compiled to_representation fast path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=10, help='Runs per page size')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._insert_rows()
+                self._run(options['repeat'])
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write('Synthetic rows rolled back.')
+
+    def _insert_rows(self):
+        self.stdout.write(f'Inserting {ROWS} synthetic rows per model...')
+        category = ArticleCategory.objects.create(
+            name_en='Benchmark', name_fr='Benchmark', slug='benchmark-serializers',
+            main_category='OPPORTUNITY', emoji='🎓',
+        )
+        Article.objects.bulk_create([
+            Article(
+                category=category,
+                **category_values(category),
+                headline_en=f'Scholarship programme {i} opens applications for 2025',
+                headline_fr=f'Le programme de bourses {i} ouvre les candidatures pour 2025',
+                english_summary='Applications are open to students across the country. ' * 12,
+                french_summary='Les candidatures sont ouvertes aux étudiants de tout le pays. ' * 12,
+                mood='hopeful',
+                source_urls=['https://example.com/a', 'https://example.com/b'],
+                source_names=['Example', 'Other'],
+                thumbnails=['https://example.com/thumb.jpg'],
+                timestamp='2025-01-01',
+                deadline=datetime.date(2025, 3, 1),
+            )
+            for i in range(ROWS)
+        ], batch_size=500)
+        DailyQuote.objects.bulk_create([
+            DailyQuote(
+                category='MOTIVATION', date=datetime.date(2000, 1, 1) + datetime.timedelta(days=i),
+                quote_text_en='Keep going.', quote_text_fr='Continuez.', author='Unknown',
+                explanation_en='Persistence pays. ' * 5, explanation_fr='La persévérance paie. ' * 5,
+                affirmations_en=['I can do it'], affirmations_fr=['Je peux le faire'],
+            )
+            for i in range(ROWS)
+        ], batch_size=500)
+        self.category = category
+
+    def _cases(self):
+        articles = list(
+            Article.objects.select_related('category').prefetch_related('comments').filter(category=self.category)
+        )
+        quotes = list(DailyQuote.objects.filter(category='MOTIVATION').order_by('date'))
+        # Built in memory: creating a user would notify the admins
+        notifications = [
+            UserNotification(
+                pk=i + 1, user_id=1, title_en=f'New scholarship {i}', title_fr=f'Nouvelle bourse {i}',
+                message_en='Applications are open.', message_fr='Les candidatures sont ouvertes.',
+                article=articles[i] if i % 2 else None, created_at=articles[i].created_at,
+            )
+            for i in range(ROWS)
+        ]
+        return [
+            ('ArticleList', ArticleListSerializer, articles),
+            ('Article', ArticleSerializer, articles),
+            ('DailyQuote', DailyQuoteSerializer, quotes),
+            ('UserNotification', UserNotificationSerializer, notifications),
+        ]
+
+    def _rows_per_sec(self, represent, rows, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for row in rows:
+                represent(row)
+            timings.append(time.perf_counter() - started)
+        return len(rows) / max(statistics.median(timings), 1e-9)
+
+    def _run(self, repeat):
+        request = Request(APIRequestFactory().get('/api/'))
+        self.stdout.write('Representation step (median rows/sec):')
+        self.stdout.write(f'{"serializer":<18}{"rows":>6}{"drf":>12}{"fast path":>12}{"speedup":>9}')
+        for name, serializer_class, instances in self._cases():
+            serializer = serializer_class(context={'request': request})
+            for instance in instances[:20]:
+                assert serializer.to_representation(instance) == \
+                    serializers.Serializer.to_representation(serializer, instance)
+            for size in PAGE_SIZES:
+                rows = instances[:size]
+                drf = self._rows_per_sec(
+                    lambda row: serializers.Serializer.to_representation(serializer, row), rows, repeat
+                )
+                fast = self._rows_per_sec(serializer.to_representation, rows, repeat)
+                self.stdout.write(f'{name:<18}{size:>6}{drf:>12,.0f}{fast:>12,.0f}{fast / drf:>8.1f}x')
@@ -0,0 +1,34 @@
+"""
+Management command to (re)build the precomputed article JSON.
+Run with: python manage.py build_rendered_articles
+
+Renderings are normally rebuilt by background tasks after each change (see
+api/rendering.py). Run this once after deploying them, and after changes
+that bypass model signals or change the serializers.
+"""
+from django.core.management.base import BaseCommand
+from api.models import Article
+from api.rendering import build, stale_article_ids
+
+
+class Command(BaseCommand):
+    help = 'Renders the card and detail JSON of articles in every language'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stale',
+            action='store_true',
+            help='Only articles without an up-to-date rendering',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=200,
+            help='Number of articles rendered per batch',
+        )
+
+    def handle(self, *args, **options):
+        article_ids = stale_article_ids() if options['stale'] else Article.objects.values_list('pk', flat=True)
+        self.stdout.write('Rendering articles...')
+        built = build(article_ids.order_by('pk'), chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'Done! Rendered {built} articles.'))
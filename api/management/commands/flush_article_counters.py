@@ -0,0 +1,41 @@
+"""
+Management command to apply buffered article view/reaction counts.
+Run with: python manage.py flush_article_counters
+
+Flushes normally run as django-q tasks (see api/counters.py); this covers
+deployments without a running cluster, see DEPLOY.md. --loop keeps flushing
+every few seconds until interrupted.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from api import counters
+
+
+class Command(BaseCommand):
+    help = 'Applies buffered article view and reaction increments to the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            type=int,
+            default=0,
+            metavar='SECONDS',
+            help='Keep flushing at this interval instead of flushing once',
+        )
+
+    def handle(self, *args, **options):
+        if not options['loop']:
+            updated = counters.flush()
+            self.stdout.write(self.style.SUCCESS(f'Done! Updated {updated} articles.'))
+            return
+
+        self.stdout.write(f'Flushing every {options["loop"]}s, press Ctrl+C to stop')
+        try:
+            while True:
+                updated = counters.flush()
+                if updated:
+                    self.stdout.write(f'  updated {updated} articles')
+                time.sleep(options['loop'])
+        except KeyboardInterrupt:
+            counters.flush()
@@ -0,0 +1,30 @@
+"""
+Management command to refresh the cached results of the most popular searches.
+Run with: python manage.py precompute_search_results --top 50
+
+Meant to run on a schedule (e.g. hourly), see DEPLOY.md.
+"""
+from django.core.management.base import BaseCommand
+from api.search import precompute_popular_searches
+
+
+class Command(BaseCommand):
+    help = 'Recomputes stale cached results for the most searched article queries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=50,
+            help='Number of most searched queries to keep warm',
+        )
+        parser.add_argument(
+            '--prune-days',
+            type=int,
+            default=30,
+            help='Forget queries searched only once and not for this many days (0 keeps them)',
+        )
+
+    def handle(self, *args, **options):
+        refreshed, pruned = precompute_popular_searches(top=options['top'], prune_days=options['prune_days'])
+        self.stdout.write(self.style.SUCCESS(f'Done! Refreshed {refreshed} queries, pruned {pruned}.'))
@@ -0,0 +1,27 @@
+"""
+Management command to rebuild the persisted interleaved feed order.
+Run with: python manage.py rebuild_feed_order
+
+Needed only after bulk changes that bypass model signals
+(e.g. queryset.update(category=...) or raw SQL imports).
+"""
+from django.core.management.base import BaseCommand
+from api.feed import rebuild_feed_order
+
+
+class Command(BaseCommand):
+    help = 'Recomputes Article.feed_rank and the per-category feed buckets'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of articles per bulk update',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding feed order...')
+        total = rebuild_feed_order(chunk_size=options['chunk_size'], stdout=self.stdout)
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'Done! Ranked {total} articles.'))
@@ -0,0 +1,27 @@
+"""
+Management command to rebuild the article and archive full-text search indexes.
+Run with: python manage.py rebuild_search_index
+
+The index is normally kept in sync by database triggers (see api/search.py);
+this is only needed after restoring a database dump or changing backends.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from api.search import SOURCES, get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Creates any missing full-text index objects and repopulates the article and archive search indexes'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if backend is None or backend.vendor != connection.vendor:
+            raise CommandError(f'No indexed search backend for the {connection.vendor} database')
+        
+        for source in SOURCES:
+            backend = get_search_backend(source)
+            self.stdout.write(f'Rebuilding {source} search index ({backend.__class__.__name__})...')
+            with transaction.atomic(), connection.cursor() as cursor:
+                backend.install(cursor)
+                backend.rebuild(cursor)
+        self.stdout.write(self.style.SUCCESS('Done!'))
@@ -0,0 +1,27 @@
+"""
+Management command to rebuild the search-as-you-type prefix index.
+Run with: python manage.py rebuild_search_suggestions
+
+Needed only after bulk changes that bypass model signals
+(e.g. queryset.update(headline_en=...) or raw SQL imports).
+"""
+from django.core.management.base import BaseCommand
+from api.suggest import rebuild_suggestions
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the SearchSuggestion index from article headlines and category names'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Number of articles read per batch',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding search suggestions...')
+        total = rebuild_suggestions(chunk_size=options['chunk_size'], stdout=self.stdout)
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'Done! Indexed {total} suggestions.'))
@@ -0,0 +1,26 @@
+"""
+Management command to repair Article.comment_count.
+Run with: python manage.py recompute_comment_counts
+
+Needed only after changes that bypass the Comment signals
+(e.g. Comment.objects.bulk_create or raw SQL imports).
+"""
+from django.core.management.base import BaseCommand
+from api.counters import recompute_comment_counts
+
+
+class Command(BaseCommand):
+    help = 'Recomputes Article.comment_count from the comments'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Number of articles per bulk update',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Recomputing comment counts...')
+        corrected = recompute_comment_counts(chunk_size=options['chunk_size'], stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(f'Done! Corrected {corrected} articles.'))
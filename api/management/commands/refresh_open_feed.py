@@ -0,0 +1,28 @@
+"""
+Management command to re-rank the open feed (?open=true), which leaves out
+articles whose deadline has passed.
+Run with: python manage.py refresh_open_feed
+
+Deadlines pass at midnight without any save, so run it nightly, just after
+midnight (see DEPLOY.md).
+"""
+from django.core.management.base import BaseCommand
+from api.feed import refresh_open_feed
+
+
+class Command(BaseCommand):
+    help = 'Recomputes Article.open_feed_rank and the open feed fields of the feed buckets'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of articles per bulk update',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Refreshing open feed...')
+        updated = refresh_open_feed(chunk_size=options['chunk_size'], stdout=self.stdout)
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'Done! Re-ranked {updated} articles.'))
@@ -0,0 +1,27 @@
+"""
+Management command to re-copy every article's category attributes
+(category_slug, names, main_category, category_is_active; see api/denormalize.py).
+Run with: python manage.py sync_article_categories
+
+Needed only after writes that bypass Article.save() or the category
+signals (e.g. queryset.update(category=...), bulk_create or raw SQL imports).
+"""
+from django.core.management.base import BaseCommand
+from api.denormalize import sync_all
+
+
+class Command(BaseCommand):
+    help = "Copies each category's slug, names, main category and active flag onto its articles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of articles per bulk update',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Syncing article category copies...')
+        total = sync_all(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'Done! Updated {total} articles.'))
@@ -0,0 +1,70 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_feed_order(apps, schema_editor):
+    """Rank existing articles inside their category (0 = newest) and fill the buckets."""
+    Article = apps.get_model("api", "Article")
+    ArticleCategory = apps.get_model("api", "ArticleCategory")
+    FeedBucket = apps.get_model("api", "FeedBucket")
+
+    for category in ArticleCategory.objects.all():
+        rows = list(
+            Article.objects.filter(category=category)
+            .order_by("-created_at", "-id")
+            .values_list("id", "created_at")
+        )
+        if not rows:
+            continue
+        Article.objects.bulk_update(
+            [Article(id=article_id, feed_rank=rank) for rank, (article_id, _) in enumerate(rows)],
+            ["feed_rank"],
+            batch_size=1000,
+        )
+        FeedBucket.objects.create(
+            category=category,
+            size=len(rows),
+            head_article_id=rows[0][0],
+            head_created_at=rows[0][1],
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0019_change_audio_to_urlfield"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="feed_rank",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["category", "feed_rank"], name="api_article_feed_rank_idx"),
+        ),
+        migrations.CreateModel(
+            name="FeedBucket",
+            fields=[
+                (
+                    "category",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="feed_bucket",
+                        serialize=False,
+                        to="api.articlecategory",
+                    ),
+                ),
+                ("size", models.PositiveIntegerField(default=0)),
+                ("head_created_at", models.DateTimeField(blank=True, null=True)),
+                ("head_article_id", models.BigIntegerField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Feed Bucket",
+                "verbose_name_plural": "Feed Buckets",
+            },
+        ),
+        migrations.RunPython(build_feed_order, migrations.RunPython.noop),
+    ]
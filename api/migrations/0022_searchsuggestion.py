@@ -0,0 +1,109 @@
+import re
+import unicodedata
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Frozen copies of api.search.tokenize/fold and api.suggest.extract_terms as
+# they were when this migration was written, so later changes to those
+# modules cannot change what it does. `manage.py rebuild_search_suggestions`
+# recomputes the index with the current rules.
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+HEADLINE_LANGUAGES = {"headline_en": "en", "headline_fr": "fr"}
+STOPWORDS = {
+    "en": set(
+        "the and for with from that this your you are was were has have had not but all "
+        "its into out who what when how why new more than over after about".split()
+    ),
+    "fr": set(
+        "les des une pour par avec dans sur est sont pas que qui aux ses son leur leurs "
+        "plus mais ont ete nous vous ils elles cette ces comme".split()
+    ),
+}
+
+
+def tokenize(text):
+    return [term.lower() for term in TERM_RE.findall(text or "")]
+
+
+def fold(word):
+    decomposed = unicodedata.normalize("NFKD", word.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def headline_terms(row):
+    terms = {}
+    for field, language in HEADLINE_LANGUAGES.items():
+        for word in tokenize(row.get(field)):
+            key = fold(word)
+            if 3 <= len(key) <= 64 and not key.isdigit() and key not in STOPWORDS[language]:
+                terms.setdefault((language, key), word[:100])
+    return terms
+
+
+def build_suggestions(apps, schema_editor):
+    """Index the words of existing headlines and category names."""
+    Article = apps.get_model("api", "Article")
+    ArticleCategory = apps.get_model("api", "ArticleCategory")
+    SearchSuggestion = apps.get_model("api", "SearchSuggestion")
+
+    counts = {}
+    for row in Article.objects.values("headline_en", "headline_fr").iterator(chunk_size=2000):
+        for term, word in headline_terms(row).items():
+            counts.setdefault(term, [word, 0])[1] += 1
+
+    SearchSuggestion.objects.bulk_create(
+        [
+            SearchSuggestion(language=language, key=key, term=word, article_count=count)
+            for (language, key), (word, count) in counts.items()
+        ],
+        batch_size=2000,
+    )
+    SearchSuggestion.objects.bulk_create([
+        SearchSuggestion(language=language, key=key, term=name, category=category)
+        for category in ArticleCategory.objects.filter(is_active=True)
+        for language, name in (("en", category.name_en), ("fr", category.name_fr))
+        for key in {fold(word) for word in tokenize(name)}
+    ])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0021_article_cat_created_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchSuggestion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("language", models.CharField(choices=[("en", "English"), ("fr", "French")], max_length=2)),
+                ("key", models.CharField(help_text="Lower-case, accent-folded word", max_length=64)),
+                ("term", models.CharField(help_text="Word or category name as displayed", max_length=100)),
+                ("article_count", models.PositiveIntegerField(default=0)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_suggestions",
+                        to="api.articlecategory",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search Suggestion",
+                "verbose_name_plural": "Search Suggestions",
+                "indexes": [models.Index(fields=["language", "key"], name="api_suggestion_prefix_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("category__isnull", True)),
+                        fields=("language", "key"),
+                        name="api_suggestion_term_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_suggestions, migrations.RunPython.noop),
+    ]
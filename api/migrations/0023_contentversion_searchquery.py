@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0022_searchsuggestion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentVersion",
+            fields=[
+                ("name", models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Content Version",
+                "verbose_name_plural": "Content Versions",
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchQuery",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("query", models.CharField(max_length=200, unique=True)),
+                ("search_count", models.PositiveIntegerField(default=0)),
+                ("last_searched_at", models.DateTimeField(blank=True, null=True)),
+                ("result_ids", models.JSONField(blank=True, default=list)),
+                ("content_version", models.CharField(blank=True, max_length=100)),
+                ("computed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Search Query",
+                "verbose_name_plural": "Search Queries",
+                "indexes": [models.Index(fields=["-search_count"], name="api_searchquery_count_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0023_contentversion_searchquery"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="render_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.CreateModel(
+            name="RenderedArticle",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(choices=[("card", "Card"), ("detail", "Detail")], max_length=6)),
+                (
+                    "language",
+                    models.CharField(
+                        blank=True, choices=[("", "Bilingual"), ("en", "English"), ("fr", "French")], max_length=2
+                    ),
+                ),
+                ("version", models.PositiveIntegerField()),
+                ("data", models.JSONField()),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="renderings",
+                        to="api.article",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Rendered Article",
+                "verbose_name_plural": "Rendered Articles",
+                "constraints": [
+                    models.UniqueConstraint(fields=("article", "kind", "language"), name="api_renderedarticle_unique")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+from django.db import migrations, models
+
+
+def copy_category_fields(apps, schema_editor):
+    """Copy each category's attributes onto its existing articles."""
+    Article = apps.get_model("api", "Article")
+    ArticleCategory = apps.get_model("api", "ArticleCategory")
+
+    for category in ArticleCategory.objects.all():
+        Article.objects.filter(category=category).update(
+            category_slug=category.slug,
+            category_name_en=category.name_en,
+            category_name_fr=category.name_fr,
+            main_category=category.main_category,
+            category_is_active=category.is_active,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0024_article_render_version_renderedarticle"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="category_slug",
+            field=models.CharField(blank=True, editable=False, max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="category_name_en",
+            field=models.CharField(blank=True, editable=False, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="category_name_fr",
+            field=models.CharField(blank=True, editable=False, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="main_category",
+            field=models.CharField(blank=True, editable=False, max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="category_is_active",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(copy_category_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["category_is_active", "created_at"], name="api_article_active_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["main_category", "created_at"], name="api_article_main_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["category_slug", "created_at"], name="api_article_slug_created_idx"),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0026_comment_article_time_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="published_at",
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,79 @@
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def rank_open_articles(apps, schema_editor):
+    """Rank the articles whose deadline has not passed, as api.feed.refresh_open_feed does."""
+    Article = apps.get_model("api", "Article")
+    FeedBucket = apps.get_model("api", "FeedBucket")
+    today = timezone.localdate()
+
+    for bucket in FeedBucket.objects.all():
+        rows = list(
+            Article.objects.filter(models.Q(deadline__isnull=True) | models.Q(deadline__gte=today))
+            .filter(category_id=bucket.category_id)
+            .order_by("-created_at", "-id")
+            .values_list("id", "created_at")
+        )
+        Article.objects.bulk_update(
+            [Article(id=article_id, open_feed_rank=rank) for rank, (article_id, _) in enumerate(rows)],
+            ["open_feed_rank"],
+            batch_size=1000,
+        )
+        if rows:
+            bucket.open_size = len(rows)
+            bucket.open_head_article_id, bucket.open_head_created_at = rows[0]
+            bucket.save(update_fields=["open_size", "open_head_article_id", "open_head_created_at"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0027_article_published_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="article",
+            name="deadline",
+            field=models.DateField(
+                blank=True,
+                help_text="Application/submission deadline (for scholarships, jobs, concours)",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("deadline__isnull", False)), fields=["deadline"], name="api_article_deadline_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="open_feed_rank",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="feedbucket",
+            name="open_size",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="feedbucket",
+            name="open_head_created_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="feedbucket",
+            name="open_head_article_id",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(rank_open_articles, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("open_feed_rank__isnull", False)),
+                fields=["category", "open_feed_rank"],
+                name="api_article_open_rank_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0028_open_feed_deadline_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedArticle",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("headline_en", models.CharField(blank=True, max_length=300, null=True)),
+                ("headline_fr", models.CharField(blank=True, max_length=300, null=True)),
+                ("headline", models.CharField(blank=True, max_length=300, null=True)),
+                ("category_slug", models.CharField(blank=True, max_length=50, null=True)),
+                ("category_name_en", models.CharField(blank=True, max_length=100, null=True)),
+                ("category_name_fr", models.CharField(blank=True, max_length=100, null=True)),
+                ("main_category", models.CharField(blank=True, max_length=20, null=True)),
+                ("category_is_active", models.BooleanField(default=False)),
+                ("category_legacy", models.CharField(blank=True, max_length=100, null=True)),
+                ("french_summary", models.TextField()),
+                ("english_summary", models.TextField()),
+                ("mood", models.CharField(max_length=100)),
+                ("source_urls", models.JSONField(blank=True, default=list)),
+                ("source_names", models.JSONField(blank=True, default=list)),
+                ("thumbnails", models.JSONField(blank=True, default=list)),
+                ("thumbnail_image", models.ImageField(blank=True, null=True, upload_to="thumbnails/")),
+                ("french_audio", models.URLField(blank=True, max_length=500, null=True)),
+                ("english_audio", models.URLField(blank=True, max_length=500, null=True)),
+                ("timestamp", models.CharField(max_length=100)),
+                ("published_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField()),
+                ("view_count", models.PositiveIntegerField(default=0)),
+                ("comment_count", models.PositiveIntegerField(default=0)),
+                ("reaction_count", models.PositiveIntegerField(default=0)),
+                ("send_notification", models.BooleanField(default=False)),
+                ("deadline", models.DateField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="archived_articles",
+                        to="api.articlecategory",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Article",
+                "verbose_name_plural": "Archived Articles",
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedComment",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("commenter_name", models.CharField(max_length=50)),
+                ("comment_text", models.TextField()),
+                ("timestamp", models.DateTimeField()),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="comments",
+                        to="api.archivedarticle",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Comment",
+                "verbose_name_plural": "Archived Comments",
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def flip_ranks(apps, schema_editor):
+    """Count ranks from the other end (newest-first <-> oldest-first), the head at the highest rank."""
+    Article = apps.get_model("api", "Article")
+    FeedBucket = apps.get_model("api", "FeedBucket")
+
+    for bucket in FeedBucket.objects.all():
+        for rank, head_rank in (("feed_rank", "head_rank"), ("open_feed_rank", "open_head_rank")):
+            ranked = Article.objects.filter(category_id=bucket.category_id, **{f"{rank}__isnull": False})
+            top = ranked.aggregate(top=Max(rank))["top"] or 0
+            ranked.update(**{rank: top - F(rank)})
+            setattr(bucket, head_rank, top)
+        bucket.save(update_fields=["head_rank", "open_head_rank"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0029_archivedarticle_archivedcomment"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feedbucket",
+            name="head_rank",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="feedbucket",
+            name="open_head_rank",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(flip_ranks, flip_ranks),
+    ]
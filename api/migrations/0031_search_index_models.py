@@ -0,0 +1,94 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0030_feed_ranks_from_oldest"),
+    ]
+
+    # Unmanaged: the tables are created by api.search.install_search_index
+    operations = [
+        migrations.CreateModel(
+            name="ArticleFTS",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="fts",
+                        serialize=False,
+                        to="api.article",
+                    ),
+                ),
+                ("document", models.TextField(db_column="api_article_fts")),
+            ],
+            options={
+                "db_table": "api_article_fts",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedArticleFTS",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="fts",
+                        serialize=False,
+                        to="api.archivedarticle",
+                    ),
+                ),
+                ("document", models.TextField(db_column="api_archivedarticle_fts")),
+            ],
+            options={
+                "db_table": "api_archivedarticle_fts",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ArticleSearchDocument",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="api.article",
+                    ),
+                ),
+                ("document", models.TextField()),
+            ],
+            options={
+                "db_table": "api_article_search",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedArticleSearchDocument",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="api.archivedarticle",
+                    ),
+                ),
+                ("document", models.TextField()),
+            ],
+            options={
+                "db_table": "api_archivedarticle_search",
+                "managed": False,
+            },
+        ),
+    ]
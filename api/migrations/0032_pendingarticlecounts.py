@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0031_search_index_models"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingArticleCounts",
+            fields=[
+                ("article_id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("view_count", models.PositiveIntegerField(default=0)),
+                ("reaction_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Pending Article Counts",
+                "verbose_name_plural": "Pending Article Counts",
+            },
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0032_pendingarticlecounts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="archivedarticle",
+            index=models.Index(fields=["created_at", "id"], name="api_archived_created_idx"),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
-from django.db.models.signals import post_save, post_delete
+from django.db.models import F, Q
+from django.db.models.signals import post_save, post_delete, pre_save, pre_delete
 from django.dispatch import receiver
-import random
 
 
 class ArticleCategory(models.Model):
@@ -52,6 +52,13 @@ class Article(models.Model):
         related_name='articles',
         db_index=True
     )
+    # Copies of the category's attributes, so feed queries filter and list
+    # articles without joining their category (kept in sync by api/denormalize.py)
+    category_slug = models.CharField(max_length=50, null=True, blank=True, editable=False)
+    category_name_en = models.CharField(max_length=100, null=True, blank=True, editable=False)
+    category_name_fr = models.CharField(max_length=100, null=True, blank=True, editable=False)
+    main_category = models.CharField(max_length=20, null=True, blank=True, editable=False)
+    category_is_active = models.BooleanField(default=False, editable=False)
     # Legacy category field for migration (will be removed after migration)
     category_legacy = models.CharField(max_length=100, db_index=True, blank=True, null=True)
     
@@ -68,6 +75,8 @@ class Article(models.Model):
     french_audio = models.URLField(max_length=500, null=True, blank=True)
     english_audio = models.URLField(max_length=500, null=True, blank=True)
     timestamp = models.CharField(max_length=100)
+    # `timestamp` parsed, for date range filters and sorting (see api/utils/timestamps.py)
+    published_at = models.DateTimeField(null=True, blank=True, db_index=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     view_count = models.PositiveIntegerField(default=0, db_index=True)
     comment_count = models.PositiveIntegerField(default=0)
@@ -75,12 +84,39 @@ class Article(models.Model):
     send_notification = models.BooleanField(default=False)
     
     # Deadline for time-sensitive articles (scholarships, jobs, concours, etc.)
+    # (indexed where set, see Meta)
     deadline = models.DateField(
         null=True, 
         blank=True, 
-        db_index=True,
         help_text="Application/submission deadline (for scholarships, jobs, concours)"
     )
+    
+    # Position of the article inside its category bucket for the interleaved feed
+    # (counted from the oldest, the newest at the bucket's head_rank).
+    # Maintained by api.feed from the signals below.
+    feed_rank = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    # Same, among the articles whose deadline has not passed (None once it has)
+    open_feed_rank = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    # Bumped on every content change; precomputed JSON rendered at an older
+    # version is ignored (see RenderedArticle and api/rendering.py)
+    render_version = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['category', 'feed_rank'], name='api_article_feed_rank_idx'),
+            models.Index(
+                fields=['category', 'open_feed_rank'], condition=Q(open_feed_rank__isnull=False),
+                name='api_article_open_rank_idx',
+            ),
+            # Most articles have no deadline; the few that do are read by date
+            models.Index(
+                fields=['deadline'], condition=Q(deadline__isnull=False), name='api_article_deadline_idx'
+            ),
+            models.Index(fields=['category', 'created_at'], name='api_article_cat_created_idx'),
+            models.Index(fields=['category_is_active', 'created_at'], name='api_article_active_created_idx'),
+            models.Index(fields=['main_category', 'created_at'], name='api_article_main_created_idx'),
+            models.Index(fields=['category_slug', 'created_at'], name='api_article_slug_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         # Backward compatibility: populate headline_en/headline_fr from headline if missing
@@ -92,16 +128,22 @@ class Article(models.Model):
         if not self.headline and (self.headline_en or self.headline_fr):
             self.headline = self.headline_en or self.headline_fr
         
-        if not self.view_count:
-            self.view_count = random.randint(1000, 5000000)
+        # Refresh the category copies whenever the category may have changed
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'category', 'category_id'} & set(update_fields):
+            from api import denormalize
+            for name, value in denormalize.category_values(self.category).items():
+                setattr(self, name, value)
+            if update_fields is not None:
+                kwargs['update_fields'] = update_fields = {*update_fields, *denormalize.FIELDS}
+        
+        if update_fields is None or 'timestamp' in update_fields:
+            from django.utils import timezone
+            from api.utils import timestamps
+            self.published_at = timestamps.published_at(self.timestamp, self.created_at or timezone.now())
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'published_at'}
         
-        if not self.reaction_count:
-            upper_limit = min(100000, self.view_count)
-            if upper_limit < 100:
-                self.reaction_count = upper_limit
-            else:
-                self.reaction_count = random.randint(100, upper_limit)
-
         super().save(*args, **kwargs)
 
         # Post-save: if thumbnail_image exists, add to thumbnails list if not present
@@ -119,16 +161,316 @@ class Article(models.Model):
         return self.headline_en or self.headline_fr or self.headline or 'No headline'
 
 
+class FeedBucket(models.Model):
+    """
+    Per-category bookkeeping for the interleaved article feed.
+    Buckets are ordered by their newest (head) article, like the feed itself.
+    Rebuild with: python manage.py rebuild_feed_order
+    """
+    category = models.OneToOneField(
+        ArticleCategory,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='feed_bucket'
+    )
+    size = models.PositiveIntegerField(default=0)
+    head_created_at = models.DateTimeField(null=True, blank=True)
+    head_article_id = models.BigIntegerField(null=True, blank=True)
+    # feed_rank of the head article; the article N places below it has head_rank - N
+    head_rank = models.PositiveIntegerField(default=0)
+    # The same for the open feed (articles whose deadline has not passed)
+    open_size = models.PositiveIntegerField(default=0)
+    open_head_created_at = models.DateTimeField(null=True, blank=True)
+    open_head_article_id = models.BigIntegerField(null=True, blank=True)
+    open_head_rank = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = 'Feed Bucket'
+        verbose_name_plural = 'Feed Buckets'
+    
+    def __str__(self):
+        return f"Bucket {self.category_id}: {self.size} articles"
+
+
+class SearchSuggestion(models.Model):
+    """
+    Prefix index behind /api/search/suggest/: words of article headlines
+    (with the number of articles using them) and words of category names.
+    Kept in sync incrementally by the signals below (see api/suggest.py).
+    Rebuild with: python manage.py rebuild_search_suggestions
+    """
+    LANGUAGE_CHOICES = [
+        ('en', 'English'),
+        ('fr', 'French'),
+    ]
+    
+    language = models.CharField(max_length=2, choices=LANGUAGE_CHOICES)
+    key = models.CharField(max_length=64, help_text="Lower-case, accent-folded word")
+    term = models.CharField(max_length=100, help_text="Word or category name as displayed")
+    article_count = models.PositiveIntegerField(default=0)
+    # Set for category name entries, empty for headline words
+    category = models.ForeignKey(
+        ArticleCategory,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='search_suggestions'
+    )
+    
+    class Meta:
+        verbose_name = 'Search Suggestion'
+        verbose_name_plural = 'Search Suggestions'
+        indexes = [
+            models.Index(fields=['language', 'key'], name='api_suggestion_prefix_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['language', 'key'],
+                condition=models.Q(category__isnull=True),
+                name='api_suggestion_term_unique',
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.term} ({self.language}, {self.article_count})"
+
+
+class ContentVersion(models.Model):
+    """
+    Change counter per kind of content (e.g. 'article'), bumped from model
+    signals. Caches built from that content record the version they were
+    built at and are stale once it moves (see api/versions.py).
+    """
+    name = models.CharField(max_length=50, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Content Version'
+        verbose_name_plural = 'Content Versions'
+    
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+
+class PendingArticleCounts(models.Model):
+    """
+    View/reaction increments of an article not applied to it yet (see
+    api/counters.py). Keyed by the bare article id, so buffering needs no
+    foreign key check and rows of deleted articles are simply dropped.
+    """
+    article_id = models.BigIntegerField(primary_key=True)
+    view_count = models.PositiveIntegerField(default=0)
+    reaction_count = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = 'Pending Article Counts'
+        verbose_name_plural = 'Pending Article Counts'
+    
+    def __str__(self):
+        return f"Article {self.article_id} +{self.view_count} views +{self.reaction_count} reactions"
+
+
+class SearchQuery(models.Model):
+    """
+    Normalized article search query: how often it is searched, and its ranked
+    result IDs as of `content_version` (see api/search.py).
+    """
+    query = models.CharField(max_length=200, unique=True)
+    search_count = models.PositiveIntegerField(default=0)
+    last_searched_at = models.DateTimeField(null=True, blank=True)
+    result_ids = models.JSONField(default=list, blank=True)
+    content_version = models.CharField(max_length=100, blank=True)
+    computed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        verbose_name = 'Search Query'
+        verbose_name_plural = 'Search Queries'
+        indexes = [
+            models.Index(fields=['-search_count'], name='api_searchquery_count_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.query} ({self.search_count})"
+
+
+class RenderedArticle(models.Model):
+    """
+    Precomputed API JSON of an article: its card (list) or detail
+    representation in one language ('' for the bilingual payload), as of the
+    article's render_version. Built by a background task after each change.
+    Rebuild with: python manage.py build_rendered_articles
+    """
+    CARD = 'card'
+    DETAIL = 'detail'
+    KIND_CHOICES = [
+        (CARD, 'Card'),
+        (DETAIL, 'Detail'),
+    ]
+    LANGUAGE_CHOICES = [
+        ('', 'Bilingual'),
+        ('en', 'English'),
+        ('fr', 'French'),
+    ]
+    
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='renderings')
+    kind = models.CharField(max_length=6, choices=KIND_CHOICES)
+    language = models.CharField(max_length=2, choices=LANGUAGE_CHOICES, blank=True)
+    version = models.PositiveIntegerField()
+    data = models.JSONField()
+    
+    class Meta:
+        verbose_name = 'Rendered Article'
+        verbose_name_plural = 'Rendered Articles'
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'kind', 'language'], name='api_renderedarticle_unique'),
+        ]
+    
+    def __str__(self):
+        return f"Article {self.article_id} {self.kind} [{self.language or 'en+fr'}] v{self.version}"
+
+
 class Comment(models.Model):
     article = models.ForeignKey(Article, related_name='comments', on_delete=models.CASCADE)
     commenter_name = models.CharField(max_length=50)
     comment_text = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # An article's comments, newest first
+            models.Index(fields=['article', 'timestamp'], name='api_comment_article_time_idx'),
+        ]
+
     def __str__(self):
         headline = self.article.headline_en or self.article.headline_fr or self.article.headline or 'No headline'
         return f"{self.commenter_name} on {headline[:30]}"
 
+
+class ArchivedArticle(models.Model):
+    """
+    Article moved out of the hot api_article table once older than
+    settings.ARTICLE_ARCHIVE_AFTER_DAYS, with its ID and fields. The detail
+    and search endpoints fall back to it; lists don't (see api/archive.py).
+    Archive with: python manage.py archive_articles
+    """
+    id = models.BigIntegerField(primary_key=True)
+    headline_en = models.CharField(max_length=300, null=True, blank=True)
+    headline_fr = models.CharField(max_length=300, null=True, blank=True)
+    headline = models.CharField(max_length=300, null=True, blank=True)
+    category = models.ForeignKey(
+        ArticleCategory,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='archived_articles'
+    )
+    # Kept in sync with the category like Article's (see api/denormalize.py)
+    category_slug = models.CharField(max_length=50, null=True, blank=True)
+    category_name_en = models.CharField(max_length=100, null=True, blank=True)
+    category_name_fr = models.CharField(max_length=100, null=True, blank=True)
+    main_category = models.CharField(max_length=20, null=True, blank=True)
+    category_is_active = models.BooleanField(default=False)
+    category_legacy = models.CharField(max_length=100, blank=True, null=True)
+    french_summary = models.TextField()
+    english_summary = models.TextField()
+    mood = models.CharField(max_length=100)
+    source_urls = models.JSONField(default=list, blank=True)
+    source_names = models.JSONField(default=list, blank=True)
+    thumbnails = models.JSONField(default=list, blank=True)
+    thumbnail_image = models.ImageField(upload_to='thumbnails/', null=True, blank=True)
+    french_audio = models.URLField(max_length=500, null=True, blank=True)
+    english_audio = models.URLField(max_length=500, null=True, blank=True)
+    timestamp = models.CharField(max_length=100)
+    published_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    view_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    reaction_count = models.PositiveIntegerField(default=0)
+    send_notification = models.BooleanField(default=False)
+    deadline = models.DateField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    # Never rendered in advance: served by the serializers (see api/rendering.py)
+    render_version = None
+    
+    class Meta:
+        verbose_name = 'Archived Article'
+        verbose_name_plural = 'Archived Articles'
+        indexes = [
+            # Archived matches are listed newest first, like the feed
+            models.Index(fields=['created_at', 'id'], name='api_archived_created_idx'),
+        ]
+    
+    def __str__(self):
+        return self.headline_en or self.headline_fr or self.headline or 'No headline'
+
+
+class ArchivedComment(models.Model):
+    """Comment of an archived article, moved with it (same ID and fields as Comment)"""
+    id = models.BigIntegerField(primary_key=True)
+    article = models.ForeignKey(ArchivedArticle, related_name='comments', on_delete=models.CASCADE)
+    commenter_name = models.CharField(max_length=50)
+    comment_text = models.TextField()
+    timestamp = models.DateTimeField()
+    
+    class Meta:
+        verbose_name = 'Archived Comment'
+        verbose_name_plural = 'Archived Comments'
+    
+    def __str__(self):
+        return f"{self.commenter_name} on archived article {self.article_id}"
+
+
+# Full-text index tables of api/search.py, created by its backends after
+# `migrate` (not by migrations). Searches join them to rank their matches.
+class ArticleFTS(models.Model):
+    """Row of the SQLite FTS5 index of articles; `document` is the table's MATCH column"""
+    article = models.OneToOneField(
+        Article, primary_key=True, db_column='rowid', related_name='fts', on_delete=models.DO_NOTHING
+    )
+    document = models.TextField(db_column='api_article_fts')
+    
+    class Meta:
+        managed = False
+        db_table = 'api_article_fts'
+
+
+class ArchivedArticleFTS(models.Model):
+    """Row of the SQLite FTS5 index of archived articles"""
+    article = models.OneToOneField(
+        ArchivedArticle, primary_key=True, db_column='rowid', related_name='fts', on_delete=models.DO_NOTHING
+    )
+    document = models.TextField(db_column='api_archivedarticle_fts')
+    
+    class Meta:
+        managed = False
+        db_table = 'api_archivedarticle_fts'
+
+
+class ArticleSearchDocument(models.Model):
+    """Weighted tsvector of an article (PostgreSQL)"""
+    article = models.OneToOneField(
+        Article, primary_key=True, related_name='search_document', on_delete=models.DO_NOTHING
+    )
+    document = models.TextField()
+    
+    class Meta:
+        managed = False
+        db_table = 'api_article_search'
+
+
+class ArchivedArticleSearchDocument(models.Model):
+    """Weighted tsvector of an archived article (PostgreSQL)"""
+    article = models.OneToOneField(
+        ArchivedArticle, primary_key=True, related_name='search_document', on_delete=models.DO_NOTHING
+    )
+    document = models.TextField()
+    
+    class Meta:
+        managed = False
+        db_table = 'api_archivedarticle_search'
+
 class VisitorSubscription(models.Model):
     session_key = models.CharField(max_length=40, unique=True)
     endpoint = models.URLField(max_length=500)
@@ -194,41 +536,292 @@ class FCMSubscription(models.Model):
         return f"FCM Token {self.token[:20]}... ({self.preferred_language})"
 
 
-# Signals to automatically update comment_count
+# Signals to automatically update comment_count, with atomic UPDATEs so
+# concurrent comments aren't lost (`manage.py recompute_comment_counts` repairs drift)
+def _comment_count_changed(article_id):
+    # update() sends no Article signals
+    from api import feed, versions
+    versions.bump(versions.ARTICLE_STATS)
+    feed.evict_cached_pages(article_id, counters=True)
+
+
 @receiver(post_save, sender=Comment)
 def increment_comment_count(sender, instance, created, **kwargs):
     """Increment article comment_count when a new comment is created"""
     if created:
-        instance.article.comment_count += 1
-        instance.article.save(update_fields=['comment_count'])
+        Article.objects.filter(pk=instance.article_id).update(comment_count=F('comment_count') + 1)
+        _comment_count_changed(instance.article_id)
 
 
 @receiver(post_delete, sender=Comment)
 def decrement_comment_count(sender, instance, **kwargs):
     """Decrement article comment_count when a comment is deleted"""
-    instance.article.comment_count = max(0, instance.article.comment_count - 1)
-    instance.article.save(update_fields=['comment_count'])
+    if Article.objects.filter(pk=instance.article_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    ):
+        _comment_count_changed(instance.article_id)
+
+
+# Signals to keep the interleaved feed order in sync
+_FEED_POSITION = ('category_id', 'feed_rank', 'open_feed_rank')
+
+
+def _touches_feed(update_fields):
+    return update_fields is None or bool({'category', 'category_id', 'deadline'} & set(update_fields))
+
+
+# The pre_save receivers below compare with the stored row, read once per save
+@receiver(pre_save, sender=Article)
+def forget_previous_row(sender, instance, **kwargs):
+    instance._previous_row = None
+
+
+def _previous_row(instance):
+    """{field: value} of the stored row of an article being saved, or None if it has none"""
+    if instance._previous_row is None:
+        fields = {*_FEED_POSITION, *_HEADLINE_FIELDS, *_ARTICLE_STATS_FIELDS, 'render_version', 'send_notification'}
+        instance._previous_row = Article.objects.filter(pk=instance.pk).values(*fields).first() or False
+    return instance._previous_row or None
+
+
+@receiver(pre_save, sender=Article)
+def capture_feed_position(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored category/ranks so post_save can detect recategorization"""
+    instance._feed_previous = None
+    if instance.pk is None or not _touches_feed(update_fields):
+        return
+    row = _previous_row(instance)
+    if row is not None:
+        previous = tuple(row[field] for field in _FEED_POSITION)
+        instance._feed_previous = previous
+        # Never write back stale in-memory ranks
+        instance.feed_rank, instance.open_feed_rank = previous[1:]
+
+
+@receiver(post_save, sender=Article)
+def update_feed_order(sender, instance, created, update_fields=None, **kwargs):
+    """Insert new articles into the feed order, move recategorized ones and
+    add or drop the ones whose deadline moved across today"""
+    from api import feed
+    
+    previous = getattr(instance, '_feed_previous', None)
+    instance._feed_previous = None
+    
+    if created:
+        feed.insert_article(instance)
+        return
+    
+    if previous is None:
+        return
+    
+    old_category_id, old_rank, old_open_rank = previous
+    if old_category_id == instance.category_id and (old_rank is not None or old_category_id is None):
+        if old_category_id is not None and (old_open_rank is not None) != feed.is_open(instance):
+            feed.update_openness(instance, old_open_rank)
+        return
+    
+    feed.remove_article(old_category_id, old_rank, old_open_rank, exclude_pk=instance.pk)
+    feed.insert_article(instance)
+
+
+@receiver(pre_delete, sender=Article)
+def capture_feed_position_on_delete(sender, instance, **kwargs):
+    """Read the current ranks from the DB; the in-memory ones may be stale"""
+    instance._feed_previous = Article.objects.filter(pk=instance.pk).values_list(*_FEED_POSITION).first()
+
+
+@receiver(post_delete, sender=Article)
+def remove_from_feed_order(sender, instance, **kwargs):
+    """Close the gaps left by a deleted article in its category bucket"""
+    from api import feed
+    
+    previous = getattr(instance, '_feed_previous', None)
+    if previous is not None:
+        feed.remove_article(*previous)
+
+
+# Signals to keep the search suggestion index in sync
+_HEADLINE_FIELDS = ('headline_en', 'headline_fr')
+
+
+@receiver(pre_save, sender=Article)
+def capture_headlines(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored headlines so post_save can update only the changed words"""
+    instance._headlines_previous = None
+    if instance.pk is None:
+        return
+    if update_fields is not None and not set(_HEADLINE_FIELDS) & set(update_fields):
+        instance._headlines_previous = False
+        return
+    row = _previous_row(instance)
+    instance._headlines_previous = row and {field: row[field] for field in _HEADLINE_FIELDS}
+
+
+@receiver(post_save, sender=Article)
+def update_headline_suggestions(sender, instance, created, **kwargs):
+    from api import suggest
+    
+    previous = getattr(instance, '_headlines_previous', None)
+    instance._headlines_previous = None
+    if previous is False:
+        return
+    suggest.update_article_terms(previous, {name: getattr(instance, name) for name in _HEADLINE_FIELDS})
+
+
+@receiver(pre_delete, sender=Article)
+def capture_headlines_on_delete(sender, instance, **kwargs):
+    instance._headlines_previous = Article.objects.filter(pk=instance.pk).values(*_HEADLINE_FIELDS).first()
+
+
+@receiver(post_delete, sender=Article)
+def remove_headline_suggestions(sender, instance, **kwargs):
+    from api import suggest
+    
+    previous = getattr(instance, '_headlines_previous', None)
+    if previous:
+        suggest.update_article_terms(previous, None)
+
+
+@receiver(post_save, sender=ArticleCategory)
+def update_category_suggestions(sender, instance, **kwargs):
+    from api import suggest
+    suggest.index_category(instance)
+
+
+# Signals to bump content versions (cache invalidation, ETags)
+_ARTICLE_STATS_FIELDS = {'view_count', 'reaction_count', 'comment_count'}
+
+
+@receiver(pre_save, sender=Article)
+def keep_stored_counters(sender, instance, update_fields=None, **kwargs):
+    """
+    The counters and render_version only move by atomic updates: never write
+    back stale in-memory ones (an old render_version would make the rendering
+    of the previous save current again, see api/rendering.py)
+    """
+    if instance._state.adding or instance.pk is None or update_fields is not None:
+        return
+    row = _previous_row(instance) or {}
+    for field in (*_ARTICLE_STATS_FIELDS, 'render_version'):
+        if field in row:
+            setattr(instance, field, row[field])
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def bump_article_version(sender, instance, update_fields=None, **kwargs):
+    """
+    Counter-only saves don't change what articles say or where they are listed.
+    Cached feed pages that can show the article are evicted; the feed order
+    signals above evict them for insertions and removals (see api/feed.py).
+    """
+    from api import feed, versions
+    
+    if update_fields is not None:
+        fields = set(update_fields) - {'feed_rank'}
+        if not fields:
+            return
+        if fields <= _ARTICLE_STATS_FIELDS:
+            versions.bump(versions.ARTICLE_STATS)
+            feed.evict_cached_pages(instance.pk, counters=True)
+            return
+    versions.bump(versions.ARTICLES)
+    feed.evict_cached_pages(instance.pk)
+
+
+# Signals to keep the precomputed article JSON current (see api/rendering.py)
+@receiver(post_save, sender=Article)
+def refresh_rendered_article(sender, instance, update_fields=None, **kwargs):
+    """Counters are stitched in when serving, so counter saves don't re-render"""
+    if update_fields is not None and set(update_fields) <= _ARTICLE_STATS_FIELDS | {'feed_rank'}:
+        return
+    from api import rendering
+    rendering.invalidate(article_id=instance.pk)
+
+
+# Signals to keep the category copies on articles current (see api/denormalize.py)
+@receiver(pre_save, sender=ArticleCategory)
+def capture_category_fields(sender, instance, **kwargs):
+    """Remember the stored fields the articles copy or render, so post_save can skip unrelated edits"""
+    from api import denormalize
+
+    instance._category_previous = None
+    if instance.pk is not None:
+        instance._category_previous = ArticleCategory.objects.filter(pk=instance.pk).values(
+            *{*denormalize.COPIED_FIELDS, *denormalize.RENDERED_FIELDS}
+        ).first()
+
+
+@receiver(post_save, sender=ArticleCategory)
+def propagate_category_to_articles(sender, instance, created, **kwargs):
+    """In the save's transaction; also re-renders the articles, which embed their category's details"""
+    from api import denormalize
+
+    previous = getattr(instance, '_category_previous', None)
+    instance._category_previous = None
+    if created:
+        return
+    changed = None
+    if previous is not None:
+        changed = {field for field, value in previous.items() if getattr(instance, field) != value}
+        if not changed:
+            return
+    denormalize.propagate(instance, changed)
+
+
+@receiver(pre_delete, sender=ArticleCategory)
+def clear_category_from_articles(sender, instance, **kwargs):
+    from api import denormalize
+    denormalize.clear(instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_comment_version(sender, instance, **kwargs):
+    from api import versions
+    versions.bump(versions.COMMENTS)
+
+
+@receiver(post_save, sender=ArticleCategory)
+@receiver(post_delete, sender=ArticleCategory)
+def bump_category_version(sender, instance, **kwargs):
+    from api import versions, response_cache
+    versions.bump(versions.CATEGORIES)
+    # Feed items embed their category and only list active ones
+    response_cache.evict(response_cache.CATEGORIES, response_cache.FEED)
+
+
+# Push notifications go out once per article: when it is created with
+# send_notification set, or when send_notification is switched on later.
+# Other saves (edits, comment counts, thumbnails) never fan out again.
+@receiver(pre_save, sender=Article)
+def capture_send_notification(sender, instance, update_fields=None, **kwargs):
+    """Remember whether notifications were already on, for saves that could switch them on"""
+    instance._send_notification_previous = None
+    if instance.pk is None or not instance.send_notification:
+        return
+    if update_fields is not None and 'send_notification' not in update_fields:
+        instance._send_notification_previous = True
+        return
+    row = _previous_row(instance)
+    instance._send_notification_previous = row and row['send_notification']
 
 
 @receiver(post_save, sender=Article)
 def trigger_push_notification(sender, instance, created, **kwargs):
     """
-    Trigger FCM push notification if send_notification is True.
+    Trigger FCM push notification when send_notification becomes True.
     """
-    if instance.send_notification:
-        try:
-            from api.utils.fcm import send_push_notification
-            # Send notification (non-blocking is handled inside send_push_notification)
-            send_push_notification(instance)
-            
-            # Optional: Reset the flag to prevent re-sending on subsequent edits
-            # instance.send_notification = False
-            # instance.save(update_fields=['send_notification'])
-            # CAUTION: Saving here triggers the signal again. 
-            # If we want to reset, we must disconnect signal or handle recursion.
-            # For now, we leave it as is, assuming the uploader sets it once.
-        except Exception as e:
-            print(f"Error triggering notification: {e}")
+    previous = getattr(instance, '_send_notification_previous', None)
+    instance._send_notification_previous = None
+    if not instance.send_notification or (not created and previous):
+        return
+    try:
+        from api.utils.fcm import send_push_notification
+        # Send notification (non-blocking is handled inside send_push_notification)
+        send_push_notification(instance)
+    except Exception as e:
+        print(f"Error triggering notification: {e}")
 
 
 class AssistanceRequest(models.Model):
@@ -402,6 +995,24 @@ class DailyQuote(models.Model):
         return self.affirmations_fr if lang == 'fr' else self.affirmations_en
 
 
+@receiver(pre_save, sender=DailyQuote)
+def capture_quote_category(sender, instance, **kwargs):
+    """A quote moved to another category leaves that category's cached 'today' stale too"""
+    instance._category_previous = None
+    if instance.pk is not None:
+        instance._category_previous = DailyQuote.objects.filter(pk=instance.pk).values_list('category', flat=True).first()
+
+
+@receiver(post_save, sender=DailyQuote)
+@receiver(post_delete, sender=DailyQuote)
+def bump_daily_quote_version(sender, instance, **kwargs):
+    from api import versions, response_cache
+    versions.bump(versions.DAILY_QUOTES)
+    
+    categories = {instance.category, getattr(instance, '_category_previous', None)} - {None}
+    response_cache.evict(*[response_cache.quotes_today(category) for category in categories])
+
+
 class UserNotification(models.Model):
     """
     In-app notifications for users.
@@ -482,8 +1093,8 @@ class UserNotification(models.Model):
     
     def get_link(self, lang='en'):
         """Return the appropriate link for this notification"""
-        if self.article:
-            return f"/{lang}/article/{self.article.id}/"
+        if self.article_id:
+            return f"/{lang}/article/{self.article_id}/"
         return self.link_url or ""
     
     def mark_as_read(self):
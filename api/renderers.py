@@ -0,0 +1,87 @@
+"""
+orjson-backed JSON renderer and parser (the REST_FRAMEWORK defaults).
+
+Both produce and accept exactly what DRF's JSONRenderer/JSONParser do with
+the project's settings (compact, UTF-8, \\u2028/\\u2029 escaped), only
+faster. orjson serializes dicts, lists, str/int/float, datetimes, dates,
+times and UUIDs natively; everything else goes through `default()`:
+
+    lazy translation strings    str
+    Decimal                     float, as DRF's encoder does
+    ImageField/FileField files  their URL (None when empty)
+    anything else               DRF's JSONEncoder (timedelta, QuerySet, ...)
+
+Payloads orjson can't represent exactly (integers beyond 64 bits, indented
+output for ?format=api / `indent=`) fall back to the stdlib path, as does
+a missing orjson install. One deliberate difference: NaN and infinite
+floats are rendered as null instead of failing the response.
+"""
+import io
+
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Parsing yields floats for integers orjson can't hold in 64 bits, so bodies
+# with a run of 19+ digits go to the stdlib (translate + find beats a regex)
+_DIGITS = bytes.maketrans(b'123456789', b'000000000')
+_WIDE_INTEGER = b'0' * 19
+
+_encoder = encoders.JSONEncoder()
+
+
+def default(obj):
+    if isinstance(obj, FieldFile):
+        return obj.url if obj else None
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer serializing with orjson"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact or \
+                self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+        # Keep the output a strict JavaScript subset, as JSONRenderer does
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser parsing with orjson"""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None or not self.strict:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        body = stream.read()
+        try:
+            if encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+                body = body.decode(encoding).encode()
+            if _WIDE_INTEGER not in body.translate(_DIGITS):
+                # NaN/Infinity are rejected like JSONParser's strict mode
+                return orjson.loads(body)
+        except (ValueError, LookupError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+        return super().parse(io.BytesIO(body), media_type, {**parser_context, 'encoding': 'utf-8'})
@@ -0,0 +1,161 @@
+"""
+Precomputed article JSON.
+
+Serializing an article walks its nested category serializer and the
+`category.*` source fields on every request. Instead, each article's card
+(ArticleListSerializer) and detail (ArticleSerializer) representations are
+rendered once per language ('' bilingual, 'en', 'fr' as with ?lang=) into
+RenderedArticle rows by a background task after every change, tagged with
+the article's render_version. List and detail views then load the page's
+rows with one query and only patch in what changes without a re-render:
+
+    view_count, comment_count, reaction_count   read from the article row
+    comments                                    serialized live (detail)
+    thumbnail_image                             made absolute for the request
+    ?fields= / ?omit= / ?lang=                  keys of the trimmed serializer
+
+Articles without an up-to-date rendering (not built yet, or changed since)
+are serialized as before, so a missing or slow task never serves stale data.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES = ('', 'en', 'fr')
+COUNTER_FIELDS = ('view_count', 'comment_count', 'reaction_count')
+# Article columns the views need to stitch renderings (besides ordering/pagination)
+ROW_FIELDS = ('render_version',) + COUNTER_FIELDS
+
+
+def _serializer_class(kind):
+    from .models import RenderedArticle
+    from .serializers import ArticleListSerializer, ArticleSerializer
+
+    return ArticleListSerializer if kind == RenderedArticle.CARD else ArticleSerializer
+
+
+def renderers():
+    """{(kind, language): serializer} rendering the stored part of each representation"""
+    from .models import RenderedArticle
+
+    renderers = {}
+    for kind, _ in RenderedArticle.KIND_CHOICES:
+        for language in LANGUAGES:
+            serializer = _serializer_class(kind)(context={'projection_language': language or None})
+            # Filled in when served
+            serializer.fields.pop('comments', None)
+            renderers[(kind, language)] = serializer
+    return renderers
+
+
+def build(article_ids, chunk_size=200):
+    """(Re)render every kind and language of `article_ids`. Returns the number of articles built."""
+    from .models import Article, RenderedArticle
+
+    article_ids = list(article_ids)
+    serializers = renderers()
+    built = 0
+    for start in range(0, len(article_ids), chunk_size):
+        articles = list(
+            Article.objects.select_related('category').filter(pk__in=article_ids[start:start + chunk_size])
+        )
+        RenderedArticle.objects.bulk_create(
+            [
+                RenderedArticle(
+                    article=article, kind=kind, language=language,
+                    version=article.render_version, data=serializer.to_representation(article),
+                )
+                for article in articles
+                for (kind, language), serializer in serializers.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['article', 'kind', 'language'],
+            update_fields=['version', 'data'],
+        )
+        built += len(articles)
+    return built
+
+
+def stale_article_ids():
+    """Articles missing an up-to-date rendering of some kind or language"""
+    from .models import Article, RenderedArticle
+
+    complete = len(RenderedArticle.KIND_CHOICES) * len(LANGUAGES)
+    return Article.objects.annotate(
+        rendered=Count('renderings', filter=Q(renderings__version=F('render_version')))
+    ).filter(rendered__lt=complete).values_list('pk', flat=True)
+
+
+def build_category(category_id):
+    from .models import Article
+
+    return build(Article.objects.filter(category_id=category_id).values_list('pk', flat=True).iterator())
+
+
+def invalidate(article_id=None, category_id=None, chunk_size=1000):
+    """
+    Retire the current renderings of an article (or of all articles of a
+    category, in chunks of primary keys) and queue their rebuild once the
+    transaction commits.
+    """
+    from .models import Article
+
+    article_ids = [article_id] if article_id is not None else list(
+        Article.objects.filter(category_id=category_id).order_by('pk').values_list('pk', flat=True)
+    )
+    # Saves write back the stored render_version, never their in-memory one
+    # (see keep_stored_counters in api/models.py)
+    for start in range(0, len(article_ids), chunk_size):
+        Article.objects.filter(pk__in=article_ids[start:start + chunk_size]).update(
+            render_version=F('render_version') + 1
+        )
+
+    if article_id is not None:
+        task = ('api.rendering.build', [article_id])
+    else:
+        task = ('api.rendering.build_category', category_id)
+    transaction.on_commit(lambda: _queue(*task))
+
+
+def _queue(func, *args):
+    try:
+        from django_q.tasks import async_task
+        async_task(func, *args)
+    except Exception as e:
+        # Served by the serializers until the next rebuild
+        logger.error(f"Could not queue article rendering: {e}")
+
+
+def fetch(articles, kind, language):
+    """{article_id: data} of the up-to-date renderings of `articles` (render_version loaded)"""
+    from .models import RenderedArticle
+
+    versions = {article.pk: article.render_version for article in articles}
+    if not versions:
+        return {}
+    rows = RenderedArticle.objects.filter(
+        article_id__in=versions, kind=kind, language=language or '',
+    ).values_list('article_id', 'version', 'data')
+    return {pk: data for pk, version, data in rows if versions[pk] == version}
+
+
+def finish(data, article, serializer):
+    """
+    Turn a stored rendering into what `serializer` (possibly trimmed by
+    ?fields=/?omit=) would return for `article`.
+    """
+    result = {}
+    for name, field in serializer.fields.items():
+        if name in COUNTER_FIELDS:
+            result[name] = getattr(article, name)
+        elif name == 'comments':
+            result[name] = field.to_representation(article.comments.all())
+        elif name in data:
+            result[name] = data[name]
+    request = serializer.context.get('request')
+    if result.get('thumbnail_image') and request is not None:
+        result['thumbnail_image'] = request.build_absolute_uri(result['thumbnail_image'])
+    return result
@@ -0,0 +1,136 @@
+"""
+Server-side cache of anonymous API read responses.
+
+`cache_response(group)` stores the serialized data of a view's 200 response
+under a key built from the host, path, normalized query params, language and
+the current generations of the group and of the groups containing it
+('feed:open' is inside 'feed'). Model signals evict a group by bumping its
+generation (after the write commits), which makes every key of that group
+and of the groups inside it unreachable at once; nothing else is touched.
+Generations are ContentVersion counters ('cache:<group>', see
+api/versions.py) rather than cache entries: the cache culls entries once
+full, and a culled generation starting over would make old keys live again.
+Groups, and what evicts them:
+
+    categories              ArticleCategory changes
+    feed:full               first FEED_CACHED_PAGES pages of the unfiltered
+                            article feed: a change to an article within
+                            the first FEED_CACHED_DEPTH of its category
+    feed:open               the same for the open feed (?open=true)
+    category_articles       counter changes of an article within the first
+                            CATEGORY_ARTICLES_DEPTH of its category (article
+                            and category changes re-key it through their
+                            content versions)
+    quotes:today:<CATEGORY> today's quote of one DailyQuote category
+    mentor_categories       MentorCategory changes
+
+Changes to many articles at once (category edits, archiving, backfills)
+evict 'feed' as a whole. The feed round-robins its categories, so the
+article at offset k of its category is at least k articles into the feed and
+inserting or removing it only moves the articles after it: deeper articles
+can't change a cached page (see api/feed.py).
+
+Entries live in the 'api_responses' cache, which must be shared by all
+worker processes (see CACHES in settings) so an eviction reaches every one.
+"""
+import hashlib
+from functools import wraps
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from django.utils.translation import get_language
+from rest_framework.response import Response
+
+from . import versions
+
+CACHE_ALIAS = 'api_responses'
+
+CATEGORIES = 'categories'
+CATEGORY_ARTICLES = 'category_articles'
+FEED = 'feed'
+FEED_FULL = 'feed:full'
+FEED_OPEN = 'feed:open'
+MENTOR_CATEGORIES = 'mentor_categories'
+
+# Reach of the cached pages into each category: the feed's first pages of at
+# most 100 articles (max_page_size), and at most 50 articles per category
+# (ArticleCategoryViewSet.MAX_PER_CATEGORY)
+FEED_CACHED_PAGES = 3
+FEED_CACHED_DEPTH = FEED_CACHED_PAGES * 100
+CATEGORY_ARTICLES_DEPTH = 50
+
+
+def quotes_today(category):
+    return f'quotes:today:{category}'
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def _generation_name(group):
+    return f'cache:{group}'
+
+
+def _lineage(group):
+    """'quotes:today:GENERAL' -> ['quotes', 'quotes:today', 'quotes:today:GENERAL']"""
+    parts = group.split(':')
+    return [':'.join(parts[:end]) for end in range(1, len(parts) + 1)]
+
+
+def get_generation(group):
+    """Generations of `group` and the groups containing it, in one query"""
+    return versions.version_key(*[_generation_name(name) for name in _lineage(group)])
+
+
+def evict(*groups):
+    """Drop every cached response of `groups` once the current transaction commits"""
+    if not groups:
+        return
+
+    def bump():
+        for group in groups:
+            versions.bump(_generation_name(group))
+    transaction.on_commit(bump)
+
+
+def response_key(request, group, extra=()):
+    parts = [
+        request.get_host(),
+        request.path,
+        '&'.join(f'{key}={value}' for key, value in sorted(request.GET.lists())),
+        get_language() or '',
+        *[str(part) for part in extra],
+    ]
+    digest = hashlib.sha1('|'.join(parts).encode()).hexdigest()
+    return f'resp:{group}:{get_generation(group)}:{digest}'
+
+
+def cache_response(group, extra=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Decorate a view handler `(self, request, ...)` to serve anonymous GETs from
+    the cache. `group` is a group name or `group(view, request)` returning one,
+    or None for requests that must not be cached. `extra(view, request)` adds
+    values the response depends on besides the URL and language.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            name = group(self, request) if callable(group) else group
+            if name is None or request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+                return handler(self, request, *args, **kwargs)
+
+            # The generation is read before the handler runs, so data read
+            # concurrently with an eviction is stored under a dead key
+            key = response_key(request, name, extra(self, request) if extra else ())
+            data = _cache().get(key)
+            if data is not None:
+                return Response(data)
+
+            response = handler(self, request, *args, **kwargs)
+            if response.status_code == 200 and isinstance(response, Response):
+                _cache().set(key, response.data, timeout)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,458 @@
+"""
+Full-text search over articles.
+
+`/api/articles/?search=` goes through ArticleSearchFilter, which hands the
+query to the search backend for the current database:
+
+- SQLiteFTSBackend: an FTS5 table (``api_article_fts``) over the headline and
+  summary columns, kept in sync by triggers on ``api_article``. The
+  ``unicode61 remove_diacritics 2`` tokenizer folds accents, so "etudes"
+  matches "Études". Results are ordered by bm25 with headlines weighted
+  above summaries.
+- PostgresSearchBackend: the same document as a weighted ``tsvector`` in
+  ``api_article_search`` (GIN indexed, trigger maintained, unaccented),
+  ranked with ts_rank_cd.
+
+Any other database keeps DRF's icontains SearchFilter. The archive
+(``api_archivedarticle``, see api/archive.py) has an index of its own, named
+after its table the same way. The index objects are created (and backfilled)
+after `migrate` by `install_search_index`, which is idempotent and also
+restores the triggers when a migration rebuilds the article table.
+`python manage.py rebuild_search_index` repopulates them.
+
+Plain searches are additionally answered from a result cache of ranked IDs
+(SearchQuery), see the end of this module.
+"""
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, F, FloatField, Func, Q, Value
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework import filters
+
+from . import versions
+
+logger = logging.getLogger(__name__)
+
+SEARCH_COLUMNS = ('headline', 'headline_en', 'headline_fr', 'french_summary', 'english_summary')
+HEADLINE_COLUMNS = ('headline', 'headline_en', 'headline_fr')
+# Indexed tables: the articles, then the archived ones
+SOURCES = ('api_article', 'api_archivedarticle')
+SUMMARY_COLUMNS = ('french_summary', 'english_summary')
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(query):
+    """Word terms of a user query, lower-cased. Punctuation and operators are dropped."""
+    return [term.lower() for term in _TERM_RE.findall(query or '')]
+
+
+def fold(word):
+    """Lower-case `word` and strip accents: 'Études' -> 'etudes'"""
+    decomposed = unicodedata.normalize('NFKD', word.lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+class Match(Func):
+    """`document MATCH query` (SQLite FTS5), as a filter condition"""
+    template = '%(expressions)s'
+    arg_joiner = ' MATCH '
+    output_field = BooleanField()
+
+
+class TSMatch(Match):
+    """`document @@ tsquery` (PostgreSQL)"""
+    arg_joiner = ' @@ '
+
+
+class BaseSearchBackend:
+    """
+    Index of one table (`source`). `search` joins the index rows through
+    `relation`, an inner join as the index functions require.
+    """
+    vendor = None
+    # Appended to the indexed table's name to name the index table
+    suffix = None
+    # Relation from the indexed model to its index rows (see the unmanaged models in api/models.py)
+    relation = None
+
+    def __init__(self, source='api_article'):
+        self.source = source
+        self.table = f'{source}{self.suffix}'
+
+    def search(self, queryset, terms):
+        """Restrict `queryset` to matches of every term, best match first"""
+        raise NotImplementedError
+
+    def _join(self, queryset):
+        """`queryset` joined to its index rows (a filter on the relation makes the join inner)"""
+        return queryset.filter(**{f'{self.relation}__isnull': False})
+
+    def is_installed(self, cursor):
+        raise NotImplementedError
+
+    def install(self, cursor):
+        """Create the index objects that are missing (idempotent)"""
+        raise NotImplementedError
+
+    def rebuild(self, cursor):
+        """Repopulate the index from the source table"""
+        raise NotImplementedError
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    vendor = 'sqlite'
+    suffix = '_fts'
+    relation = 'fts'
+    # bm25 column weights, in SEARCH_COLUMNS order
+    weights = (5.0, 5.0, 5.0, 1.0, 1.0)
+
+    def match_expression(self, terms):
+        # Quoted prefix queries: user input never reaches the FTS5 query syntax
+        return ' '.join(f'"{term}"*' for term in terms)
+
+    def search(self, queryset, terms):
+        document = F(f'{self.relation}__document')
+        rank = Func(document, *[Value(w) for w in self.weights], function='bm25', output_field=FloatField())
+        return self._join(queryset).filter(Match(document, Value(self.match_expression(terms)))) \
+            .annotate(search_rank=rank).order_by('search_rank', '-created_at')
+
+    def _sql_objects(self):
+        columns = ', '.join(SEARCH_COLUMNS)
+        new_values = ', '.join(f'new.{c}' for c in SEARCH_COLUMNS)
+        old_values = ', '.join(f'old.{c}' for c in SEARCH_COLUMNS)
+        delete_old = (
+            f"INSERT INTO {self.table}({self.table}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_values});"
+        )
+        insert_new = f"INSERT INTO {self.table}(rowid, {columns}) VALUES (new.id, {new_values});"
+        return {
+            ('table', self.table): (
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                f"{columns}, content='{self.source}', content_rowid='id', "
+                f"tokenize='unicode61 remove_diacritics 2')"
+            ),
+            ('trigger', f'{self.table}_ai'): (
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT ON {self.source} "
+                f"BEGIN {insert_new} END"
+            ),
+            ('trigger', f'{self.table}_ad'): (
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE ON {self.source} "
+                f"BEGIN {delete_old} END"
+            ),
+            ('trigger', f'{self.table}_au'): (
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE OF {columns} ON {self.source} "
+                f"BEGIN {delete_old} {insert_new} END"
+            ),
+        }
+
+    def _existing(self, cursor):
+        cursor.execute(
+            "SELECT type, name FROM sqlite_master WHERE name LIKE %s",
+            [f'{self.table}%'],
+        )
+        return set(cursor.fetchall())
+
+    def is_installed(self, cursor):
+        return set(self._sql_objects()) <= self._existing(cursor)
+
+    def install(self, cursor):
+        existing = self._existing(cursor)
+        for key, sql in self._sql_objects().items():
+            if key not in existing:
+                cursor.execute(sql)
+
+    def rebuild(self, cursor):
+        cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')")
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    vendor = 'postgresql'
+    suffix = '_search'
+    relation = 'search_document'
+    config = 'simple'
+
+    def tsquery(self, terms):
+        return ' & '.join(f'{term}:*' for term in terms)
+
+    def search(self, queryset, terms):
+        document = F(f'{self.relation}__document')
+        tsquery = Func(Value(self.tsquery(terms)), template=f"to_tsquery('{self.config}', api_unaccent(%(expressions)s))")
+        rank = Func(document, tsquery, function='ts_rank_cd', output_field=FloatField())
+        return self._join(queryset).filter(TSMatch(document, tsquery)) \
+            .annotate(search_rank=rank).order_by('-search_rank', '-created_at')
+
+    def _document(self, row):
+        headlines = " || ' ' || ".join(f"coalesce({row}.{c}, '')" for c in HEADLINE_COLUMNS)
+        summaries = " || ' ' || ".join(f"coalesce({row}.{c}, '')" for c in SUMMARY_COLUMNS)
+        return (
+            f"setweight(to_tsvector('{self.config}', api_unaccent({headlines})), 'A') || "
+            f"setweight(to_tsvector('{self.config}', api_unaccent({summaries})), 'B')"
+        )
+
+    def is_installed(self, cursor):
+        cursor.execute(
+            "SELECT count(*) FROM pg_trigger WHERE tgname = %s AND NOT tgisinternal",
+            [f'{self.table}_sync'],
+        )
+        return cursor.fetchone()[0] == 1
+
+    def install(self, cursor):
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+        # unaccent() is only STABLE; the wrapper lets the trigger and queries share one definition
+        cursor.execute(
+            "CREATE OR REPLACE FUNCTION api_unaccent(text) RETURNS text AS "
+            "$$ SELECT public.unaccent('public.unaccent', $1) $$ LANGUAGE sql IMMUTABLE"
+        )
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            f"article_id bigint PRIMARY KEY REFERENCES {self.source}(id) ON DELETE CASCADE, "
+            f"document tsvector NOT NULL)"
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table}_document_idx ON {self.table} USING gin(document)"
+        )
+        cursor.execute(
+            f"CREATE OR REPLACE FUNCTION {self.table}_sync() RETURNS trigger AS $$ BEGIN "
+            f"INSERT INTO {self.table}(article_id, document) VALUES (NEW.id, {self._document('NEW')}) "
+            f"ON CONFLICT (article_id) DO UPDATE SET document = EXCLUDED.document; "
+            f"RETURN NEW; END $$ LANGUAGE plpgsql"
+        )
+        cursor.execute(f"DROP TRIGGER IF EXISTS {self.table}_sync ON {self.source}")
+        cursor.execute(
+            f"CREATE TRIGGER {self.table}_sync AFTER INSERT OR UPDATE OF {', '.join(SEARCH_COLUMNS)} "
+            f"ON {self.source} FOR EACH ROW EXECUTE FUNCTION {self.table}_sync()"
+        )
+
+    def rebuild(self, cursor):
+        cursor.execute(f"TRUNCATE {self.table}")
+        cursor.execute(
+            f"INSERT INTO {self.table}(article_id, document) "
+            f"SELECT id, {self._document(self.source)} FROM {self.source}"
+        )
+
+
+BACKENDS = {
+    backend.vendor: backend
+    for backend in (SQLiteFTSBackend, PostgresSearchBackend)
+}
+
+
+def get_search_backend(source='api_article'):
+    """
+    Backend over `source` (one of SOURCES) for the default database, or None
+    to keep icontains search. settings.ARTICLE_SEARCH_BACKEND may name a
+    backend class, or be None to disable indexed search.
+    """
+    path = getattr(settings, 'ARTICLE_SEARCH_BACKEND', 'auto')
+    if path is None:
+        return None
+    if path != 'auto':
+        return import_string(path)(source)
+    backend_class = BACKENDS.get(connection.vendor)
+    return backend_class(source) if backend_class else None
+
+
+def install_search_index(using='default', **kwargs):
+    """post_migrate hook: create missing index objects and backfill them"""
+    from django.db import connections
+
+    for source in SOURCES:
+        backend = get_search_backend(source)
+        if backend is None or connections[using].vendor != backend.vendor:
+            return
+        with connections[using].cursor() as cursor:
+            if backend.is_installed(cursor):
+                continue
+            backend.install(cursor)
+            backend.rebuild(cursor)
+        logger.info('Installed %s search index (%s)', source, backend.__class__.__name__)
+
+
+class ArticleSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter that uses the indexed search backend when one is available,
+    falling back to the view's `search_fields` icontains lookups otherwise.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = tokenize(' '.join(self.get_search_terms(request)))
+        backend = get_search_backend()
+        if backend is None or not terms:
+            return super().filter_queryset(request, queryset, view)
+        return backend.search(queryset, terms)
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+#
+# A plain search (no other filters) is keyed by its normalized query. The
+# SearchQuery row counts how often it is searched and holds its ranked
+# article IDs together with the article/category content versions they were
+# computed at, so any content change invalidates every entry at once without
+# touching them. `precompute_popular_searches` (run on a schedule by
+# `python manage.py precompute_search_results`) refreshes the most searched
+# queries after content changes, so those never reach the text index.
+#
+# The key folds accents as the indexes do, so the cache is only used with an
+# indexed backend. A query matching more than MAX_CACHED_RESULTS articles
+# keeps one ID more than that, which marks it as too broad to cache. Search
+# counts are buffered per process and applied every COUNT_FLUSH_INTERVAL
+# seconds (a process that exits first loses its last few, which only makes
+# popularity approximate), so a cache hit costs one indexed read. Results are
+# only stored for queries searched before (counted here or already in the
+# table): a query typed once costs no write on the request path.
+# ---------------------------------------------------------------------------
+
+MAX_CACHED_RESULTS = 2000
+CONTENT_VERSIONS = (versions.ARTICLES, versions.CATEGORIES)
+COUNT_FLUSH_INTERVAL = 60
+
+_count_lock = threading.Lock()
+_pending_counts = Counter()
+_counts_flushed_at = time.monotonic()
+
+
+def normalize_query(query):
+    """Cache key of a query: its accent-folded terms, de-duplicated and sorted"""
+    return ' '.join(sorted({fold(term) for term in tokenize(query)}))
+
+
+def search_article_ids(query, limit=None):
+    """
+    Ranked IDs of the listed (active category) articles matching `query`,
+    followed by those of the matching archived articles (see api/archive.py).
+    At most `limit` of them when given.
+    """
+    from .models import Article, ArchivedArticle
+
+    ids = []
+    terms = tokenize(query)
+    for model in (Article, ArchivedArticle):
+        queryset = model.objects.filter(category_is_active=True).order_by('-created_at', '-id')
+        backend = get_search_backend(model._meta.db_table)
+        if backend is not None:
+            queryset = backend.search(queryset, terms)
+        else:
+            for term in terms:
+                queryset = queryset.filter(reduce(or_, (Q(**{f'{c}__icontains': term}) for c in SEARCH_COLUMNS)))
+        queryset = queryset.values_list('id', flat=True)
+        if limit is not None:
+            queryset = queryset[:limit - len(ids)]
+        ids += queryset
+        if limit is not None and len(ids) >= limit:
+            break
+    return ids
+
+
+def _store(query, ids, version):
+    """Save the results of `query`; returns whether they fit the cache"""
+    from .models import SearchQuery
+
+    SearchQuery.objects.update_or_create(
+        query=query,
+        defaults={'result_ids': ids, 'content_version': version, 'computed_at': timezone.now()},
+        create_defaults={
+            'result_ids': ids, 'content_version': version, 'computed_at': timezone.now(),
+            'last_searched_at': timezone.now(),
+        },
+    )
+    return len(ids) <= MAX_CACHED_RESULTS
+
+
+def count_search(query):
+    """Buffer one search of the normalized `query`"""
+    global _counts_flushed_at
+
+    with _count_lock:
+        _pending_counts[query] += 1
+        due = time.monotonic() - _counts_flushed_at >= COUNT_FLUSH_INTERVAL
+        if due:
+            _counts_flushed_at = time.monotonic()
+    if due:
+        flush_search_counts()
+
+
+def flush_search_counts():
+    """Apply this process's buffered search counts; returns the number of queries updated"""
+    from .models import SearchQuery
+
+    with _count_lock:
+        counts = dict(_pending_counts)
+        _pending_counts.clear()
+    if not counts:
+        return 0
+    # Queries new to the table get a row, so their next search stores its results
+    SearchQuery.objects.bulk_create([SearchQuery(query=query) for query in counts], ignore_conflicts=True)
+    # Queries searched the same number of times share one UPDATE
+    groups = defaultdict(list)
+    for query, count in counts.items():
+        groups[count].append(query)
+    now = timezone.now()
+    for count, queries in groups.items():
+        SearchQuery.objects.filter(query__in=queries).update(
+            search_count=F('search_count') + count, last_searched_at=now
+        )
+    return len(counts)
+
+
+def cached_search_ids(query):
+    """
+    Ranked article IDs for a plain search, from the cache when still current.
+    Counts the search. Returns None for queries that can't be cached.
+    """
+    from .models import SearchQuery
+
+    normalized = normalize_query(query)
+    if (
+        get_search_backend() is None
+        or not normalized
+        or len(normalized) > SearchQuery._meta.get_field('query').max_length
+    ):
+        return None
+
+    version = versions.version_key(*CONTENT_VERSIONS)
+    entry = SearchQuery.objects.filter(query=normalized).only('result_ids', 'content_version').first()
+    if entry is not None and entry.content_version == version:
+        ids = entry.result_ids
+    else:
+        ids = search_article_ids(normalized, limit=MAX_CACHED_RESULTS + 1)
+        # Only queries searched before are worth a write
+        if entry is not None or _pending_counts.get(normalized):
+            _store(normalized, ids, version)
+    count_search(normalized)
+    return ids if len(ids) <= MAX_CACHED_RESULTS else None
+
+
+def precompute_popular_searches(top=50, prune_days=30):
+    """
+    Recompute the stale results of the `top` most searched queries, and drop
+    one-off queries not searched for `prune_days`. Returns (refreshed, pruned).
+    """
+    from .models import SearchQuery
+
+    flush_search_counts()
+    version = versions.version_key(*CONTENT_VERSIONS)
+    refreshed = 0
+    entries = SearchQuery.objects.order_by('-search_count').only('pk', 'query', 'content_version')[:top]
+    for entry in entries if get_search_backend() is not None else ():
+        if entry.content_version == version:
+            continue
+        refreshed += _store(entry.query, search_article_ids(entry.query, limit=MAX_CACHED_RESULTS + 1), version)
+
+    pruned = 0
+    if prune_days:
+        cutoff = timezone.now() - timedelta(days=prune_days)
+        pruned, _ = SearchQuery.objects.filter(search_count__lte=1, last_searched_at__lt=cutoff).delete()
+    return refreshed, pruned
@@ -1,7 +1,297 @@
+import operator
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, NullIf
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from .models import Article, Comment, VisitorSubscription, ArticleCategory
 
 
+def _split_param(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    Sparse fieldsets for read requests:
+        ?fields=id,headline_en,thumbnails - keep only these fields
+        ?omit=french_summary,english_summary - drop these fields
+    Article representations are precomputed and trimmed to the remaining
+    fields when served (see api/rendering.py).
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method not in ('GET', 'HEAD'):
+            return
+        
+        keep = _split_param(request.query_params.get('fields'))
+        omit = _split_param(request.query_params.get('omit'))
+        for name in list(self.fields):
+            if (keep and name not in keep) or name in omit:
+                self.fields.pop(name)
+
+
+def get_projection_language(request):
+    """Language of an explicit ?lang=en|fr, or None for the bilingual payload"""
+    if request is None:
+        return None
+    lang = request.query_params.get('lang')
+    return lang if lang in ('en', 'fr') else None
+
+
+def _fallback_chain(model, chain):
+    """
+    SQL equivalent of `a or b or c`: every column but the last is skipped
+    when NULL or empty.
+    """
+    if len(chain) == 1:
+        return F(chain[0])
+    field = model._meta.get_field(chain[0].split('__')[0])
+    if '__' in chain[0]:
+        field = field.related_model._meta.get_field(chain[0].split('__')[1])
+    output_field = field.__class__()
+    return Coalesce(
+        *[NullIf(F(name), Value(''), output_field=output_field) for name in chain[:-1]],
+        F(chain[-1]),
+        output_field=output_field,
+    )
+
+
+class ProjectedLanguageField(serializers.ReadOnlyField):
+    """
+    One language of a bilingual pair, read from the `lang_<name>` annotation
+    added by `project_language`. Instances that didn't come from a projected
+    queryset (e.g. just created) resolve the same chain in Python.
+    """
+    
+    def __init__(self, chain, **kwargs):
+        self.chain = chain
+        super().__init__(**kwargs)
+    
+    def get_attribute(self, instance):
+        try:
+            return getattr(instance, self.source)
+        except AttributeError:
+            pass
+        value = None
+        for path in self.chain:
+            value = instance
+            for name in path.split('__'):
+                value = getattr(value, name, None) if value is not None else None
+            if value:
+                return value
+        return value
+
+
+class LanguageProjectionMixin:
+    """
+    ?lang=en|fr projection: each bilingual pair declared in
+    Meta.language_projection is rendered once, in the requested language,
+    with its fallback chain applied in SQL. The replaced per-language fields
+    are dropped, so `defer_unused_fields` never loads their columns.
+    
+        language_projection = {
+            'headline': {
+                'en': ('headline_en', 'headline_fr', 'headline'),
+                'fr': ('headline_fr', 'headline_en', 'headline'),
+                'replaces': ('headline_en', 'headline_fr'),
+            },
+        }
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Callers without a request (e.g. api/rendering.py) pass the language in the context
+        if 'projection_language' in self.context:
+            self.projection_language = self.context['projection_language']
+        else:
+            self.projection_language = get_projection_language(self.context.get('request'))
+        if self.projection_language is None:
+            return
+        
+        for name, spec in self.Meta.language_projection.items():
+            if name not in self.fields and not any(r in self.fields for r in spec['replaces']):
+                continue
+            for replaced in spec['replaces']:
+                self.fields.pop(replaced, None)
+            self.fields[name] = ProjectedLanguageField(
+                spec[self.projection_language], source=f'lang_{name}'
+            )
+
+
+def project_language(queryset, serializer):
+    """Annotate the projected language fields the serializer still renders"""
+    lang = getattr(serializer, 'projection_language', None)
+    if lang is None:
+        return queryset
+    
+    annotations = {
+        f'lang_{name}': _fallback_chain(queryset.model, spec[lang])
+        for name, spec in serializer.Meta.language_projection.items()
+        if name in serializer.fields
+    }
+    return queryset.annotate(**annotations) if annotations else queryset
+
+
+def defer_unused_fields(queryset, serializer, keep=()):
+    """
+    Defer the model columns none of the serializer's fields read.
+    `keep` lists model fields the view itself needs (ordering, pagination).
+    Method fields are opaque; Meta.method_field_sources lists the model
+    fields each one reads, otherwise nothing is deferred.
+    """
+    model = queryset.model
+    needed = set(keep)
+    
+    method_sources = getattr(serializer.Meta, 'method_field_sources', {})
+    
+    for name, field in serializer.fields.items():
+        if field.source == '*':
+            if name not in method_sources:
+                return queryset
+            needed.update(method_sources[name])
+            continue
+        root = field.source.split('.')[0]
+        if root.startswith('get_') and root.endswith('_display'):
+            root = root[len('get_'):-len('_display')]
+        needed.add(root)
+    
+    concrete = {f.name for f in model._meta.concrete_fields}
+    deferred = concrete - needed - {model._meta.pk.name}
+    
+    if deferred:
+        queryset = queryset.defer(*sorted(deferred))
+    return queryset
+
+
+def serialized_articles(serializer):
+    """
+    Articles with the columns and projected languages `serializer` (as
+    trimmed by ?fields=/?omit=/?lang=) renders, for articles served
+    without a precomputed rendering.
+    """
+    queryset = project_language(Article.objects.select_related('category'), serializer)
+    return defer_unused_fields(queryset, serializer, keep=('category',))
+
+
+def _follow(attrs):
+    """None-safe getter for a dotted source, like a read-only field with allow_null"""
+    def get(instance):
+        try:
+            for attr in attrs:
+                if instance is None:
+                    return None
+                instance = getattr(instance, attr)
+        except ObjectDoesNotExist:
+            return None
+        return instance
+    return get
+
+
+def _call(name):
+    def get(instance):
+        return getattr(instance, name)()
+    return get
+
+
+def _compile_field(serializer, field):
+    """
+    (getter, converter) reproducing `field` for instances of the serializer's
+    model, or None when only DRF's own handling is exact.
+    """
+    model = serializer.Meta.model
+    source = field.source
+    
+    if isinstance(field, serializers.SerializerMethodField):
+        return getattr(serializer, field.method_name), None
+    if isinstance(field, ProjectedLanguageField):
+        return field.get_attribute, None
+    if source == '*' or isinstance(field, serializers.ListSerializer):
+        return None
+    
+    attrs = source.split('.')
+    if len(attrs) > 1:
+        if not (field.read_only and field.allow_null):
+            return None
+        getter = _follow(attrs)
+    elif isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+        # The raw column, as use_pk_only_optimization does
+        return operator.attrgetter(model._meta.get_field(source).attname), None
+    elif callable(getattr(model, source, None)):
+        getter = _call(source)
+    else:
+        getter = operator.attrgetter(source)
+    
+    if isinstance(field, serializers.BaseSerializer):
+        return getter, compile_representation(field)
+    if isinstance(field, serializers.ChoiceField):
+        return getter, field.to_representation
+    if isinstance(field, serializers.CharField):
+        return getter, str
+    if isinstance(field, serializers.IntegerField):
+        return getter, int
+    if isinstance(field, serializers.BooleanField):
+        return getter, bool
+    if isinstance(field, serializers.ReadOnlyField) or (
+        isinstance(field, serializers.JSONField) and not field.binary
+    ):
+        return getter, None
+    return getter, field.to_representation
+
+
+def compile_representation(serializer):
+    """
+    Plain function `instance -> dict` returning exactly what
+    serializer.to_representation(instance) returns, for the serializer's
+    current (possibly trimmed or projected) fields. The per-field getters and
+    converters are resolved once, so rendering a row skips DRF's per-field
+    get_attribute/to_representation dispatch.
+    """
+    steps = []
+    for field in serializer._readable_fields:
+        compiled = _compile_field(serializer, field)
+        if compiled is None:
+            steps.append((field.field_name, None, field))
+        else:
+            steps.append((field.field_name, *compiled))
+    
+    def represent(instance):
+        ret = {}
+        for name, getter, convert in steps:
+            if getter is None:
+                # DRF's own path (convert is the field)
+                try:
+                    attribute = convert.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                ret[name] = None if check_for_none is None else convert.to_representation(attribute)
+                continue
+            value = getter(instance)
+            ret[name] = value if value is None or convert is None else convert(value)
+        return ret
+    return represent
+
+
+class FastRepresentationMixin:
+    """
+    Read fast path: to_representation runs the serializer's fields compiled
+    by `compile_representation` (once per serializer instance) instead of
+    DRF's field machinery. Output is identical (see api/tests.py).
+    """
+    
+    def to_representation(self, instance):
+        try:
+            represent = self._fast_representation
+        except AttributeError:
+            represent = self._fast_representation = compile_representation(self)
+        return represent(instance)
+
+
 class VisitorSubscriptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = VisitorSubscription
@@ -32,20 +322,24 @@ class ArticleCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name_en', 'name_fr', 'slug', 'main_category', 'emoji', 'order']
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(
+    FastRepresentationMixin, SparseFieldsetMixin, LanguageProjectionMixin, serializers.ModelSerializer
+):
     """
     Article serializer with nested category details and language-aware fields.
     Consumers can use 'headline_en'/'headline_fr' and 'english_summary'/'french_summary'
-    based on the user's language preference.
+    based on the user's language preference, or pass ?lang=en|fr to receive
+    single-language 'headline', 'summary', 'audio' and 'category_name' instead.
     """
     comments = CommentSerializer(many=True, read_only=True)
     category_details = ArticleCategorySerializer(source='category', read_only=True)
     
-    # Category info for easier frontend consumption
-    category_slug = serializers.CharField(source='category.slug', read_only=True, allow_null=True)
-    category_name_en = serializers.CharField(source='category.name_en', read_only=True, allow_null=True)
-    category_name_fr = serializers.CharField(source='category.name_fr', read_only=True, allow_null=True)
-    main_category = serializers.CharField(source='category.main_category', read_only=True, allow_null=True)
+    # Category info for easier frontend consumption, read from the article's
+    # copies (see api/denormalize.py)
+    category_slug = serializers.CharField(read_only=True, allow_null=True)
+    category_name_en = serializers.CharField(read_only=True, allow_null=True)
+    category_name_fr = serializers.CharField(read_only=True, allow_null=True)
+    main_category = serializers.CharField(read_only=True, allow_null=True)
 
     class Meta:
         model = Article
@@ -54,11 +348,67 @@ class ArticleSerializer(serializers.ModelSerializer):
             'category', 'category_details', 'category_slug', 'category_name_en', 'category_name_fr', 'main_category',
             'french_summary', 'english_summary',
             'mood', 'source_urls', 'source_names', 'thumbnails', 'thumbnail_image',
-            'french_audio', 'english_audio', 'timestamp', 'created_at',
+            'french_audio', 'english_audio', 'timestamp', 'published_at', 'created_at',
             'view_count', 'comment_count', 'reaction_count', 'comments', 'send_notification',
             'deadline'
         ]
         read_only_fields = ['created_at', 'view_count', 'comment_count', 'reaction_count']
+        language_projection = {
+            'headline': {
+                'en': ('headline_en', 'headline_fr', 'headline'),
+                'fr': ('headline_fr', 'headline_en', 'headline'),
+                'replaces': ('headline_en', 'headline_fr'),
+            },
+            'summary': {
+                'en': ('english_summary', 'french_summary'),
+                'fr': ('french_summary', 'english_summary'),
+                'replaces': ('english_summary', 'french_summary'),
+            },
+            'audio': {
+                'en': ('english_audio',),
+                'fr': ('french_audio',),
+                'replaces': ('english_audio', 'french_audio'),
+            },
+            'category_name': {
+                'en': ('category_name_en',),
+                'fr': ('category_name_fr',),
+                'replaces': ('category_name_en', 'category_name_fr'),
+            },
+        }
+
+
+class RenderedArticleListSerializer(serializers.ListSerializer):
+    """
+    Serves the articles' precomputed card JSON (see api/rendering.py) with one
+    query for the whole page; articles without an up-to-date rendering are
+    reloaded in full and serialized as usual.
+    """
+    
+    def to_representation(self, data):
+        from . import rendering
+        from .models import RenderedArticle
+        
+        articles = list(data.all() if hasattr(data, 'all') else data)
+        rendered = rendering.fetch(articles, RenderedArticle.CARD, self.child.projection_language)
+        missing = [article.pk for article in articles if article.pk not in rendered]
+        reloaded = serialized_articles(self.child).in_bulk(missing) if missing else {}
+        return [
+            rendering.finish(rendered[article.pk], article, self.child) if article.pk in rendered
+            else self.child.to_representation(reloaded.get(article.pk, article))
+            for article in articles
+        ]
+
+
+class ArticleListSerializer(ArticleSerializer):
+    """
+    Feed/list representation: same fields as ArticleSerializer without the
+    nested comments (one query per article). Use comment_count in lists and
+    the detail endpoint or /api/comments/?article= for the comments themselves.
+    """
+    
+    class Meta(ArticleSerializer.Meta):
+        fields = [name for name in ArticleSerializer.Meta.fields if name != 'comments']
+        list_serializer_class = RenderedArticleListSerializer
 
 
 class AssistanceRequestSerializer(serializers.ModelSerializer):
@@ -83,10 +433,11 @@ class AssistanceRequestSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
-class DailyQuoteSerializer(serializers.ModelSerializer):
+class DailyQuoteSerializer(FastRepresentationMixin, LanguageProjectionMixin, serializers.ModelSerializer):
     """
     Serializer for daily quotes with bilingual support.
-    Returns language-specific content based on 'lang' context.
+    Returns language-specific content based on 'lang' context; with an
+    explicit ?lang= the _en/_fr copies are left out.
     """
     category_display = serializers.CharField(source='get_category_display', read_only=True)
     
@@ -108,6 +459,28 @@ class DailyQuoteSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'category_display', 'created_at', 'updated_at']
+        language_projection = {
+            'quote_text': {
+                'en': ('quote_text_en',),
+                'fr': ('quote_text_fr',),
+                'replaces': ('quote_text_en', 'quote_text_fr'),
+            },
+            'explanation': {
+                'en': ('explanation_en',),
+                'fr': ('explanation_fr',),
+                'replaces': ('explanation_en', 'explanation_fr'),
+            },
+            'affirmations': {
+                'en': ('affirmations_en',),
+                'fr': ('affirmations_fr',),
+                'replaces': ('affirmations_en', 'affirmations_fr'),
+            },
+        }
+        method_field_sources = {
+            'quote_text': ('quote_text_en', 'quote_text_fr'),
+            'explanation': ('explanation_en', 'explanation_fr'),
+            'affirmations': ('affirmations_en', 'affirmations_fr'),
+        }
     
     def get_quote_text(self, obj):
         """Return quote text in requested language"""
@@ -125,10 +498,11 @@ class DailyQuoteSerializer(serializers.ModelSerializer):
         return obj.get_affirmations(lang)
 
 
-class UserNotificationSerializer(serializers.ModelSerializer):
+class UserNotificationSerializer(FastRepresentationMixin, LanguageProjectionMixin, serializers.ModelSerializer):
     """
     Serializer for user notifications with bilingual support.
-    Returns language-specific content based on 'lang' context.
+    Returns language-specific content based on 'lang' context; with an
+    explicit ?lang= the _en/_fr copies are left out.
     """
     # Dynamic fields based on language
     title = serializers.SerializerMethodField()
@@ -151,6 +525,29 @@ class UserNotificationSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'user': {'write_only': True}  # Don't expose user in list
         }
+        language_projection = {
+            'title': {
+                'en': ('title_en',),
+                'fr': ('title_fr', 'title_en'),
+                'replaces': ('title_en', 'title_fr'),
+            },
+            'message': {
+                'en': ('message_en',),
+                'fr': ('message_fr', 'message_en'),
+                'replaces': ('message_en', 'message_fr'),
+            },
+            'article_headline': {
+                'en': ('article__headline_en', 'article__headline_fr', 'article__headline'),
+                'fr': ('article__headline_fr', 'article__headline_en', 'article__headline'),
+                'replaces': (),
+            },
+        }
+        method_field_sources = {
+            'title': ('title_en', 'title_fr'),
+            'message': ('message_en', 'message_fr'),
+            'link': ('article', 'link_url'),
+            'article_headline': ('article',),
+        }
     
     def get_title(self, obj):
         """Return title in requested language"""
@@ -0,0 +1,170 @@
+"""
+Search-as-you-type suggestions.
+
+SearchSuggestion holds one row per (language, word) used in article
+headlines, counting the articles whose headline contains it, plus one row per
+word of every active category name. Completions for a prefix are a range
+scan on the (language, key) index, so they stay cheap however many articles
+exist. Article saves only touch the words that were added to or removed from
+the headlines (see the signals in api/models.py).
+"""
+from django.db import transaction
+from django.db.models import F
+
+from .search import fold, tokenize
+
+LANGUAGES = ('en', 'fr')
+HEADLINE_LANGUAGES = {'headline_en': 'en', 'headline_fr': 'fr'}
+
+MIN_WORD_LENGTH = 3
+MAX_WORD_LENGTH = 64
+
+STOPWORDS = {
+    'en': set(
+        'the and for with from that this your you are was were has have had not but all '
+        'its into out who what when how why new more than over after about'.split()
+    ),
+    'fr': set(
+        'les des une pour par avec dans sur est sont pas que qui aux ses son leur leurs '
+        'plus mais ont ete nous vous ils elles cette ces comme'.split()
+    ),
+}
+
+
+def extract_terms(text, language):
+    """{key: display word} for the suggestible words of `text`"""
+    terms = {}
+    for word in tokenize(text):
+        key = fold(word)
+        if (
+            MIN_WORD_LENGTH <= len(key) <= MAX_WORD_LENGTH
+            and not key.isdigit()
+            and key not in STOPWORDS[language]
+        ):
+            terms.setdefault(key, word[:100])
+    return terms
+
+
+def headline_terms(headlines):
+    """{(language, key): display word} for a dict of headline field values"""
+    terms = {}
+    for field, language in HEADLINE_LANGUAGES.items():
+        for key, word in extract_terms((headlines or {}).get(field), language).items():
+            terms.setdefault((language, key), word)
+    return terms
+
+
+def _adjust(terms, delta):
+    from .models import SearchSuggestion
+
+    for language in LANGUAGES:
+        keys = [key for (lang, key) in terms if lang == language]
+        if not keys:
+            continue
+        rows = SearchSuggestion.objects.filter(language=language, key__in=keys, category__isnull=True)
+        if delta > 0:
+            SearchSuggestion.objects.bulk_create(
+                [SearchSuggestion(language=language, key=key, term=terms[(language, key)]) for key in keys],
+                ignore_conflicts=True,
+            )
+            rows.update(article_count=F('article_count') + delta)
+        else:
+            rows.filter(article_count__gt=0).update(article_count=F('article_count') + delta)
+            rows.filter(article_count=0).delete()
+
+
+def update_article_terms(old_headlines, new_headlines):
+    """
+    Apply the word-level difference between an article's previous and current
+    headlines (None for a new or deleted article).
+    """
+    old_terms = headline_terms(old_headlines)
+    new_terms = headline_terms(new_headlines)
+    added = {term: new_terms[term] for term in new_terms.keys() - old_terms.keys()}
+    removed = {term: old_terms[term] for term in old_terms.keys() - new_terms.keys()}
+    if not added and not removed:
+        return
+
+    with transaction.atomic():
+        _adjust(added, 1)
+        _adjust(removed, -1)
+
+
+def index_category(category):
+    """Replace the name entries of one category (none while it is inactive)"""
+    from .models import SearchSuggestion
+
+    with transaction.atomic():
+        SearchSuggestion.objects.filter(category=category).delete()
+        if not category.is_active:
+            return
+        SearchSuggestion.objects.bulk_create([
+            SearchSuggestion(language=language, key=key, term=name, category=category)
+            for language, name in (('en', category.name_en), ('fr', category.name_fr))
+            for key in {fold(word) for word in tokenize(name)}
+        ])
+
+
+def rebuild_suggestions(chunk_size=2000, stdout=None):
+    """Recompute the whole index. Returns the number of rows written."""
+    from .models import ArchivedArticle, Article, ArticleCategory, SearchSuggestion
+
+    counts = {}
+    # Archived articles are still searched (see api/archive.py)
+    for model in (Article, ArchivedArticle):
+        headlines = model.objects.values(*HEADLINE_LANGUAGES).order_by('pk')
+        for row in headlines.iterator(chunk_size=chunk_size):
+            for term, word in headline_terms(row).items():
+                counts.setdefault(term, [word, 0])[1] += 1
+
+    with transaction.atomic():
+        SearchSuggestion.objects.all().delete()
+        SearchSuggestion.objects.bulk_create(
+            [
+                SearchSuggestion(language=language, key=key, term=word, article_count=count)
+                for (language, key), (word, count) in counts.items()
+            ],
+            batch_size=chunk_size,
+        )
+        for category in ArticleCategory.objects.all():
+            index_category(category)
+
+    if stdout is not None:
+        stdout.write(f'  {len(counts)} headline words')
+    return SearchSuggestion.objects.count()
+
+
+def suggest(prefix, language=None, limit=8):
+    """
+    Completions for `prefix`: (category entries, headline words) with the
+    most used words first. `language` None searches both languages.
+    """
+    from .models import SearchSuggestion
+
+    words = tokenize(prefix)
+    if not words:
+        return [], []
+    # Complete the last word being typed
+    key = fold(words[-1])[:MAX_WORD_LENGTH]
+    rows = SearchSuggestion.objects.filter(
+        language__in=[language] if language else LANGUAGES,
+        key__gte=key,
+        key__lt=key + '\U0010ffff',
+    )
+
+    categories = []
+    seen = set()
+    for row in rows.filter(category__isnull=False).select_related('category').order_by('category__order'):
+        if row.category_id in seen:
+            continue
+        seen.add(row.category_id)
+        categories.append(row)
+
+    terms = []
+    seen = set()
+    for row in rows.filter(category__isnull=True).order_by('-article_count', 'key')[:limit * 2]:
+        if row.key in seen:
+            continue
+        seen.add(row.key)
+        terms.append(row)
+    return categories[:limit], terms[:limit]
@@ -1,3 +1,1732 @@
-from django.test import TestCase
+import datetime
+import decimal
+import gzip
+import io
+import json
+import re
+import uuid
+from unittest import mock
+from zoneinfo import ZoneInfo
 
-# Create your tests here.
+import brotli
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone, translation
+from django.utils.translation import gettext_lazy
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from gistme_backend.middleware import CompressionMiddleware, negotiate
+
+from web.models import GameProgress, PaymentTransaction, Subscription, UserProfile
+
+from .models import (
+    ArchivedArticle, ArchivedComment, Article, ArticleCategory, AssistanceRequest, Comment, DailyQuote, FeedBucket,
+    SearchQuery, SearchSuggestion, UserNotification,
+)
+from .renderers import ORJSONParser, ORJSONRenderer
+from .utils.timestamps import parse_timestamp
+from . import archive, counters, denormalize, feed, rendering, response_cache, search, versions, views
+from .serializers import (
+    ArticleListSerializer, ArticleSerializer, DailyQuoteSerializer, UserNotificationSerializer,
+)
+
+
+@mock.patch('api.utils.fcm.send_push_notification')
+class PushNotificationDispatchTests(TestCase):
+    """Article saves fan out push notifications only when send_notification turns on"""
+
+    def create_article(self, **kwargs):
+        fields = {
+            'headline': 'Bourse d\'excellence 2025',
+            'french_summary': 'Résumé',
+            'english_summary': 'Summary',
+            'mood': 'hopeful',
+            'timestamp': '2025-01-01',
+        }
+        fields.update(kwargs)
+        return Article.objects.create(**fields)
+
+    def test_create_with_notification_fans_out_once(self, send):
+        self.create_article(send_notification=True)
+        self.assertEqual(send.call_count, 1)
+
+    def test_create_without_notification_does_not_fan_out(self, send):
+        self.create_article()
+        send.assert_not_called()
+
+    def test_edits_of_notified_article_do_not_fan_out_again(self, send):
+        article = self.create_article(send_notification=True)
+        article.headline_en = 'Updated headline'
+        article.save()
+        article.save(update_fields=['headline_en'])
+        self.assertEqual(send.call_count, 1)
+
+    def test_edit_reads_the_stored_row_once(self, send):
+        article = self.create_article(send_notification=True)
+        article.headline_en = 'Updated headline'
+        with CaptureQueriesContext(connection) as queries:
+            article.save()
+        reads = [q for q in queries if q['sql'].startswith('SELECT') and 'FROM "api_article" WHERE' in q['sql']]
+        # The stored row, shared by the pre_save receivers, and the ranks after the save (feed.evict_cached_pages)
+        self.assertEqual(len(reads), 2)
+        self.assertEqual(send.call_count, 1)
+
+    def test_counter_and_thumbnail_saves_do_not_fan_out(self, send):
+        article = self.create_article(send_notification=True)
+        Comment.objects.create(article=article, commenter_name='Ada', comment_text='Merci')
+        article.thumbnails = ['https://example.com/thumb.jpg']
+        article.save(update_fields=['thumbnails'])
+        article.save(update_fields=['comment_count', 'view_count'])
+        self.assertEqual(send.call_count, 1)
+
+    def test_switching_notification_on_fans_out(self, send):
+        article = self.create_article()
+        article.send_notification = True
+        article.save()
+        self.assertEqual(send.call_count, 1)
+
+        other = self.create_article()
+        other.send_notification = True
+        other.save(update_fields=['send_notification'])
+        self.assertEqual(send.call_count, 2)
+
+    def test_switching_on_with_unrelated_update_fields_does_not_fan_out(self, send):
+        article = self.create_article()
+        article.send_notification = True
+        article.save(update_fields=['headline'])
+        send.assert_not_called()
+
+    def test_switching_off_and_on_again_fans_out_again(self, send):
+        article = self.create_article(send_notification=True)
+        article.send_notification = False
+        article.save()
+        article.send_notification = True
+        article.save()
+        self.assertEqual(send.call_count, 2)
+
+
+class FastRepresentationParityTests(TestCase):
+    """The compiled to_representation returns exactly what DRF's field machinery returns"""
+
+    QUERIES = ['', '?lang=en', '?lang=fr', '?fields=id,headline,category_details,created_at&lang=fr', '?omit=thumbnails']
+
+    @classmethod
+    def setUpTestData(cls):
+        category = ArticleCategory.objects.create(
+            name_en='Scholarships', name_fr='Bourses', slug='scholarships', main_category='OPPORTUNITY', emoji='🎓',
+        )
+        cls.articles = [
+            Article.objects.create(
+                category=category, headline_en='Scholarship', headline_fr='', french_summary='Résumé',
+                english_summary='', mood='hopeful', timestamp='2025-01-01', thumbnails=['https://example.com/a.jpg'],
+                thumbnail_image='thumbnails/a.jpg', deadline=datetime.date(2025, 3, 1), send_notification=False,
+            ),
+            Article.objects.create(
+                headline='Legacy only', french_summary='', english_summary='Summary', mood='neutral',
+                timestamp='2025-01-02', english_audio='https://example.com/a.mp3',
+            ),
+        ]
+        Comment.objects.create(article=cls.articles[0], commenter_name='Ada', comment_text='Merci')
+        cls.quotes = [
+            DailyQuote.objects.create(
+                category='ISLAMIC', date=datetime.date(2025, 1, 1), quote_text_en='Patience', quote_text_fr='Patience',
+                author='Unknown', affirmations_en=['I am calm'], affirmations_fr=[],
+            ),
+        ]
+        with mock.patch('notifications.signals.send_admin_new_user_notification'):
+            user = User.objects.create(username='reader')
+        cls.notifications = [
+            UserNotification.objects.create(
+                user=user, title_en='New scholarship', title_fr='', message_en='Apply now', message_fr='Postulez',
+                article=cls.articles[0],
+            ),
+            UserNotification.objects.create(
+                user=user, title_en='Welcome', message_en='Hello', link_url='https://example.com/welcome',
+            ),
+        ]
+
+    def assertParity(self, serializer_class, instances):
+        factory = APIRequestFactory()
+        for query in self.QUERIES:
+            request = Request(factory.get('/api/' + query))
+            for context in ({'request': request}, {'request': request, 'lang': 'fr'}):
+                serializer = serializer_class(context=context)
+                for instance in instances:
+                    with self.subTest(serializer=serializer_class.__name__, query=query, pk=instance.pk):
+                        fast = serializer.to_representation(instance)
+                        drf = serializers.Serializer.to_representation(serializer, instance)
+                        self.assertEqual(list(fast.items()), list(drf.items()))
+
+    def test_article_serializers(self):
+        articles = Article.objects.select_related('category').filter(pk__in=[a.pk for a in self.articles])
+        self.assertParity(ArticleSerializer, articles)
+        self.assertParity(ArticleListSerializer, articles)
+
+    def test_daily_quote_serializer(self):
+        self.assertParity(DailyQuoteSerializer, self.quotes)
+
+    def test_user_notification_serializer(self):
+        self.assertParity(UserNotificationSerializer, UserNotification.objects.select_related('article'))
+
+
+class ORJSONRendererTests(TestCase):
+    """orjson output and parsing match DRF's stdlib JSONRenderer/JSONParser"""
+
+    def assertSameRendering(self, data, accepted_media_type=None, renderer_context=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, accepted_media_type, renderer_context),
+            JSONRenderer().render(data, accepted_media_type, renderer_context),
+        )
+
+    def test_renders_like_json_renderer(self):
+        self.assertSameRendering({
+            'utc': datetime.datetime(2025, 1, 1, 12, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+            'london': datetime.datetime(2025, 1, 1, tzinfo=ZoneInfo('Europe/London')),
+            'douala': datetime.datetime(2025, 7, 1, 8, tzinfo=ZoneInfo('Africa/Douala')),
+            'naive': datetime.datetime(2025, 1, 1, 8, 0, 0, 5),
+            'date': datetime.date(2025, 3, 1),
+            'time': datetime.time(8, 0),
+            'duration': datetime.timedelta(hours=1),
+            'amount': decimal.Decimal('1500.50'),
+            'label': gettext_lazy('Scholarships'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'text': 'Bourse d\'excellence \u2028 été ✓',
+            'nested': [{1: True, 'none': None}, (1.5, -2)],
+        })
+        self.assertSameRendering(None)
+        self.assertSameRendering(serializers.ReturnDict({'a': 1}, serializer=None))
+
+    def test_image_fields_render_as_urls(self):
+        article = Article(thumbnail_image='thumbnails/a.jpg')
+        self.assertEqual(
+            ORJSONRenderer().render({'image': article.thumbnail_image, 'empty': Article().thumbnail_image}),
+            b'{"image":"/media/thumbnails/a.jpg","empty":null}',
+        )
+
+    def test_falls_back_for_wide_integers_and_indentation(self):
+        self.assertSameRendering({'big': 2 ** 70})
+        self.assertSameRendering({'a': [1, 2]}, 'application/json; indent=4')
+        self.assertSameRendering({'a': [1, 2]}, renderer_context={'indent': 2})
+
+    def test_parses_like_json_parser(self):
+        for body in [b'{"a": [1, 2.5, null, true], "b": "\xc3\xa9t\xc3\xa9"}', b'[123456789012345678901234567890]']:
+            self.assertEqual(ORJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+        body = '{"title": "été"}'.encode('latin-1')
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body), parser_context={'encoding': 'latin-1'}), {'title': 'été'}
+        )
+        for body in [b'{"a": NaN}', b'{"a":', b'\xff']:
+            with self.assertRaises(ParseError):
+                ORJSONParser().parse(io.BytesIO(body))
+
+
+class CompressionMiddlewareTests(TestCase):
+    """Responses are brotli/gzip-compressed by negotiation without breaking ETags"""
+
+    BODY = b'{"results":[' + b','.join([b'{"headline":"Bourse d\'excellence 2025"}'] * 100) + b']}'
+
+    def process(self, response, **headers):
+        request = RequestFactory().get('/api/articles/', **headers)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def json_response(self, body=BODY):
+        response = HttpResponse(body, content_type='application/json')
+        response.headers['ETag'] = '"abc"'
+        return response
+
+    def test_negotiates_brotli_then_gzip(self):
+        response = self.process(self.json_response(), HTTP_ACCEPT_ENCODING='gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), self.BODY)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+        response = self.process(self.json_response(), HTTP_ACCEPT_ENCODING='gzip, br;q=0')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.BODY)
+
+        response = self.process(self.json_response(), HTTP_ACCEPT_ENCODING='identity')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, self.BODY)
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], '"abc"')
+
+    def test_leaves_small_streaming_encoded_and_binary_responses_alone(self):
+        responses = [
+            self.json_response(b'{"count":0}'),
+            StreamingHttpResponse(iter([self.BODY]), content_type='application/json'),
+            HttpResponse(self.BODY, content_type='image/png'),
+        ]
+        encoded = self.json_response()
+        encoded.headers['Content-Encoding'] = 'gzip'
+        responses.append(encoded)
+        for response in responses:
+            processed = self.process(response, HTTP_ACCEPT_ENCODING='br')
+            self.assertIs(processed, response)
+            self.assertFalse(processed.has_header('Vary'))
+        self.assertEqual(encoded['Content-Encoding'], 'gzip')
+
+    def test_explicit_refusals_beat_the_wildcard(self):
+        for header, expected in (
+            ('*', 'br'),
+            ('br;q=0, *', 'gzip'),
+            ('gzip;q=0, *;q=0.5', 'br'),
+            ('br;q=0, gzip;q=0, *', None),
+            ('*;q=0', None),
+            ('gzip, br;q=0.5', 'gzip'),
+            ('GZIP;q=0.8, br;q=0.8', 'br'),
+        ):
+            self.assertEqual(negotiate(header), expected, header)
+        response = self.process(self.json_response(), HTTP_ACCEPT_ENCODING='br;q=0, *')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_csrf_pages_are_padded_gzip(self):
+        body = b'<form><input name="csrfmiddlewaretoken" value="secret"></form>' * 40
+        sizes = set()
+        for _ in range(5):
+            request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='br, gzip')
+            request.META['CSRF_COOKIE_NEEDS_UPDATE'] = True
+            response = CompressionMiddleware(lambda request: HttpResponse(body, content_type='text/html'))(request)
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(gzip.decompress(response.content), body)
+            sizes.add(len(response.content))
+        self.assertGreater(len(sizes), 1)
+
+        # Brotli only would leave it uncompressed
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='br')
+        request.META['CSRF_COOKIE_NEEDS_UPDATE'] = True
+        response = CompressionMiddleware(lambda request: HttpResponse(body, content_type='text/html'))(request)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_not_modified_echoes_the_weak_etag(self):
+        response = HttpResponseNotModified()
+        response.headers['ETag'] = '"abc"'
+        response = self.process(response, HTTP_ACCEPT_ENCODING='br', HTTP_IF_NONE_MATCH='W/"abc"')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+
+class ConditionalGetTests(TestCase):
+    """ETags follow the content versions, the format, the params and (when per-user) the user"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.article = Article.objects.create(
+            category=self.category, headline_en='Rain in Douala', mood='neutral', timestamp='2025-01-01',
+        )
+
+    def test_not_modified_before_any_query(self):
+        response = self.client.get('/api/articles/')
+        etag = response.headers['ETag']
+        self.assertIn('Last-Modified', response.headers)
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.content, b'')
+        self.assertFalse([q['sql'] for q in queries if '"api_article"' in q['sql']])
+
+        response = self.client.get(f'/api/articles/{self.article.pk}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_new_etag_after_bump(self):
+        etag = self.client.get('/api/categories/').headers['ETag']
+        versions.bump(versions.ARTICLES)
+        # Categories don't depend on the articles
+        self.assertEqual(self.client.get('/api/categories/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        versions.bump(versions.CATEGORIES)
+        response = self.client.get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_etag_per_format_and_params(self):
+        etags = {
+            self.client.get(url, HTTP_ACCEPT=accept).headers['ETag']
+            for url, accept in (
+                ('/api/articles/', 'application/json'),
+                ('/api/articles/', 'text/html'),
+                ('/api/articles/?page_size=5', 'application/json'),
+                ('/api/articles/?lang=fr', 'application/json'),
+            )
+        }
+        self.assertEqual(len(etags), 4)
+        # Parameter order doesn't matter
+        self.assertEqual(
+            self.client.get('/api/articles/?lang=fr&page_size=5').headers['ETag'],
+            self.client.get('/api/articles/?page_size=5&lang=fr').headers['ETag'],
+        )
+
+    def test_etag_follows_the_local_date(self):
+        url = '/api/articles/closing-soon/'
+        with mock.patch('django.utils.timezone.localdate', return_value=datetime.date(2025, 1, 1)):
+            etag = self.client.get(url).headers['ETag']
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with mock.patch('django.utils.timezone.localdate', return_value=datetime.date(2025, 1, 2)):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_per_user(self):
+        anonymous = self.client.get('/api/mentors/')
+        self.assertIn('private', anonymous.headers['Cache-Control'])
+        with mock.patch('notifications.signals.send_admin_new_user_notification'):
+            user = User.objects.create(username='reader')
+        self.client.force_login(user)
+        response = self.client.get('/api/mentors/', HTTP_IF_NONE_MATCH=anonymous.headers['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], anonymous.headers['ETag'])
+
+
+class ResponseCacheTests(TestCase):
+    """Anonymous feed pages are served from the cache until a change that can reach them"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.older = self.create('Older', days=2)
+            self.newer = self.create('Newer', days=1)
+
+    def create(self, headline, days):
+        article = Article.objects.create(
+            category=self.category, headline_en=headline, mood='neutral', timestamp='2025-01-01',
+        )
+        Article.objects.filter(pk=article.pk).update(created_at=article.created_at - datetime.timedelta(days=days))
+        return article
+
+    def headlines(self, url='/api/articles/'):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [article['headline_en'] for article in response.json()['results']]
+
+    def rename(self, article, headline):
+        article.headline_en = headline
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save()
+
+    def test_hit(self):
+        self.assertEqual(self.headlines(), ['Newer', 'Older'])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.headlines(), ['Newer', 'Older'])
+        self.assertFalse([q['sql'] for q in queries if '"api_article"' in q['sql']])
+
+        # Not for users, deep pages or filtered lists
+        self.assertIsNone(views._feed_cache_group(views.ArticleViewSet(), self.request('/api/articles/?page=4')))
+        self.assertIsNone(views._feed_cache_group(views.ArticleViewSet(), self.request('/api/articles/?mood=sad')))
+        with mock.patch('notifications.signals.send_admin_new_user_notification'):
+            self.client.force_login(User.objects.create(username='reader'))
+        Article.objects.filter(pk=self.newer.pk).update(headline_en='Changed')
+        self.assertEqual(self.headlines(), ['Changed', 'Older'])
+
+    def request(self, url):
+        return Request(APIRequestFactory().get(url))
+
+    def test_eviction_reaches_only_affected_pages(self):
+        self.assertEqual(self.headlines(), ['Newer', 'Older'])
+        self.assertEqual(self.headlines('/api/articles/?open=true'), ['Newer', 'Older'])
+        self.rename(self.older, 'Older, edited')
+        self.assertEqual(self.headlines(), ['Newer', 'Older, edited'])
+
+        # An article deeper into its category than the cached pages reach
+        with mock.patch.object(response_cache, 'FEED_CACHED_DEPTH', 1):
+            self.rename(self.older, 'Older, edited twice')
+            self.assertEqual(self.headlines(), ['Newer', 'Older, edited'])
+            # A new article goes to the head and moves everything
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create('Newest', days=0)
+            self.assertEqual(self.headlines(), ['Newest', 'Newer', 'Older, edited twice'])
+
+        # Leaving the open feed evicts its pages, not the full feed's
+        full = response_cache.get_generation(response_cache.FEED_FULL)
+        self.newer.deadline = datetime.date(2020, 1, 1)
+        self.rename(self.newer, 'Newer')
+        self.assertNotIn('Newer', self.headlines('/api/articles/?open=true'))
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(article=self.older, comment_text='Noted')
+        self.assertNotEqual(response_cache.get_generation(response_cache.FEED_FULL), full)
+
+    def test_generations_survive_culling(self):
+        initial = response_cache.get_generation(response_cache.FEED_FULL)
+        with self.captureOnCommitCallbacks(execute=True):
+            response_cache.evict(response_cache.FEED)
+        evicted = response_cache.get_generation(response_cache.FEED_FULL)
+        self.assertNotEqual(evicted, initial)
+        # Entries written under the initial generation must never be reachable again
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.assertEqual(response_cache.get_generation(response_cache.FEED_FULL), evicted)
+
+    def test_keys(self):
+        request = self.request('/api/articles/?page=1&lang=fr')
+        key = response_cache.response_key(request, response_cache.FEED_FULL)
+        self.assertEqual(
+            response_cache.response_key(self.request('/api/articles/?lang=fr&page=1'), response_cache.FEED_FULL), key
+        )
+        self.assertNotEqual(
+            response_cache.response_key(self.request('/api/articles/?page=1'), response_cache.FEED_FULL), key
+        )
+        with translation.override('fr'):
+            self.assertNotEqual(response_cache.response_key(request, response_cache.FEED_FULL), key)
+        self.assertNotEqual(response_cache.response_key(request, response_cache.FEED_OPEN), key)
+
+        # A group is evicted with the groups containing it, and alone
+        with self.captureOnCommitCallbacks(execute=True):
+            response_cache.evict(response_cache.FEED_OPEN)
+        self.assertEqual(response_cache.response_key(request, response_cache.FEED_FULL), key)
+        with self.captureOnCommitCallbacks(execute=True):
+            response_cache.evict(response_cache.FEED)
+        self.assertNotEqual(response_cache.response_key(request, response_cache.FEED_FULL), key)
+
+        # Cached data is rendered per request, in the negotiated format
+        self.client.get('/api/categories/', HTTP_ACCEPT='application/json')
+        response = self.client.get('/api/categories/', HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers['Content-Type'].startswith('text/html'))
+
+
+class ArticleCounterTests(TestCase):
+    """Views and reactions are buffered per process and in PendingArticleCounts, and applied in batches without losing any"""
+
+    def setUp(self):
+        caches[counters.CACHE_ALIAS].clear()
+        caches['default'].clear()
+        counters._buffer.clear()
+        category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.articles = [
+            Article.objects.create(category=category, headline_en=f'Story {i}', mood='neutral', timestamp='2025-01-01')
+            for i in range(3)
+        ]
+
+    def counts(self):
+        return list(Article.objects.order_by('pk').values_list('view_count', 'reaction_count'))
+
+    def test_record_and_flush(self):
+        first, second, third = self.articles
+        for article in (first, first, second, third):
+            self.assertEqual(self.client.post(f'/api/articles/{article.pk}/view/').status_code, 202)
+        self.assertEqual(self.client.post(f'/api/articles/{third.pk}/react/').status_code, 202)
+        self.assertEqual(self.counts(), [(0, 0)] * 3)
+        self.assertEqual(counters.pending(), {
+            first.pk: {'view_count': 2}, second.pk: {'view_count': 1}, third.pk: {'view_count': 1, 'reaction_count': 1},
+        })
+
+        # Articles with the same amounts share an UPDATE
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counters.flush(), 3)
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('UPDATE "api_article"')]), 3)
+        self.assertEqual(self.counts(), [(2, 0), (1, 0), (1, 1)])
+        self.assertEqual(counters.pending(), {})
+        self.assertEqual(counters.flush(), 0)
+
+    def test_increments_during_a_flush_are_kept(self):
+        first = self.articles[0]
+        counters.record_view(first.pk)
+        bump = versions.bump
+
+        def record_meanwhile(name):
+            counters.record_view(first.pk)
+            counters.record_reaction(first.pk)
+            bump(name)
+
+        with mock.patch.object(versions, 'bump', side_effect=record_meanwhile):
+            counters.flush()
+        self.assertEqual(self.counts()[0], (1, 0))
+        self.assertEqual(counters.pending(), {first.pk: {'view_count': 1, 'reaction_count': 1}})
+        counters.flush()
+        self.assertEqual(self.counts()[0], (2, 1))
+
+        # Counts of articles deleted before their flush are dropped
+        counters.record_view(self.articles[1].pk)
+        self.articles[1].delete()
+        self.assertEqual(counters.flush(), 0)
+        self.assertEqual(counters.pending(), {})
+
+    def test_flush_scheduled_once(self):
+        from django_q.models import Schedule
+
+        for _ in range(3):
+            counters.record_view(self.articles[0].pk)
+        self.assertFalse(Schedule.objects.exists())
+        self.assertEqual(counters.drain(), 1)
+        counters.record_view(self.articles[0].pk)
+        counters.drain()
+        scheduled = Schedule.objects.get()
+        self.assertEqual(scheduled.func, 'api.counters.flush_scheduled')
+        self.assertGreater(scheduled.next_run, timezone.now())
+        self.assertEqual(counters.flush_scheduled(), 1)
+        self.assertEqual(self.counts()[0], (4, 0))
+        counters.record_view(self.articles[0].pk)
+        counters.drain()
+        self.assertEqual(Schedule.objects.count(), 2)
+
+    def test_views_write_nothing_until_drained(self):
+        url = f'/api/articles/{self.articles[0].pk}/view/'
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(20):
+                self.assertEqual(self.client.post(url).status_code, 202)
+        self.assertEqual([q['sql'] for q in queries if not q['sql'].startswith('SELECT')], [])
+
+        # Drained on the first increment past the interval, in one transaction
+        with mock.patch.object(counters, 'DRAIN_INTERVAL', 0), CaptureQueriesContext(connection) as queries:
+            counters.record_view(self.articles[1].pk)
+        writes = [q['sql'] for q in queries if q['sql'].startswith(('UPDATE', 'INSERT'))]
+        self.assertEqual(len([sql for sql in writes if 'api_pendingarticlecounts' in sql]), 4)
+        self.assertEqual(counters.pending(), {
+            self.articles[0].pk: {'view_count': 20}, self.articles[1].pk: {'view_count': 1},
+        })
+
+    def test_unknown_articles_and_throttle(self):
+        for pk in ('abc', '999999', '1.5'):
+            self.assertEqual(self.client.post(f'/api/articles/{pk}/view/').status_code, 404, pk)
+        self.assertEqual(counters.pending(), {})
+
+        # The 404s above count towards the rate too
+        caches['default'].clear()
+        url = f'/api/articles/{self.articles[0].pk}/react/'
+        with mock.patch.object(views.ArticleCounterThrottle, 'THROTTLE_RATES', {'article_counters': '2/min'}):
+            self.assertEqual([self.client.post(url).status_code for _ in range(3)], [202, 202, 429])
+        self.assertEqual(counters.pending(), {self.articles[0].pk: {'reaction_count': 2}})
+
+
+class CommentCountTests(TestCase):
+    """comment_count follows comment creates and deletes made from stale copies, and is repairable"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.article = Article.objects.create(
+            category=category, headline_en='Rain in Douala', mood='neutral', timestamp='2025-01-01',
+        )
+
+    def comment_count(self):
+        return Article.objects.values_list('comment_count', flat=True).get(pk=self.article.pk)
+
+    def test_interleaved_creates_and_deletes(self):
+        # Each "request" holds the article as it loaded it, before the others' comments
+        stale = [Article.objects.get(pk=self.article.pk) for _ in range(3)]
+        comments = [Comment.objects.create(article=copy, commenter_name='Ama', comment_text='Hi') for copy in stale]
+        self.assertEqual(self.comment_count(), 3)
+        response = self.client.post(
+            f'/api/articles/{self.article.pk}/comment/', {'commenter_name': 'Kofi', 'comment_text': 'Yes'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        Comment.objects.get(pk=comments[0].pk).delete()
+        comments[1].delete()
+        self.assertEqual(self.comment_count(), 2)
+
+        # Saving a copy loaded before those comments keeps the stored count
+        stale[2].headline_en = 'Heavy rain in Douala'
+        stale[2].save()
+        self.assertEqual(self.comment_count(), 2)
+        # Deleting an already deleted comment again doesn't go below zero
+        Comment.objects.all().delete()
+        comments[2].delete()
+        self.assertEqual(self.comment_count(), 0)
+
+    def test_recompute_repairs_drift(self):
+        other = Article.objects.create(
+            category=self.article.category, headline_en='Floods', mood='neutral', timestamp='2025-01-01',
+        )
+        Comment.objects.bulk_create([
+            Comment(article=article, commenter_name='Ama', comment_text='Hi')
+            for article in (self.article, self.article, other)
+        ])
+        Article.objects.filter(pk=other.pk).update(comment_count=5)
+        self.assertEqual(self.comment_count(), 0)
+
+        version = versions.version_key(versions.ARTICLE_STATS)
+        output = io.StringIO()
+        call_command('recompute_comment_counts', stdout=output)
+        self.assertIn('Corrected 2 articles', output.getvalue())
+        self.assertEqual(
+            dict(Article.objects.values_list('pk', 'comment_count')), {self.article.pk: 2, other.pk: 1}
+        )
+        self.assertNotEqual(versions.version_key(versions.ARTICLE_STATS), version)
+        self.assertEqual(counters.recompute_comment_counts(), 0)
+
+
+class RenderedArticleTests(TestCase):
+    """Precomputed renderings are served only while they match the article's current content"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.article = Article.objects.create(
+            category=category, headline_en='Rain in Douala', mood='neutral', timestamp='2025-01-01',
+        )
+
+    def headline(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        return self.client.get(f'/api/articles/{self.article.pk}/').json()['headline_en']
+
+    def test_saves_in_a_row(self):
+        rendering.build([self.article.pk])
+        self.assertFalse(rendering.stale_article_ids().exists())
+
+        # Save, rebuild (as the queued task does), then save the same instance again
+        self.article.headline_en = 'Heavy rain in Douala'
+        self.article.save()
+        self.assertEqual(list(rendering.stale_article_ids()), [self.article.pk])
+        rendering.build([self.article.pk])
+        self.article.headline_en = 'Floods in Douala'
+        self.article.save()
+
+        self.assertEqual(list(rendering.stale_article_ids()), [self.article.pk])
+        self.assertEqual(self.headline(), 'Floods in Douala')
+        rendering.build([self.article.pk])
+        with mock.patch.object(ArticleSerializer, 'to_representation', side_effect=AssertionError('re-serialized')):
+            self.assertEqual(self.headline(), 'Floods in Douala')
+
+
+class BatchFetchTests(TestCase):
+    """?ids= returns the listed articles in the requested order and names the others"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        hidden = ArticleCategory.objects.create(
+            name_en='Drafts', name_fr='Brouillons', slug='drafts', main_category='ACTUALITY', is_active=False,
+        )
+        self.articles = [
+            Article.objects.create(category=category, headline_en=f'Story {i}', mood='neutral', timestamp='2025-01-01')
+            for i in range(3)
+        ]
+        self.hidden = Article.objects.create(
+            category=hidden, headline_en='Draft', mood='neutral', timestamp='2025-01-01',
+        )
+
+    def get(self, ids, **params):
+        return self.client.get('/api/articles/', {'ids': ids, **params})
+
+    def test_order_and_missing(self):
+        first, second, third = (article.pk for article in self.articles)
+        rendering.build([first, second, third])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(f'{third},999999, {first},{third},{self.hidden.pk},{second},', fields='id,headline_en')
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()
+        self.assertEqual([article['id'] for article in data['results']], [third, first, second])
+        self.assertEqual(set(data['results'][0]), {'id', 'headline_en'})
+        self.assertEqual(data['missing'], [999999, self.hidden.pk])
+        self.assertEqual(len([q for q in queries if 'FROM "api_article"' in q['sql']]), 1)
+
+        self.assertEqual(self.get('').json(), {'results': [], 'missing': []})
+
+    def test_limits_and_bad_ids(self):
+        self.assertEqual(self.get(','.join(str(pk) for pk in range(1, 101))).status_code, 200)
+        response = self.get(','.join(str(pk) for pk in range(1, 102)))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('100', response.json()['error'])
+        for ids in ('a,1', '1;2', '1.5'):
+            self.assertEqual(self.get(ids).status_code, 400, ids)
+
+
+class BootstrapTests(TestCase):
+    """/api/bootstrap/ equals its parts' own endpoints, each answered from a request of its own"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        news = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        jobs = ArticleCategory.objects.create(
+            name_en='Jobs', name_fr='Emplois', slug='jobs', main_category='OPPORTUNITY',
+        )
+        for i in range(3):
+            for category in (news, jobs):
+                Article.objects.create(
+                    category=category, headline_en=f'{category.slug} {i}', mood='neutral', timestamp='2025-01-01',
+                )
+        for category, text in (('GENERAL', 'Keep going'), ('ISLAMIC', 'Patience')):
+            DailyQuote.objects.create(
+                category=category, date=datetime.date(2025, 1, 1), quote_text_en=text, quote_text_fr=text,
+                author='Unknown', affirmations_en=[], affirmations_fr=[],
+            )
+
+    def get(self, url, **headers):
+        response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_parts_match_their_endpoints(self):
+        data = self.get('/api/bootstrap/?main_category=OPPORTUNITY&page_size=2&lang=fr&quote_category=islamic')
+        self.assertEqual(data['categories'], self.get('/api/categories/'))
+        self.assertEqual(data['feed'], self.get('/api/articles/?cursor=&main_category=OPPORTUNITY&page_size=2&lang=fr'))
+        self.assertEqual([article['headline'] for article in data['feed']['results']], ['jobs 2', 'jobs 1'])
+        self.assertEqual(data['quote'], self.get('/api/quotes/today/?category=ISLAMIC&lang=fr'))
+        self.assertIsNone(data['unread_count'])
+
+    def test_fresh_request_per_part(self):
+        categories = self.client.get('/api/categories/')
+        # The client's validators are for the bootstrap response, not its parts
+        response = self.client.get(
+            '/api/bootstrap/?page_size=1', HTTP_IF_NONE_MATCH=categories.headers['ETag'], secure=True,
+        )
+        self.assertEqual(response.json()['categories'], categories.json())
+        request = response.wsgi_request
+        self.assertEqual((request.path, request.GET.dict()), ('/api/bootstrap/', {'page_size': '1'}))
+        self.assertTrue(response.json()['feed']['next'].startswith('https://'))
+
+    def test_user_parts(self):
+        with mock.patch('notifications.signals.send_admin_new_user_notification'):
+            user = User.objects.create(username='reader')
+        UserProfile.objects.create(user=user, phone='690000000', quote_category='ISLAMIC')
+        UserNotification.objects.create(user=user, title_en='Hello', message_en='Welcome')
+        self.client.force_login(user)
+        data = self.get('/api/bootstrap/')
+        self.assertEqual(data['unread_count'], 1)
+        self.assertEqual(data['quote']['quote_text_en'], 'Patience')
+
+
+class CategoryArticlesTests(TestCase):
+    """/api/categories/articles/ returns each active category's newest articles and count"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+
+    def test_newest_articles_per_category(self):
+        news, jobs, hidden = [
+            ArticleCategory.objects.create(
+                name_en=name, name_fr=name, slug=name.lower(), main_category='ACTUALITY', order=order,
+                is_active=name != 'Hidden',
+            )
+            for order, name in enumerate(['News', 'Jobs', 'Hidden'])
+        ]
+        articles = {
+            category: [
+                Article.objects.create(
+                    category=category, headline_en=f'{category.name_en} {i}', french_summary='Résumé',
+                    english_summary='Summary', mood='neutral', timestamp='2025-01-01',
+                )
+                for i in range(count)
+            ]
+            for category, count in [(news, 3), (jobs, 1), (hidden, 2)]
+        }
+
+        response = self.client.get('/api/categories/articles/?per_category=2&fields=id')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(category['slug'], category['article_count'], category['articles']) for category in response.json()],
+            [
+                ('news', 3, [{'id': articles[news][2].pk}, {'id': articles[news][1].pk}]),
+                ('jobs', 1, [{'id': articles[jobs][0].pk}]),
+            ],
+        )
+        self.assertEqual(self.client.get('/api/categories/articles/?per_category=0').status_code, 400)
+
+
+class FeedOrderTests(TestCase):
+    """Pages read from the persisted feed order match the in-memory interleave"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.categories = [
+            ArticleCategory.objects.create(
+                name_en=name, name_fr=name, slug=name.lower(), main_category=main_category,
+            )
+            for name, main_category in [('News', 'ACTUALITY'), ('Jobs', 'OPPORTUNITY'), ('Grants', 'OPPORTUNITY')]
+        ]
+
+    def create(self, category, i):
+        return Article.objects.create(
+            category=category, headline_en=f'{category.name_en} {i}', french_summary='Résumé',
+            english_summary='Summary', mood='neutral', timestamp='2025-01-01',
+        )
+
+    def ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [article['id'] for article in response.json()['results']]
+
+    def assertSameFeed(self, query='', pages=5):
+        # ?mood= is not served from the feed order, so it takes the in-memory interleave
+        for page in range(1, pages + 1):
+            url = f'/api/articles/?page_size=3&page={page}&fields=id{query}'
+            with self.assertNoLogs('api.feed', 'WARNING'):
+                self.assertEqual(self.ids(url), self.ids(f'{url}&mood=neutral'), url)
+
+    def test_matches_in_memory_interleave(self):
+        news, jobs, grants = self.categories
+        articles = [self.create(category, i) for i in range(6) for category in [news, jobs, grants][:1 + i % 3]]
+        self.assertSameFeed()
+        self.assertSameFeed('&main_category=OPPORTUNITY', pages=3)
+
+        # Moves and deletes keep the ranks contiguous
+        with self.captureOnCommitCallbacks(execute=True):
+            articles[3].category = grants
+            articles[3].save()
+            articles[0].delete()
+            articles[-1].delete()
+            articles[7].delete()
+        self.assertSameFeed()
+        self.assertSameFeed('&category__slug=jobs', pages=2)
+
+    def test_new_articles_are_appended(self):
+        news = self.categories[0]
+        older = [self.create(news, i) for i in range(3)]
+        ranks = dict(Article.objects.values_list('pk', 'feed_rank'))
+        self.assertEqual([ranks[article.pk] for article in older], [0, 1, 2])
+
+        newest = self.create(news, 3)
+        self.assertEqual(Article.objects.get(pk=newest.pk).feed_rank, 3)
+        self.assertEqual(dict(Article.objects.exclude(pk=newest.pk).values_list('pk', 'feed_rank')), ranks)
+        self.assertEqual(FeedBucket.objects.get(pk=news.pk).head_rank, 3)
+        self.assertSameFeed(pages=2)
+
+
+class CursorFeedTests(TestCase):
+    """?cursor= walks the interleaved feed forward, one seek per category per page"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.categories = [
+            ArticleCategory.objects.create(
+                name_en=name, name_fr=name, slug=name.lower(), main_category=main_category,
+            )
+            for name, main_category in [('News', 'ACTUALITY'), ('Jobs', 'OPPORTUNITY'), ('Grants', 'OPPORTUNITY')]
+        ]
+        for i in range(5):
+            for category in self.categories[:1 + i % 3]:
+                self.create(category, i)
+
+    def create(self, category, i):
+        return Article.objects.create(
+            category=category, headline_en=f'{category.name_en} {i}', french_summary='Résumé',
+            english_summary='Summary', mood='neutral', timestamp='2025-01-01',
+        )
+
+    def walk(self, url):
+        """IDs of every page reached by following `next` from `url`"""
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, response.content)
+            data = response.json()
+            self.assertIsNone(data['previous'])
+            pages.append([article['id'] for article in data['results']])
+            url = data['next']
+        return pages
+
+    def feed(self, query=''):
+        return [article['id'] for article in self.client.get(f'/api/articles/?page_size=50{query}').json()['results']]
+
+    def test_pages_follow_the_interleaved_feed(self):
+        pages = self.walk('/api/articles/?cursor=&page_size=3&fields=id')
+        self.assertEqual([len(page) for page in pages], [3, 3, 3])
+        self.assertEqual(sum(pages, []), self.feed())
+
+        pages = self.walk('/api/articles/?cursor=&page_size=2&main_category=OPPORTUNITY')
+        self.assertEqual(sum(pages, []), self.feed('&main_category=OPPORTUNITY'))
+        self.assertEqual(self.client.get('/api/articles/?cursor=garbage').status_code, 404)
+
+    def test_articles_published_mid_scroll_shift_nothing(self):
+        first = self.client.get('/api/articles/?cursor=&page_size=4').json()
+        expected = self.feed()
+        self.create(self.categories[1], 'new')
+
+        rest = sum(self.walk(first['next']), [])
+        ids = [article['id'] for article in first['results']] + rest
+        self.assertEqual(ids, expected)
+
+    def test_first_page_seeks_only_filtered_categories(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/articles/?cursor=&page_size=2&category__slug=jobs')
+        seeks = [query for query in queries if 'FROM "api_article"' in query['sql'] and 'LIMIT' in query['sql']]
+        self.assertEqual(len(seeks), 1)
+
+
+class SparseFieldsetTests(TestCase):
+    """?fields=/?omit= trim article payloads; lists leave the comments to the detail"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.article = Article.objects.create(
+            category=category, headline_en='Rain', headline_fr='Pluie', french_summary='Résumé',
+            english_summary='Summary', mood='neutral', timestamp='2025-01-01',
+        )
+        Comment.objects.create(article=self.article, commenter_name='Ada', comment_text='Wet')
+
+    def keys(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()
+        return [set(article) for article in data['results']] if 'results' in data else set(data)
+
+    def assertTrimmed(self):
+        full = set(ArticleSerializer.Meta.fields)
+        self.assertEqual(self.keys('/api/articles/?fields=id,headline_en,category_slug'),
+                         [{'id', 'headline_en', 'category_slug'}])
+        self.assertEqual(self.keys('/api/articles/?omit=french_summary,english_summary'),
+                         [full - {'french_summary', 'english_summary', 'comments'}])
+        self.assertEqual(self.keys('/api/articles/?fields=id,comments'), [{'id'}])
+        self.assertEqual(self.keys(f'/api/articles/{self.article.pk}/'), full)
+        self.assertEqual(self.keys(f'/api/articles/{self.article.pk}/?fields=id,comment_count,comments'),
+                         {'id', 'comment_count', 'comments'})
+
+    def test_serialized(self):
+        self.assertTrimmed()
+
+    def test_rendered(self):
+        rendering.build([self.article.pk])
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/articles/?fields=id,headline_en')
+        self.assertFalse([query for query in queries if 'FROM "api_comment"' in query['sql']])
+        self.assertTrimmed()
+
+
+class LanguageProjectionTests(TestCase):
+    """?lang= payloads load one language's columns, also for articles without a rendering"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.article = Article.objects.create(
+            category=category, headline_en='Rain', headline_fr='Pluie', french_summary='Résumé',
+            english_summary='Summary', mood='neutral', timestamp='2025-01-01',
+        )
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json(), ' '.join(query['sql'] for query in queries)
+
+    def test_fallback_loads_one_language(self):
+        data, sql = self.get('/api/articles/?lang=fr')
+        self.assertEqual(
+            {name: data['results'][0][name] for name in ('headline', 'summary', 'category_name')},
+            {'headline': 'Pluie', 'summary': 'Résumé', 'category_name': 'Actualités'},
+        )
+        self.assertNotIn('english_audio', sql)
+        self.assertNotIn('"api_article"."category_name_en"', sql)
+
+        data, sql = self.get(f'/api/articles/{self.article.pk}/?lang=en&fields=id,headline')
+        self.assertEqual(data, {'id': self.article.pk, 'headline': 'Rain'})
+        self.assertNotIn('summary', sql)
+
+
+class SearchBackendTests(TestCase):
+    """The indexed backend of the database finds what icontains finds, ranked, and folds accents"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        category = ArticleCategory.objects.create(
+            name_en='Scholarships', name_fr='Bourses', slug='scholarships', main_category='OPPORTUNITY',
+        )
+        rows = [
+            ('Scholarship for Canada', 'Bourse pour le Canada', 'Apply before June', 'Postulez avant juin'),
+            ('Floods in Douala', 'Inondations à Douala', 'Canada sends aid', 'Le Canada envoie de l\'aide'),
+            ('Études abroad', 'Études à l\'étranger', 'Scholarship fair in Yaounde', 'Salon des bourses'),
+            ('Football results', 'Résultats du football', 'Lions win', 'Victoire des Lions'),
+        ]
+        self.articles = [
+            Article.objects.create(
+                category=category, headline_en=en, headline_fr=fr, english_summary=summary_en,
+                french_summary=summary_fr, mood='neutral', timestamp='2025-01-01',
+            )
+            for en, fr, summary_en, summary_fr in rows
+        ]
+
+    def ids(self, query):
+        response = self.client.get('/api/articles/', {'search': query, 'fields': 'id', 'ordering': '-created_at'})
+        self.assertEqual(response.status_code, 200, response.content)
+        return [article['id'] for article in response.json()['results']]
+
+    def test_matches_icontains(self):
+        if search.get_search_backend() is None:
+            self.skipTest('No indexed search backend for this database')
+        for query in ('canada', 'scholarship', 'douala aid', 'lions football', 'nothing'):
+            with override_settings(ARTICLE_SEARCH_BACKEND=None):
+                expected = self.ids(query)
+            self.assertEqual(self.ids(query), expected, query)
+
+    def test_ranked_and_accent_folded(self):
+        if search.get_search_backend() is None:
+            self.skipTest('No indexed search backend for this database')
+        scholarship, floods, studies, _ = self.articles
+        # Headline matches rank above summary matches
+        self.assertEqual(search.search_article_ids('canada'), [scholarship.pk, floods.pk])
+        self.assertEqual(search.search_article_ids('scholarship'), [scholarship.pk, studies.pk])
+        self.assertEqual(search.search_article_ids('etudes'), [studies.pk])
+        self.assertEqual(search.search_article_ids('schol'), [scholarship.pk, studies.pk])
+
+
+class SearchResultCacheTests(TestCase):
+    """Plain searches are answered from SearchQuery until the content changes; broad ones are not cached"""
+
+    def setUp(self):
+        if search.get_search_backend() is None:
+            self.skipTest('No indexed search backend for this database')
+        caches[response_cache.CACHE_ALIAS].clear()
+        search._pending_counts.clear()
+        self.category = ArticleCategory.objects.create(
+            name_en='Scholarships', name_fr='Bourses', slug='scholarships', main_category='OPPORTUNITY',
+        )
+        self.first = self.create('Scholarship for Canada')
+        self.second = self.create('Études au Canada')
+
+    def create(self, headline):
+        return Article.objects.create(
+            category=self.category, headline_en=headline, mood='neutral', timestamp='2025-01-01',
+        )
+
+    def ids(self, query):
+        caches[response_cache.CACHE_ALIAS].clear()
+        response = self.client.get('/api/articles/', {'search': query, 'fields': 'id'})
+        self.assertEqual(response.status_code, 200, response.content)
+        return [article['id'] for article in response.json()['results']]
+
+    def test_hit_and_stale_version(self):
+        def writes(queries):
+            return [q['sql'] for q in queries if q['sql'].startswith(('INSERT', 'UPDATE'))]
+
+        with mock.patch.object(search, 'search_article_ids', wraps=search.search_article_ids) as computed:
+            # Searched once: nothing is stored
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(set(self.ids('Canada')), {self.first.pk, self.second.pk})
+            self.assertFalse(writes(queries))
+            self.assertFalse(SearchQuery.objects.exists())
+            # Searched again: stored
+            self.assertEqual(set(self.ids('canada')), {self.first.pk, self.second.pk})
+            with CaptureQueriesContext(connection) as queries:
+                # Same normalized query: answered from the cache, no write
+                self.assertEqual(set(self.ids('canada  CANADA')), {self.first.pk, self.second.pk})
+            self.assertEqual(computed.call_count, 2)
+            self.assertFalse(writes(queries))
+
+            third = self.create('Canada visas')
+            self.assertEqual(self.ids('canada')[0], third.pk)
+            self.assertEqual(computed.call_count, 3)
+
+        self.assertEqual(search.flush_search_counts(), 1)
+        entry = SearchQuery.objects.get()
+        self.assertEqual((entry.query, entry.search_count), ('canada', 4))
+        self.assertEqual(set(entry.result_ids), {self.first.pk, self.second.pk, third.pk})
+
+    def test_accents_share_an_entry(self):
+        self.assertEqual(search.cached_search_ids('études'), [self.second.pk])
+        self.assertEqual(search.cached_search_ids('ETUDES'), [self.second.pk])
+        self.assertEqual(SearchQuery.objects.get().query, 'etudes')
+        # Without an index the key's folding would not match what icontains finds
+        with override_settings(ARTICLE_SEARCH_BACKEND=None):
+            self.assertIsNone(search.cached_search_ids('études'))
+            self.assertEqual(self.ids('Études'), [self.second.pk])
+
+    def test_counted_queries_are_stored_on_their_next_search(self):
+        # Searched once in this process, then counted into the table
+        search.cached_search_ids('visa')
+        self.assertEqual(search.flush_search_counts(), 1)
+        self.assertEqual(SearchQuery.objects.get(query='visa').search_count, 1)
+        # Another process (or this one, after the flush) stores the results
+        search.cached_search_ids('canada visa')
+        self.assertFalse(SearchQuery.objects.filter(query='canada visa').exists())
+        search.cached_search_ids('visa')
+        self.assertEqual(
+            SearchQuery.objects.get(query='visa').content_version, versions.version_key(*search.CONTENT_VERSIONS)
+        )
+
+    def test_broad_query_not_cached(self):
+        with mock.patch.object(search, 'MAX_CACHED_RESULTS', 1), \
+                mock.patch.object(search, 'search_article_ids', wraps=search.search_article_ids) as computed:
+            self.assertIsNone(search.cached_search_ids('canada'))
+            self.assertIsNone(search.cached_search_ids('canada'))
+            self.assertEqual(len(SearchQuery.objects.get().result_ids), 2)
+            self.assertIsNone(search.cached_search_ids('canada'))
+            self.assertEqual(computed.call_count, 2)
+            # The list still returns every match, from the index
+            self.assertEqual(set(self.ids('canada')), {self.first.pk, self.second.pk})
+
+
+class SearchSuggestionTests(TestCase):
+    """Completions: matching categories first, then headline words by usage, kept in step with saves"""
+
+    def setUp(self):
+        self.category = ArticleCategory.objects.create(
+            name_en='Scholarships', name_fr='Bourses', slug='scholarships', main_category='OPPORTUNITY', order=1,
+        )
+        self.other = ArticleCategory.objects.create(
+            name_en='Schools', name_fr='Écoles', slug='schools', main_category='ACTUALITY', order=0,
+        )
+
+    def create(self, en, fr=''):
+        return Article.objects.create(
+            category=self.category, headline_en=en, headline_fr=fr, mood='neutral', timestamp='2025-01-01',
+        )
+
+    def suggest(self, q, **params):
+        response = self.client.get('/api/search/suggest/', {'q': q, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()
+        return [row['slug'] for row in data['categories']], [(row['term'], row['count']) for row in data['suggestions']]
+
+    def test_ranked_by_article_count(self):
+        self.create('Scholars meet in Douala')
+        self.create('School fees rise')
+        self.create('School reopens', 'Rentrée scolaire')
+        categories, terms = self.suggest('new sch', lang='en')
+        self.assertEqual(categories, ['schools', 'scholarships'])
+        self.assertEqual(terms, [('school', 2), ('scholars', 1)])
+        self.assertEqual(self.suggest('sch', lang='en', limit=1)[1], [('school', 2)])
+        # Stopwords and short words are not suggested; folding makes the prefix accent-blind
+        self.assertEqual(self.suggest('the')[1], [])
+        self.assertEqual(self.suggest('eco')[0], ['schools'])
+        self.assertEqual(self.suggest('rentree', lang='fr')[1], [('rentrée', 1)])
+
+    def test_follows_saves_and_rebuild(self):
+        first, second = self.create('School fees rise'), self.create('School reopens')
+        first.headline_en = 'Fees rise'
+        first.save()
+        self.assertEqual(self.suggest('sch')[1], [('school', 1)])
+        second.delete()
+        self.assertEqual(self.suggest('sch')[1], [])
+        self.other.is_active = False
+        self.other.save()
+        self.assertEqual(self.suggest('sch')[0], ['scholarships'])
+
+        expected = sorted(SearchSuggestion.objects.values_list('language', 'key', 'term', 'article_count', 'category'))
+        SearchSuggestion.objects.all().delete()
+        call_command('rebuild_search_suggestions', stdout=io.StringIO())
+        self.assertEqual(
+            sorted(SearchSuggestion.objects.values_list('language', 'key', 'term', 'article_count', 'category')),
+            expected,
+        )
+
+
+class ArticlePaginationTests(TestCase):
+    """Article pages cache their count per filter combination or leave it out with ?count=false"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        for i in range(3):
+            Article.objects.create(
+                category=cls.category, headline_en=f'News {i}', french_summary='Résumé', english_summary='Summary',
+                mood='neutral', timestamp='2025-01-01',
+            )
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+
+    def get_page(self, query):
+        return self.client.get(f'/api/articles/?category={self.category.pk}&page_size=2&{query}')
+
+    def test_count_false_probes_for_the_next_page(self):
+        first = self.get_page('count=false').json()
+        self.assertIsNone(first['count'])
+        self.assertEqual(len(first['results']), 2)
+        self.assertIn('page=2', first['next'])
+
+        last = self.get_page('count=false&page=2').json()
+        self.assertEqual((last['count'], len(last['results']), last['next']), (None, 1, None))
+        self.assertEqual(self.get_page('count=false&page=3').status_code, 404)
+
+    def test_count_is_cached_until_articles_change(self):
+        self.assertEqual(self.get_page('').json()['count'], 3)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get_page('').json()['count'], 3)
+        self.assertFalse([query for query in queries if 'COUNT(' in query['sql']])
+
+        Article.objects.create(
+            category=self.category, headline_en='News 3', french_summary='Résumé', english_summary='Summary',
+            mood='neutral', timestamp='2025-01-01',
+        )
+        self.assertEqual(self.get_page('').json()['count'], 4)
+
+
+class CategoryCopiesTests(TestCase):
+    """Articles keep copies of their category's attributes, refreshed when the category changes"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.article = Article.objects.create(
+            category=self.category, headline_en='News', french_summary='Résumé', english_summary='Summary',
+            mood='neutral', timestamp='2025-01-01',
+        )
+
+    def copies(self):
+        return Article.objects.filter(pk=self.article.pk).values(*denormalize.FIELDS).get()
+
+    def test_copied_on_save(self):
+        self.assertEqual(self.copies(), {
+            'category_slug': 'news', 'category_name_en': 'News', 'category_name_fr': 'Actualités',
+            'main_category': 'ACTUALITY', 'category_is_active': True,
+        })
+        jobs = ArticleCategory.objects.create(
+            name_en='Jobs', name_fr='Emplois', slug='jobs', main_category='OPPORTUNITY',
+        )
+        self.article.category = jobs
+        self.article.save(update_fields=['category'])
+        self.assertEqual(self.copies()['main_category'], 'OPPORTUNITY')
+
+    def test_category_changes_are_propagated(self):
+        self.category.slug, self.category.is_active = 'politics', False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.save()
+        self.assertEqual(self.copies()['category_slug'], 'politics')
+        self.assertEqual(self.client.get('/api/articles/').json()['results'], [])
+        # Up to date rows are left alone
+        self.assertEqual(denormalize.propagate(self.category), 0)
+
+    def test_propagated_inside_the_save_transaction(self):
+        with transaction.atomic():
+            self.category.is_active = False
+            self.category.save()
+            self.assertFalse(self.copies()['category_is_active'])
+            transaction.set_rollback(True)
+        self.assertTrue(self.copies()['category_is_active'])
+
+    def test_unknown_main_category_lists_nothing(self):
+        response = self.client.get('/api/articles/?category__main_category=NOPE')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [])
+
+    def test_only_edits_reaching_the_articles_touch_them(self):
+        def article_writes(**changes):
+            for field, value in changes.items():
+                setattr(self.category, field, value)
+            with CaptureQueriesContext(connection) as queries:
+                self.category.save()
+            return [q['sql'] for q in queries if q['sql'].startswith('UPDATE "api_article"')]
+
+        render_version = Article.objects.get(pk=self.article.pk).render_version
+        self.assertEqual(article_writes(), [])
+        # Rendered but not copied: re-rendered only
+        writes = article_writes(emoji='📰')
+        self.assertEqual(len(writes), 1)
+        self.assertIn('render_version', writes[0])
+        self.assertEqual(Article.objects.get(pk=self.article.pk).render_version, render_version + 1)
+        # Copied but not rendered
+        self.assertEqual(len(article_writes(is_active=False)), 1)
+        self.assertFalse(self.copies()['category_is_active'])
+
+    def test_propagated_in_chunks(self):
+        Article.objects.create(
+            category=self.category, headline_en='More news', french_summary='Résumé', english_summary='Summary',
+            mood='neutral', timestamp='2025-01-01',
+        )
+        self.category.name_en = 'Headlines'
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(denormalize.propagate(self.category, {'name_en'}, chunk_size=1), 2)
+        copies = [q for q in queries if q['sql'].startswith('UPDATE "api_article" SET "category_slug"')]
+        self.assertEqual(len(copies), 2)
+
+    def test_cleared_when_category_deleted(self):
+        self.category.delete()
+        self.assertEqual(self.copies(), denormalize.category_values(None))
+
+    def test_sync_all_repairs_bypassed_writes(self):
+        Article.objects.filter(pk=self.article.pk).update(category_slug=None, category_is_active=False)
+        self.assertEqual(denormalize.sync_all(), 1)
+        self.assertEqual(self.copies()['category_slug'], 'news')
+        results = self.client.get('/api/articles/?category__slug=news').json()['results']
+        self.assertEqual([article['id'] for article in results], [self.article.pk])
+
+
+# A table read in full, without an index (SQLite EXPLAIN QUERY PLAN detail)
+_FULL_SCAN = re.compile(r'SCAN (\w+)(?: AS \w+)?$')
+
+
+@skipUnlessDBFeature('supports_explaining_query_execution')
+class QueryPlanTests(TestCase):
+    """
+    The queries behind the hot endpoints of api/views.py and web/views.py
+    keep an index: every SELECT a request runs is explained, and none may
+    read a whole table other than the small configuration ones.
+    """
+    SMALL_TABLES = {'api_articlecategory', 'api_feedbucket', 'web_mentorcategory', 'web_mentor'}
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        # Creating users would notify the admins
+        patcher = mock.patch('notifications.signals.send_admin_new_user_notification')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.article = Article.objects.create(
+            category=self.category, headline_en='News of the day', french_summary='Résumé',
+            english_summary='Summary', mood='neutral', timestamp='2025-01-01',
+        )
+        Comment.objects.create(article=self.article, commenter_name='Ada', comment_text='Thanks')
+        self.user = User.objects.create_user('player', 'player@example.com', 'secret')
+        other = User.objects.create_user('rival', 'rival@example.com', 'secret')
+        GameProgress.objects.create(user=self.user, score=10)
+        GameProgress.objects.create(user=other, score=20)
+        UserNotification.objects.create(user=self.user, title_en='Hello', message_en='Welcome')
+        Subscription.objects.create(name='Ada', phone='670000000', email='ada@example.com')
+
+    def full_scans(self, plan):
+        """Steps of an EXPLAIN QUERY PLAN reading a whole (not small) table"""
+        tables = set(connection.introspection.table_names()) - self.SMALL_TABLES
+        return [detail for detail in plan if (match := _FULL_SCAN.match(detail)) and match[1] in tables]
+
+    def assertIndexed(self, url, method='get', **kwargs):
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, **kwargs)
+        self.assertLess(response.status_code, 400, url)
+        scans = []
+        with connection.cursor() as cursor:
+            for query in queries.captured_queries:
+                if query['sql'].startswith('SELECT'):
+                    cursor.execute('EXPLAIN QUERY PLAN ' + query['sql'])
+                    plan = [detail for *_, detail in cursor.fetchall()]
+                    scans += [f'{scan}: {query["sql"]}' for scan in self.full_scans(plan)]
+        self.assertEqual(scans, [], url)
+
+    def test_article_endpoints(self):
+        for url in [
+            '/api/articles/', '/api/articles/?main_category=ACTUALITY', '/api/articles/?category__slug=news',
+            '/api/articles/?cursor=', '/api/articles/?count=false', '/api/articles/?search=news',
+            f'/api/articles/{self.article.pk}/', f'/api/articles/?ids={self.article.pk}',
+            '/api/categories/articles/', f'/api/comments/?article={self.article.pk}', '/api/bootstrap/',
+            '/api/search/suggest/?q=ne', f'/en/article/{self.article.pk}/',
+            '/api/articles/?open=true', '/api/articles/closing-soon/',
+        ]:
+            self.assertIndexed(url)
+
+    def test_user_endpoints(self):
+        self.client.force_login(self.user)
+        for url in ['/api/notifications/', '/api/notifications/unread-count/', '/en/relax/load/',
+                    '/en/relax/leaderboard/']:
+            self.assertIndexed(url)
+
+    def test_subscription_lookup(self):
+        self.assertIndexed(
+            '/en/subscribe/', method='post', content_type='application/json',
+            data=json.dumps({'name': 'Ada', 'phone': '670000000', 'email': 'ada@example.com', 'renew': True}),
+        )
+
+    def test_payment_transactions_by_status(self):
+        # As listed by the admin's status filter
+        plan = [line.split(' ', 3)[-1] for line in
+                PaymentTransaction.objects.filter(status='PENDING')[:100].explain().splitlines()]
+        self.assertEqual(self.full_scans(plan), [])
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan)
+
+
+class PublishedAtTests(TestCase):
+    """Article.published_at is parsed from the free-text timestamp and filtered by range"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+
+    def create(self, timestamp):
+        return Article.objects.create(
+            category=self.category, headline_en=timestamp, french_summary='Résumé', english_summary='Summary',
+            mood='neutral', timestamp=timestamp,
+        )
+
+    def test_parse_timestamp(self):
+        utc = datetime.timezone.utc
+        for value, expected in [
+            ('2025-12-21T22:42:23.009689', datetime.datetime(2025, 12, 21, 21, 42, 23, 9689, tzinfo=utc)),
+            ('2025-12-21T22:42:23+00:00', datetime.datetime(2025, 12, 21, 22, 42, 23, tzinfo=utc)),
+            ('2025-12-21 22:42:23', datetime.datetime(2025, 12, 21, 21, 42, 23, tzinfo=utc)),
+            ('20251129_223834', datetime.datetime(2025, 11, 29, 21, 38, 34, tzinfo=utc)),
+            ('2025-01-01', datetime.datetime(2024, 12, 31, 23, 0, tzinfo=utc)),
+            ('2025-02-30', None),
+            ('yesterday', None),
+            ('', None),
+        ]:
+            self.assertEqual(parse_timestamp(value), expected, value)
+
+    def test_published_at_set_on_save(self):
+        article = self.create('2025-01-01')
+        self.assertEqual(article.published_at, datetime.datetime(2024, 12, 31, 23, 0, tzinfo=datetime.timezone.utc))
+        # Unrecognized, or later than received: the creation time
+        article.timestamp = 'soon'
+        article.save(update_fields=['timestamp'])
+        article.refresh_from_db()
+        self.assertEqual(article.published_at, article.created_at)
+        future = self.create('2999-01-01T00:00:00Z')
+        self.assertLessEqual(future.published_at, future.created_at)
+
+    def test_range_filters(self):
+        old, new = self.create('2025-01-01'), self.create('2025-06-01')
+
+        def ids(query):
+            response = self.client.get(f'/api/articles/?{query}')
+            self.assertEqual(response.status_code, 200, response.content)
+            return [article['id'] for article in response.json()['results']]
+
+        self.assertEqual(ids('published_after=2025-03-01'), [new.pk])
+        self.assertEqual(ids('published_before=2025-03-01T00:00:00Z'), [old.pk])
+        self.assertEqual(ids(f'published_after=2024-01-01&category={self.category.pk}'), [new.pk, old.pk])
+        self.assertEqual(ids('published_after=2024-01-01&ordering=published_at'), [old.pk, new.pk])
+        self.assertEqual(self.client.get('/api/articles/?published_after=someday').status_code, 400)
+
+    def test_backfill_command(self):
+        article = self.create('20251129_223834')
+        Article.objects.filter(pk=article.pk).update(published_at=None)
+        call_command('backfill_published_at', stdout=io.StringIO())
+        article.refresh_from_db()
+        self.assertEqual(article.published_at, datetime.datetime(2025, 11, 29, 21, 38, 34, tzinfo=datetime.timezone.utc))
+
+
+class OpenFeedTests(TestCase):
+    """The open feed leaves out passed deadlines; closing-soon lists the upcoming ones"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        caches['default'].clear()
+        self.today = datetime.date.today()
+        self.category = ArticleCategory.objects.create(
+            name_en='Scholarships', name_fr='Bourses', slug='scholarships', main_category='OPPORTUNITY',
+        )
+        self.news = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+
+    def create(self, days=None, category=None):
+        deadline = None if days is None else self.today + datetime.timedelta(days=days)
+        return Article.objects.create(
+            category=category or self.category, headline_en=f'Closes in {days} days', french_summary='Résumé',
+            english_summary='Summary', mood='neutral', timestamp='2025-01-01', deadline=deadline,
+        )
+
+    def ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [article['id'] for article in response.json()['results']]
+
+    def assertRanked(self):
+        """Incremental open ranks match a nightly refresh"""
+        ranks = dict(Article.objects.values_list('pk', 'open_feed_rank'))
+        buckets = list(FeedBucket.objects.order_by('pk').values_list('open_size', 'open_head_article_id'))
+        self.assertEqual(feed.refresh_open_feed(), 0)
+        self.assertEqual(dict(Article.objects.values_list('pk', 'open_feed_rank')), ranks)
+        self.assertEqual(list(FeedBucket.objects.order_by('pk').values_list('open_size', 'open_head_article_id')), buckets)
+
+    def test_closing_soon(self):
+        later, passed, soon, _, today = self.create(5), self.create(-1), self.create(2), self.create(), self.create(0)
+        self.create(30)
+        self.assertEqual(self.ids('/api/articles/closing-soon/'), [today.pk, soon.pk, later.pk])
+        self.assertEqual(self.ids('/api/articles/closing-soon/?days=3&fields=id,deadline'), [today.pk, soon.pk])
+        self.assertEqual(self.ids('/api/articles/closing-soon/?main_category=ACTUALITY'), [])
+        self.assertNotIn(passed.pk, self.ids('/api/articles/closing-soon/?days=90'))
+        self.assertEqual(self.client.get('/api/articles/closing-soon/?days=week').status_code, 400)
+        self.assertEqual(self.client.get('/api/articles/closing-soon/?days=365').status_code, 400)
+
+    def test_open_feed_leaves_out_passed_deadlines(self):
+        articles = [self.create(days) for days in (None, -3, 4, -1, 0)] + [self.create(category=self.news)]
+        expected = [article.pk for article in articles if article.deadline is None or article.deadline >= self.today]
+        self.assertRanked()
+
+        # Feed index and in-memory interleave agree
+        open_feed = self.ids('/api/articles/?open=true&page_size=3') + \
+            self.ids('/api/articles/?open=true&page_size=3&page=2')
+        self.assertEqual(sorted(open_feed), sorted(expected))
+        self.assertEqual(self.ids('/api/articles/?open=true&mood=neutral&page_size=10'), open_feed)
+        self.assertEqual(len(self.ids('/api/articles/?page_size=10')), len(articles))
+
+    def test_deadline_changes_move_articles(self):
+        article, other = self.create(3), self.create(10)
+        article.deadline = self.today - datetime.timedelta(days=1)
+        article.save()
+        self.assertIsNone(Article.objects.get(pk=article.pk).open_feed_rank)
+        self.assertRanked()
+
+        article.deadline = self.today
+        article.save(update_fields=['deadline'])
+        self.assertEqual(self.ids('/api/articles/?open=true'), [other.pk, article.pk])
+        self.assertRanked()
+
+        article.category = self.news
+        article.save()
+        self.assertRanked()
+        other.delete()
+        self.assertRanked()
+
+    def test_passed_deadlines_left_out_before_the_refresh(self):
+        # Still ranked until the nightly refresh runs
+        passed, kept, other = self.create(0), self.create(), self.create(category=self.news)
+        Article.objects.filter(pk=passed.pk).update(deadline=self.today - datetime.timedelta(days=1))
+        self.assertIsNotNone(Article.objects.get(pk=passed.pk).open_feed_rank)
+
+        self.assertEqual(sorted(self.ids('/api/articles/?open=true')), sorted([kept.pk, other.pk]))
+        self.assertEqual(self.ids('/api/articles/?open=true&mood=neutral'), [other.pk, kept.pk])
+
+    def test_every_page_before_the_refresh(self):
+        jobs = ArticleCategory.objects.create(
+            name_en='Jobs', name_fr='Emplois', slug='jobs', main_category='OPPORTUNITY',
+        )
+        # Scholarships closing today have expired by tomorrow, between older and newer open ones
+        articles = [self.create() for _ in range(4)] + [self.create(0) for _ in range(3)]
+        articles += [self.create(3, jobs) for _ in range(2)] + [self.create(category=self.news) for _ in range(6)]
+        articles += [self.create() for _ in range(2)]
+        tomorrow = self.today + datetime.timedelta(days=1)
+        expected = {article.pk for article in articles if article.deadline is None or article.deadline >= tomorrow}
+
+        def walk():
+            ids, page = [], 1
+            with mock.patch('django.utils.timezone.localdate', return_value=tomorrow):
+                while True:
+                    response = self.client.get(f'/api/articles/?open=true&page_size=4&page={page}').json()
+                    ids += [article['id'] for article in response['results']]
+                    if not response['next']:
+                        return ids
+                    page += 1
+
+        before = walk()
+        self.assertEqual(len(before), len(set(before)))
+        self.assertEqual(set(before), expected)
+        feed.refresh_open_feed(today=tomorrow)
+        self.assertEqual(walk(), before)
+
+    def test_open_feed_responses_expire_at_midnight(self):
+        self.create(0), self.create()
+
+        def get(url, day, etag=None):
+            with mock.patch('django.utils.timezone.localdate', return_value=day):
+                return self.client.get(url, **({'HTTP_IF_NONE_MATCH': etag} if etag else {}))
+
+        tomorrow = self.today + datetime.timedelta(days=1)
+        for url, status in (('/api/articles/?open=true', 200), ('/api/articles/', 304)):
+            response = get(url, self.today)
+            self.assertEqual(len(response.json()['results']), 2)
+            self.assertEqual(get(url, self.today, response.headers['ETag']).status_code, 304)
+            self.assertEqual(get(url, tomorrow, response.headers['ETag']).status_code, status)
+        # Not served from the cached page of the day before
+        self.assertEqual(len(get('/api/articles/?open=true', tomorrow).json()['results']), 1)
+
+    def test_nightly_refresh(self):
+        article, kept = self.create(0), self.create()
+        version = versions.version_key(versions.ARTICLES)
+        call_command('refresh_open_feed', stdout=io.StringIO())
+        self.assertEqual(versions.version_key(versions.ARTICLES), version)
+
+        self.assertEqual(feed.refresh_open_feed(today=self.today + datetime.timedelta(days=1)), 1)
+        self.assertIsNone(Article.objects.get(pk=article.pk).open_feed_rank)
+        # Ranks count from the oldest, so dropping it moves no other article
+        self.assertEqual(Article.objects.get(pk=kept.pk).open_feed_rank, 1)
+        self.assertNotEqual(versions.version_key(versions.ARTICLES), version)
+
+
+class ArchiveTests(TestCase):
+    """Cold articles move to the archive; lists skip them, detail and search fall back to them"""
+
+    def setUp(self):
+        caches[response_cache.CACHE_ALIAS].clear()
+        self.category = ArticleCategory.objects.create(
+            name_en='News', name_fr='Actualités', slug='news', main_category='ACTUALITY',
+        )
+        self.other = ArticleCategory.objects.create(
+            name_en='Jobs', name_fr='Emplois', slug='jobs', main_category='OPPORTUNITY',
+        )
+
+    def create(self, headline, days_old, category=None, deadline=None):
+        article = Article.objects.create(
+            category=category or self.category, headline_en=headline, french_summary='Résumé',
+            english_summary='Summary', mood='neutral', timestamp='2025-01-01', deadline=deadline,
+        )
+        Article.objects.filter(pk=article.pk).update(
+            created_at=article.created_at - datetime.timedelta(days=days_old)
+        )
+        return article
+
+    def ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [article['id'] for article in response.json()['results']]
+
+    def test_archive_moves_old_articles_and_comments(self):
+        old = self.create('Harmattan season report', 400)
+        Comment.objects.create(article=old, commenter_name='Ada', comment_text='Dusty')
+        older = self.create('Harmattan archive', 500, category=self.other)
+        still_open = self.create('Harmattan grant', 450, category=self.other, deadline=datetime.date.today())
+        recent = [self.create(f'Harmattan day {i}', i, category=category)
+                  for i, category in enumerate([self.category, self.other] * 2)]
+
+        call_command('archive_articles', days=365, chunk_size=1, stdout=io.StringIO())
+
+        self.assertEqual(set(ArchivedArticle.objects.values_list('pk', flat=True)), {old.pk, older.pk})
+        self.assertEqual(ArchivedComment.objects.get().article_id, old.pk)
+        self.assertFalse(Article.objects.filter(pk__in=[old.pk, older.pk]).exists())
+        self.assertFalse(Comment.objects.exists())
+        self.assertEqual(ArchivedArticle.objects.get(pk=old.pk).created_at, old.created_at - datetime.timedelta(days=400))
+
+        # Lists read the hot table, whose feed order has no gaps
+        hot = {article.pk for article in recent} | {still_open.pk}
+        self.assertEqual(set(self.ids('/api/articles/?page_size=10')), hot)
+        self.assertEqual(
+            self.ids('/api/articles/?page_size=3&page=2'), self.ids('/api/articles/?mood=neutral&page_size=3&page=2')
+        )
+        self.assertEqual(FeedBucket.objects.get(pk=self.other.pk).size, 3)
+
+        # Detail and search fall back to the archive
+        detail = self.client.get(f'/api/articles/{old.pk}/').json()
+        self.assertEqual((detail['headline_en'], detail['category_slug']), ('Harmattan season report', 'news'))
+        self.assertEqual([comment['comment_text'] for comment in detail['comments']], ['Dusty'])
+        self.assertEqual(self.client.get('/api/articles/999999/').status_code, 404)
+        results = self.ids('/api/articles/?search=harmattan&page_size=10')
+        self.assertEqual(set(results[:5]), hot)
+        self.assertEqual(set(results[5:]), {old.pk, older.pk})
+        self.assertEqual(self.ids('/api/articles/?search=season'), [old.pk])
+        # Filtered or ordered searches read the hot table only
+        self.assertEqual(self.ids('/api/articles/?search=season&mood=neutral'), [])
+        self.assertEqual(set(self.ids('/api/articles/?search=harmattan&ordering=-view_count&page_size=10')), hot)
+        self.assertTrue(SearchSuggestion.objects.filter(key='season').exists())
+
+    def test_assistance_requests_keep_articles_hot(self):
+        followed, notified = self.create('Scholarship help', 400), self.create('Scholarship news', 400)
+        AssistanceRequest.objects.create(article=followed, message='How do I apply?')
+        with mock.patch('notifications.signals.send_admin_new_user_notification'):
+            user = User.objects.create(username='reader')
+        notification = UserNotification.objects.create(
+            user=user, title_en='Scholarship news', message_en='Read it', article=notified,
+        )
+
+        self.assertEqual(archive.archive_articles(days=365), 1)
+        self.assertTrue(Article.objects.filter(pk=followed.pk).exists())
+        self.assertTrue(ArchivedArticle.objects.filter(pk=notified.pk).exists())
+        notification.refresh_from_db()
+        self.assertIsNone(notification.article_id)
+
+    def test_category_changes_reach_the_archive(self):
+        article = self.create('Old news', 400)
+        archive.archive_articles(days=365)
+        self.category.name_en = 'Headlines'
+        self.category.save()
+        self.assertEqual(ArchivedArticle.objects.get(pk=article.pk).category_name_en, 'Headlines')
+
+        self.category.is_active = False
+        self.category.save()
+        self.assertEqual(self.client.get(f'/api/articles/{article.pk}/').status_code, 404)
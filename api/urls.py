@@ -4,7 +4,7 @@ from .views import (
     ArticleViewSet, ArticleCategoryViewSet, CommentViewSet, SubscribeView, FileUploadView, 
     FCMSubscribeView, CategoryPreferencesView, OnboardingView,
     MentorCategoriesView, MentorsView, MentorRequestView, AssistanceRequestView, ChatView,
-    DailyQuoteViewSet, UserNotificationViewSet, UserSyncView
+    DailyQuoteViewSet, UserNotificationViewSet, UserSyncView, SearchSuggestionsView, BootstrapView
 )
 
 router = DefaultRouter()
@@ -23,6 +23,10 @@ urlpatterns = [
     path('fcm/preferences/', CategoryPreferencesView.as_view(), name='fcm_preferences'),
     path('onboarding/', OnboardingView.as_view(), name='onboarding_api'),
     path('upload/', FileUploadView.as_view(), name='upload'),
+    # Feed page first load
+    path('bootstrap/', BootstrapView.as_view(), name='bootstrap'),
+    # Search-as-you-type
+    path('search/suggest/', SearchSuggestionsView.as_view(), name='search_suggest'),
     # Mentor endpoints
     path('mentors/categories/', MentorCategoriesView.as_view(), name='mentor_categories'),
     path('mentors/', MentorsView.as_view(), name='mentors_list'),
@@ -0,0 +1,64 @@
+"""
+Parsing of the free-text `Article.timestamp` sent by GistFinder into the
+indexed `Article.published_at`.
+
+Formats understood:
+
+    2025-12-21T22:42:23.009689      ISO 8601, with or without an offset
+    2025-12-21 22:42:23             ISO 8601 with a space
+    20251129_223834                 compact date_time (older GistFinder runs)
+    2025-01-01                      date only (midnight)
+
+Values without an offset are read in settings.GISTFINDER_TIME_ZONE. An
+article can't be published after it was received, so a parsed time later
+than its created_at (a clock in another zone) is capped to created_at, and
+unrecognized values fall back to created_at as well.
+"""
+import datetime
+import zoneinfo
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+COMPACT_FORMATS = ('%Y%m%d_%H%M%S', '%Y%m%d%H%M%S', '%Y%m%d_%H%M')
+
+
+def source_time_zone():
+    return zoneinfo.ZoneInfo(getattr(settings, 'GISTFINDER_TIME_ZONE', None) or 'UTC')
+
+
+def parse_timestamp(value):
+    """Aware datetime of a GistFinder timestamp, or None when it isn't recognized"""
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            date = parse_date(value)
+            if date is not None:
+                parsed = datetime.datetime.combine(date, datetime.time())
+    except ValueError:
+        # Well formed but out of range, e.g. 2025-02-30
+        return None
+    if parsed is None:
+        for format in COMPACT_FORMATS:
+            try:
+                parsed = datetime.datetime.strptime(value, format)
+                break
+            except ValueError:
+                continue
+        else:
+            return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, source_time_zone())
+    return parsed
+
+
+def published_at(timestamp, created_at):
+    """When an article with this `timestamp`, received at `created_at`, was published"""
+    parsed = parse_timestamp(timestamp)
+    if parsed is None or (created_at is not None and parsed > created_at):
+        return created_at
+    return parsed
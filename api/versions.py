@@ -0,0 +1,62 @@
+"""
+Content version counters.
+
+Each kind of content has a ContentVersion row whose counter is bumped (with
+an atomic F() update) whenever that content changes. Derived data, such as
+cached search results and HTTP validators (api/conditional.py), records the
+versions it was computed from; comparing them with the current ones is a
+single indexed lookup, and it holds across processes since the counters live
+in the database. The response cache keeps its group generations here too
+('cache:<group>', see api/response_cache.py).
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+ARTICLES = 'article'
+# View/reaction/comment counters, changing far more often than the articles themselves
+ARTICLE_STATS = 'article_stats'
+CATEGORIES = 'articlecategory'
+COMMENTS = 'comment'
+DAILY_QUOTES = 'dailyquote'
+MENTORS = 'mentor'
+MENTOR_CATEGORIES = 'mentorcategory'
+MENTOR_REQUESTS = 'mentorrequest'
+
+
+def bump(name):
+    """Advance the counter for `name` (created on first use)"""
+    from .models import ContentVersion
+
+    # update() skips auto_now, so updated_at is set explicitly
+    changed = {'version': F('version') + 1, 'updated_at': timezone.now()}
+    if ContentVersion.objects.filter(name=name).update(**changed):
+        return
+    try:
+        with transaction.atomic():
+            ContentVersion.objects.create(name=name, version=1)
+    except IntegrityError:
+        ContentVersion.objects.filter(name=name).update(**changed)
+
+
+def snapshot(*names):
+    """
+    (version_key, last_modified) for `names` in one query; last_modified is
+    the latest change among them, or None if none has changed yet.
+    """
+    from .models import ContentVersion
+
+    versions = dict.fromkeys(names, 0)
+    last_modified = None
+    for name, version, updated_at in ContentVersion.objects.filter(name__in=names).values_list(
+        'name', 'version', 'updated_at'
+    ):
+        versions[name] = version
+        if last_modified is None or updated_at > last_modified:
+            last_modified = updated_at
+    return '.'.join(f'{name}:{versions[name]}' for name in names), last_modified
+
+
+def version_key(*names):
+    """Compact string identifying the current versions of `names`, e.g. 'article:12.articlecategory:3'"""
+    return snapshot(*names)[0]
@@ -1,24 +1,190 @@
+import hashlib
+import io
+from functools import partial
+
 from rest_framework import viewsets, filters, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 from django.conf import settings
+from django.core.paginator import Page as DjangoPage, Paginator as DjangoPaginator
+from django.db.models import QuerySet
+from django.http import Http404
+from django.utils.functional import cached_property
+import django_filters
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Article, Comment, ArticleCategory
-from .serializers import ArticleSerializer, CommentSerializer, ArticleCategorySerializer
-from rest_framework.pagination import PageNumberPagination
+from .models import Article, Comment, ArticleCategory, RenderedArticle
+from .serializers import (
+    ArticleSerializer, ArticleListSerializer, CommentSerializer, ArticleCategorySerializer,
+    defer_unused_fields, project_language, serialized_articles
+)
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.throttling import AnonRateThrottle
+from rest_framework.utils.urls import replace_query_param
+from .search import ArticleSearchFilter, cached_search_ids
+from .conditional import conditional_get
+from .response_cache import cache_response
+from . import archive, counters, rendering, versions, response_cache
+
+
+def _today(view, request):
+    """Responses picking 'today's' content change at midnight without a content change"""
+    from django.utils import timezone
+    return (timezone.localdate().isoformat(),)
+
+
+def _open_feed_day(view, request):
+    """The open feed drops passed deadlines at midnight, without a content change"""
+    return _today(view, request) if view._open_feed(request) else ()
+
+
+def _feed_cache_group(view, request):
+    """Only the first pages of the unfiltered feed are worth caching"""
+    params = request.query_params
+    if not set(params.keys()) <= view.FEED_CACHE_PARAMS or params.get('cursor'):
+        return None
+    try:
+        if not 1 <= int(params.get('page', 1)) <= response_cache.FEED_CACHED_PAGES:
+            return None
+    except ValueError:
+        return None
+    return response_cache.FEED_OPEN if view._open_feed(request) else response_cache.FEED_FULL
+
+
+def _quote_cache_group(view, request):
+    category = request.query_params.get('category', 'GENERAL').upper()
+    return response_cache.quotes_today(category if category in ['GENERAL', 'CHRISTIAN', 'ISLAMIC'] else 'GENERAL')
+
+
+def _article_content_version(view, request):
+    """Responses built from articles and categories, re-keyed whenever either changes"""
+    return (versions.version_key(versions.ARTICLES, versions.CATEGORIES),)
+
+
+def _current_hour_if_authenticated(view, request):
+    """Per-user mentor connection states expire with time"""
+    from django.utils import timezone
+    return (timezone.now().strftime('%Y%m%d%H'),) if request.user.is_authenticated else ()
+
+
+def cached_count(queryset, names):
+    """
+    queryset.count(), cached per query (i.e. per filter combination) under
+    the current versions of the content `names` it reads (api/versions.py)
+    """
+    from django.core.cache import caches
+    
+    sql, params = queryset.query.sql_with_params()
+    parts = [versions.version_key(*names), queryset.db, sql, repr(params)]
+    key = 'count:' + hashlib.sha1('|'.join(parts).encode()).hexdigest()
+    cache = caches[response_cache.CACHE_ALIAS]
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout=24 * 60 * 60)
+    return count
+
+
+class _CachedCountPaginator(DjangoPaginator):
+    def __init__(self, object_list, per_page, count_versions=(), **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_versions = count_versions
+    
+    @cached_property
+    def count(self):
+        if self.count_versions and isinstance(self.object_list, QuerySet):
+            return cached_count(self.object_list, self.count_versions)
+        return super().count
+
+
+class _ProbedPaginator(DjangoPaginator):
+    """Paginator over one page fetched with a row to spare: it only knows whether another page follows"""
+    
+    def __init__(self, rows, number, per_page):
+        super().__init__(rows, per_page)
+        self.number = number
+    
+    @cached_property
+    def count(self):
+        # Just enough for Page.has_next() to be true exactly when the spare row exists
+        return (self.number - 1) * self.per_page + len(self.object_list)
+
 
 class StandardResultsSetPagination(PageNumberPagination):
+    """
+    Page numbers without an uncached COUNT(*).
+    
+    ?count=false leaves the total out (`count` is null): the page is read with
+    LIMIT page_size + 1 and the extra row, if any, means there is a next page.
+    Otherwise views listing `count_versions` (the content their queryset reads)
+    get the count cached per filter combination under those versions.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    count_query_param = 'count'
+    
+    def wants_count(self, request):
+        return request.query_params.get(self.count_query_param, '').lower() not in ('false', '0')
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        self.counting = self.wants_count(request)
+        if self.counting:
+            self.django_paginator_class = partial(
+                _CachedCountPaginator, count_versions=getattr(view, 'count_versions', ())
+            )
+            return super().paginate_queryset(queryset, request, view)
+        
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        page_number = request.query_params.get(self.page_query_param) or 1
+        try:
+            number = int(page_number)
+            if number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message='That page number is not a positive integer'
+            ))
+        offset = (number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        if not rows and number > 1:
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message='That page contains no results'
+            ))
+        self.page = DjangoPage(rows[:page_size], number, _ProbedPaginator(rows, number, page_size))
+        return list(self.page)
+    
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if not self.counting:
+            response.data['count'] = None
+        return response
+
+
+class ArticleCounterThrottle(AnonRateThrottle):
+    """Views and reactions recorded per client address (the 'article_counters' rate)"""
+    scope = 'article_counters'
+
+
+class ArticleCursorPagination(CursorPagination):
+    """Keyset pagination for ?cursor= requests (newest first, stable while scrolling)"""
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+    ordering = ('-created_at', '-id')
+
 
 class ArticleCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for fetching article categories.
     GET /api/categories/ - List all active categories
     GET /api/categories/?main_category=ACTUALITY - Filter by main category
+    GET /api/categories/articles/?per_category=10 - Every category with its newest articles and article count
     """
     queryset = ArticleCategory.objects.filter(is_active=True)
     serializer_class = ArticleCategorySerializer
@@ -27,6 +193,81 @@ class ArticleCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     ordering_fields = ['order', 'name_en']
     pagination_class = None  # Return all categories without pagination
 
+    DEFAULT_PER_CATEGORY = 10
+    MAX_PER_CATEGORY = 50
+
+    @conditional_get(versions.CATEGORIES)
+    @cache_response(response_cache.CATEGORIES)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @action(detail=False, url_path='articles')
+    @conditional_get(versions.ARTICLES, versions.ARTICLE_STATS, versions.CATEGORIES)
+    @cache_response(response_cache.CATEGORY_ARTICLES, extra=_article_content_version)
+    def articles(self, request):
+        """
+        The categories (as listed above) each with `article_count` and its
+        newest `per_category` article cards (as in /api/articles/, including
+        ?lang=, ?fields= and ?omit=), for browsing all categories at once.
+        Further articles of a category: /api/articles/?category=<id>&page=2&page_size=<per_category>
+        """
+        from django.db.models import Count, F, Window
+        from django.db.models.functions import RowNumber
+        
+        try:
+            per_category = int(request.query_params.get('per_category', self.DEFAULT_PER_CATEGORY))
+        except ValueError:
+            return Response({"error": "per_category must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= per_category <= self.MAX_PER_CATEGORY:
+            return Response(
+                {"error": f"per_category must be between 1 and {self.MAX_PER_CATEGORY}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        categories = list(self.filter_queryset(self.get_queryset()))
+        
+        # One query: number the articles of each category newest first, keep
+        # the first `per_category` of each, with their category's total alongside
+        partition = [F('category_id')]
+        ranked = Article.objects.filter(category__in=[category.pk for category in categories]).annotate(
+            position=Window(RowNumber(), partition_by=partition, order_by=[F('created_at').desc(), F('id').desc()]),
+            category_total=Window(Count('id'), partition_by=partition),
+        ).filter(position__lte=per_category).order_by('category_id', 'position').only(
+            *ArticleViewSet.ALWAYS_LOADED_FIELDS, *rendering.ROW_FIELDS
+        )
+        articles = list(ranked)
+        
+        # All cards in one go, so their renderings are fetched together
+        cards = ArticleListSerializer(articles, many=True, context=self.get_serializer_context()).data
+        totals, cards_by_category = {}, {}
+        for article, card in zip(articles, cards):
+            totals[article.category_id] = article.category_total
+            cards_by_category.setdefault(article.category_id, []).append(card)
+        
+        results = self.get_serializer(categories, many=True).data
+        for category, data in zip(categories, results):
+            data['article_count'] = totals.get(category.pk, 0)
+            data['articles'] = cards_by_category.get(category.pk, [])
+        return Response(results)
+
+    @conditional_get(versions.CATEGORIES)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+
+class ArticleFilter(django_filters.FilterSet):
+    """The category lookups read the article's copies (see api/denormalize.py)"""
+    category__slug = django_filters.CharFilter(field_name='category_slug')
+    # Unknown values match nothing, like ?main_category=
+    category__main_category = django_filters.CharFilter(field_name='main_category')
+    # ISO 8601 date or datetime; without an offset it is read as UTC
+    published_after = django_filters.IsoDateTimeFilter(field_name='published_at', lookup_expr='gte')
+    published_before = django_filters.IsoDateTimeFilter(field_name='published_at', lookup_expr='lt')
+
+    class Meta:
+        model = Article
+        fields = ['mood', 'category']
+
 
 class ArticleViewSet(viewsets.ModelViewSet):
     """
@@ -34,38 +275,61 @@ class ArticleViewSet(viewsets.ModelViewSet):
     GET /api/articles/ - List all articles
     GET /api/articles/?main_category=ACTUALITY - Filter by main category
     GET /api/articles/?category__slug=politics - Filter by category slug
-    GET /api/articles/?search=keyword - Full-text search
+    GET /api/articles/?published_after=2025-12-01T00:00:00Z - Published from then (also ?published_before=)
+    GET /api/articles/?open=true - Leave out opportunities whose deadline has passed
+    GET /api/articles/closing-soon/?days=7 - Deadlines within the next 7 days, soonest first
+    GET /api/articles/?search=keyword - Full-text search, best matches first, archived ones last unless filtered (see api/archive.py)
+    GET /api/articles/?cursor= - Cursor mode: follow `next` links instead of page numbers
+    GET /api/articles/?fields=id,headline_en,thumbnails - Sparse fieldset (or ?omit=...)
+    GET /api/articles/?lang=fr - Single-language payload (headline, summary, audio, category_name)
+    GET /api/articles/?ids=12,7,31 - Batch fetch in the given order, with the `missing` IDs
+    GET /api/articles/<id>/ - Detail, also of archived articles (see api/archive.py)
     """
     queryset = Article.objects.all()  # Required for router
     serializer_class = ArticleSerializer
     pagination_class = StandardResultsSetPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = {
-        'mood': ['exact'],
-        'category': ['exact'],
-        'category__slug': ['exact'],
-        'category__main_category': ['exact'],
-    }
+    # Content the listed articles (and so their counts) depend on
+    count_versions = (versions.ARTICLES, versions.CATEGORIES)
+    filter_backends = [DjangoFilterBackend, ArticleSearchFilter, filters.OrderingFilter]
+    filterset_class = ArticleFilter
     search_fields = ['headline', 'headline_en', 'headline_fr', 'french_summary', 'english_summary']
-    ordering_fields = ['created_at', 'view_count', 'reaction_count', 'comment_count']
+    ordering_fields = ['created_at', 'published_at', 'view_count', 'reaction_count', 'comment_count']
 
     def get_queryset(self):
         """
         Get articles, optionally filtered by main_category query param.
-        Excludes articles without a category.
+        Excludes articles without a category (or of an inactive one).
         """
-        queryset = Article.objects.filter(
-            category__isnull=False,
-            category__is_active=True
-        ).select_related('category').order_by('-created_at')
+        queryset = Article.objects.filter(category_is_active=True).select_related('category').order_by(
+            '-created_at', '-id'
+        )
         
         # Shorthand: ?main_category=ACTUALITY
         main_category = self.request.query_params.get('main_category')
         if main_category:
-            queryset = queryset.filter(category__main_category=main_category)
+            queryset = queryset.filter(main_category=main_category)
+        
+        # Open feed: articles ranked in it (see api/feed.py), less those whose
+        # deadline passed since the last nightly refresh
+        if self.action == 'list' and self._open_feed(self.request):
+            from . import feed
+            queryset = queryset.filter(feed.open_filter(), open_feed_rank__isnull=False)
+        
+        # Representations come precomputed (see api/rendering.py): load only the
+        # columns stitched into them; articles without one are reloaded in full
+        if self.action in ['list', 'retrieve', 'closing_soon']:
+            queryset = queryset.select_related(None).only(*self.ALWAYS_LOADED_FIELDS, *rendering.ROW_FIELDS)
         
         return queryset
 
+    def _open_feed(self, request):
+        return request.query_params.get('open', '').lower() in ('true', '1')
+
+    def get_serializer_class(self):
+        if self.action in ['list', 'closing_soon']:
+            return ArticleListSerializer
+        return ArticleSerializer
+
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             permission_classes = [HasAPIKey]
@@ -77,19 +341,68 @@ class ArticleViewSet(viewsets.ModelViewSet):
         # source_code check is replaced by HasAPIKey permission
         return super().create(request, *args, **kwargs)
 
+    @conditional_get(versions.ARTICLES, versions.ARTICLE_STATS, versions.CATEGORIES, versions.COMMENTS)
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            instance = self.get_object()
+        except Http404:
+            # Cold articles are served from the archive (see api/archive.py)
+            archived = archive.get_archived(kwargs.get(self.lookup_field))
+            if archived is None:
+                raise
+            return Response(self.get_serializer(archived).data)
+        serializer = self.get_serializer(instance)
+        rendered = rendering.fetch([instance], RenderedArticle.DETAIL, serializer.projection_language)
+        if instance.pk in rendered:
+            return Response(rendering.finish(rendered[instance.pk], instance, serializer))
+        
+        return Response(serializer.to_representation(serialized_articles(serializer).get(pk=instance.pk)))
+
+    @conditional_get(versions.ARTICLES, versions.ARTICLE_STATS, versions.CATEGORIES, extra=_open_feed_day)
+    @cache_response(_feed_cache_group, extra=_open_feed_day)
     def list(self, request, *args, **kwargs):
         """
         Override list to interleave articles by category for better variety.
         Only applies when no specific category filter is applied.
         """
+        if 'ids' in request.query_params:
+            return self._list_by_ids(request)
+        
         queryset = self.filter_queryset(self.get_queryset())
         
         # Check if we should interleave (only when showing ALL articles)
         category_filter = request.query_params.get('category')
         main_category_filter = request.query_params.get('main_category')
         
+        # Cursor mode (?cursor=, empty for the first page): keyset pagination
+        cursor_mode = 'cursor' in request.query_params
+        
+        # Search results keep their relevance order (page numbers, also in cursor mode)
+        search_query = request.query_params.get('search', '').strip()
+        if search_query:
+            if set(request.query_params.keys()) <= self.SEARCH_CACHE_PARAMS:
+                ids = cached_search_ids(search_query)
+                if ids is not None:
+                    page = self.paginate_queryset(ids)
+                    articles = self.get_queryset().in_bulk(page)
+                    # Archived matches follow the current ones (see api/archive.py)
+                    archived = [pk for pk in page if pk not in articles]
+                    if archived:
+                        articles.update(archive.in_bulk(archived))
+                    serializer = self.get_serializer([articles[pk] for pk in page if pk in articles], many=True)
+                    return self.get_paginated_response(serializer.data)
+            # Filtered or ordered: current articles only (see api/archive.py)
+            page = self.paginate_queryset(queryset)
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
         # If filtering by specific category, use default behavior
         if category_filter:
+            if cursor_mode:
+                paginator = ArticleCursorPagination()
+                page = paginator.paginate_queryset(queryset, request, view=self)
+                serializer = self.get_serializer(page, many=True)
+                return paginator.get_paginated_response(serializer.data)
             page = self.paginate_queryset(queryset)
             if page is not None:
                 serializer = self.get_serializer(page, many=True)
@@ -97,12 +410,36 @@ class ArticleViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(queryset, many=True)
             return Response(serializer.data)
         
+        if cursor_mode:
+            return self._list_interleaved_cursor(request, queryset)
+        
         # Get pagination parameters
         page_size = int(request.query_params.get('page_size', 20))
         page_num = int(request.query_params.get('page', 1))
         
-        # Get all articles for interleaving
-        all_articles = list(queryset)
+        # Fast path: read the page straight from the persisted feed order
+        if self._can_use_feed_index(request, page_num, page_size):
+            response = self._list_from_feed_index(request, page_num, page_size)
+            if response is not None:
+                return response
+        
+        # Load only what interleaving up to this page can reach: the round-robin
+        # takes at most `end` articles from any category, and one more per
+        # category tells whether anything follows the page
+        from django.db.models import F, Window
+        from django.db.models.functions import RowNumber
+        
+        start = (page_num - 1) * page_size
+        end = start + page_size
+        if self.PUBLISHED_PARAMS & request.query_params.keys():
+            # Left alone, SQLite walks the whole category index to spare the
+            # window's sort; a subquery makes the publication range drive it
+            queryset = queryset.filter(pk__in=queryset.values('pk'))
+        all_articles = list(queryset.annotate(
+            category_position=Window(
+                RowNumber(), partition_by=[F('category_id')], order_by=list(queryset.query.order_by)
+            ),
+        ).filter(category_position__lte=max(end, 1) + 1))
         
         if len(all_articles) <= 1:
             page = self.paginate_queryset(queryset)
@@ -130,20 +467,209 @@ class ArticleViewSet(viewsets.ModelViewSet):
                     interleaved.append(bucket[i])
         
         # Manual pagination on interleaved list
-        start = (page_num - 1) * page_size
-        end = start + page_size
         page_articles = interleaved[start:end]
         
         serializer = self.get_serializer(page_articles, many=True)
         
         # Return paginated response format
+        count = cached_count(queryset, self.count_versions) if self.paginator.wants_count(request) else None
         return Response({
-            'count': len(interleaved),
+            'count': count,
             'next': f'?page={page_num + 1}&page_size={page_size}' if end < len(interleaved) else None,
             'previous': f'?page={page_num - 1}&page_size={page_size}' if page_num > 1 else None,
             'results': serializer.data
         })
 
+    # Query params that keep whole category buckets intact (see api/feed.py)
+    FEED_INDEX_PARAMS = {
+        'page', 'page_size', 'main_category', 'category__main_category', 'category__slug', 'format',
+        'fields', 'omit', 'lang', 'count', 'open',
+    }
+    # Query params of the unfiltered feed, whose first pages are cached (see api/response_cache.py)
+    FEED_CACHE_PARAMS = {'page', 'page_size', 'cursor', 'format', 'fields', 'omit', 'lang', 'count', 'open'}
+    # Query params of a plain search, served from the search result cache (see api/search.py)
+    SEARCH_CACHE_PARAMS = {'search', 'page', 'page_size', 'cursor', 'format', 'fields', 'omit', 'lang', 'count'}
+    # Publication range filters (see ArticleFilter)
+    PUBLISHED_PARAMS = {'published_after', 'published_before'}
+    # Columns read by pagination/interleaving even when not serialized
+    ALWAYS_LOADED_FIELDS = ('category', 'created_at', 'feed_rank', 'open_feed_rank')
+    MAX_BATCH_IDS = 100
+    DEFAULT_CLOSING_DAYS = 7
+    MAX_CLOSING_DAYS = 90
+
+    def _can_use_feed_index(self, request, page_num, page_size):
+        return (
+            page_num >= 1
+            and page_size >= 1
+            and set(request.query_params.keys()) <= self.FEED_INDEX_PARAMS
+        )
+
+    def _list_from_feed_index(self, request, page_num, page_size):
+        """
+        Serve the interleaved feed from Article.feed_rank/FeedBucket
+        (open_feed_rank and the open_* bucket fields for ?open=true).
+        Returns None when the in-memory interleave should be used instead.
+        """
+        from . import feed
+        
+        params = request.query_params
+        order = feed.OPEN if self._open_feed(request) else feed.FULL
+        # Ranks still counting expired articles: every page takes the same
+        # (in-memory) path until the nightly refresh, so pages don't overlap
+        if order is feed.OPEN and not feed.open_ranks_current():
+            return None
+        buckets = feed.get_buckets(
+            main_category=params.get('main_category') or params.get('category__main_category'),
+            slug=params.get('category__slug'),
+            order=order,
+        )
+        if params.get('main_category') and params.get('category__main_category') \
+                and params['main_category'] != params['category__main_category']:
+            buckets = []
+        
+        total = sum(bucket.size for bucket in buckets)
+        if total <= 1:
+            return None
+        
+        page_articles = feed.get_page(buckets, page_num, page_size, self.get_queryset(), order=order)
+        if page_articles is None:
+            return None
+        
+        end = (page_num - 1) * page_size + page_size
+        serializer = self.get_serializer(page_articles, many=True)
+        return Response({
+            'count': total if self.paginator.wants_count(request) else None,
+            'next': f'?page={page_num + 1}&page_size={page_size}' if end < total else None,
+            'previous': f'?page={page_num - 1}&page_size={page_size}' if page_num > 1 else None,
+            'results': serializer.data
+        })
+
+    def _list_interleaved_cursor(self, request, queryset):
+        """
+        Interleaved feed in cursor mode. The cursor carries every category
+        bucket's position, so each page is one indexed seek per bucket.
+        It only moves forward (infinite scroll): `previous` is always None.
+        """
+        from . import feed
+        
+        params = request.query_params
+        page_size = ArticleCursorPagination().get_page_size(request)
+        encoded = params.get('cursor')
+        
+        if encoded:
+            try:
+                cursor = feed.decode_cursor(encoded)
+            except ValueError:
+                raise NotFound('Invalid cursor')
+            category_ids = ()
+        else:
+            cursor = None
+            # Only the categories the filters leave any article in get a bucket
+            categories = ArticleCategory.objects.filter(is_active=True)
+            main_category = params.get('main_category') or params.get('category__main_category')
+            if main_category:
+                categories = categories.filter(main_category=main_category)
+            if params.get('category__slug'):
+                categories = categories.filter(slug=params['category__slug'])
+            category_ids = categories.values_list('id', flat=True)
+        
+        page_articles, next_cursor = feed.get_cursor_page(
+            queryset, page_size, cursor=cursor, category_ids=list(category_ids)
+        )
+        
+        serializer = self.get_serializer(page_articles, many=True)
+        next_url = None
+        if next_cursor:
+            next_url = replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+        return Response({
+            'next': next_url,
+            'previous': None,
+            'results': serializer.data
+        })
+
+    def _list_by_ids(self, request):
+        """
+        Batch fetch: ?ids=12,7,31 returns those articles in the requested order
+        (unpaginated, up to MAX_BATCH_IDS) plus the IDs that don't exist or
+        aren't listed (inactive or missing category).
+        """
+        try:
+            ids = list(dict.fromkeys(
+                int(value) for value in request.query_params['ids'].split(',') if value.strip()
+            ))
+        except ValueError:
+            return Response({"error": "ids must be comma-separated integers"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > self.MAX_BATCH_IDS:
+            return Response(
+                {"error": f"At most {self.MAX_BATCH_IDS} ids per request"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        articles = self.get_queryset().in_bulk(ids)
+        serializer = self.get_serializer([articles[pk] for pk in ids if pk in articles], many=True)
+        return Response({
+            'results': serializer.data,
+            'missing': [pk for pk in ids if pk not in articles],
+        })
+
+    @action(detail=False, url_path='closing-soon')
+    @conditional_get(versions.ARTICLES, versions.ARTICLE_STATS, versions.CATEGORIES, extra=_today)
+    def closing_soon(self, request):
+        """
+        Opportunities whose deadline is today or within the next `days` days
+        (default 7), soonest deadline first, paginated like /api/articles/
+        (including ?main_category=, ?category=, ?lang=, ?fields=, ?count=false).
+        Read through the partial index on non-null deadlines.
+        """
+        from datetime import timedelta
+        from django.utils import timezone
+        
+        try:
+            days = int(request.query_params.get('days', self.DEFAULT_CLOSING_DAYS))
+        except ValueError:
+            return Response({"error": "days must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        if not 0 <= days <= self.MAX_CLOSING_DAYS:
+            return Response(
+                {"error": f"days must be between 0 and {self.MAX_CLOSING_DAYS}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        today = timezone.localdate()
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            deadline__gte=today, deadline__lte=today + timedelta(days=days)
+        ).order_by('deadline', 'id')
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    # Counting doesn't need the user, so no session (and CSRF) check; clients
+    # are throttled by address instead
+    @action(
+        detail=True, methods=['post'], url_path='view', authentication_classes=[],
+        throttle_classes=[ArticleCounterThrottle],
+    )
+    def record_view(self, request, pk=None):
+        """Count one read of the article; called by the client when an article is opened"""
+        return self._record_counter(pk, counters.record_view)
+
+    @action(
+        detail=True, methods=['post'], authentication_classes=[],
+        throttle_classes=[ArticleCounterThrottle],
+    )
+    def react(self, request, pk=None):
+        """Count one reaction to the article"""
+        return self._record_counter(pk, counters.record_reaction)
+
+    def _record_counter(self, pk, record):
+        # Buffered and applied in batches (see api/counters.py): nothing is written here
+        try:
+            pk = int(pk)
+        except ValueError:
+            pk = None
+        if pk is None or not Article.objects.filter(pk=pk).exists():
+            return Response({'error': 'Article not found'}, status=status.HTTP_404_NOT_FOUND)
+        record(pk)
+        return Response(status=status.HTTP_202_ACCEPTED)
+
     @action(detail=True, methods=['post'])
     def comment(self, request, pk=None):
         article = self.get_object()
@@ -395,9 +921,121 @@ class OnboardingView(APIView):
             return Response({"error": "Failed to save preferences"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class SearchSuggestionsView(APIView):
+    """
+    Search-as-you-type completions from the prefix index (see api/suggest.py).
+    GET /api/search/suggest/?q=bour&lang=fr&limit=8
+    Categories whose name matches come first, then headline words by usage.
+    """
+    MAX_LIMIT = 20
+    
+    def get(self, request):
+        from . import suggest
+        
+        query = request.query_params.get('q', '')
+        lang = request.query_params.get('lang')
+        if lang not in suggest.LANGUAGES:
+            lang = None
+        try:
+            limit = min(max(int(request.query_params.get('limit', 8)), 1), self.MAX_LIMIT)
+        except ValueError:
+            limit = 8
+        
+        categories, terms = suggest.suggest(query, language=lang, limit=limit)
+        return Response({
+            'query': query,
+            'categories': [{
+                'id': row.category_id,
+                'slug': row.category.slug,
+                'name': row.term,
+                'emoji': row.category.emoji,
+                'main_category': row.category.main_category,
+            } for row in categories],
+            'suggestions': [{
+                'term': row.term,
+                'count': row.article_count,
+            } for row in terms],
+        }, status=status.HTTP_200_OK)
+
+
+class BootstrapView(APIView):
+    """
+    Everything the feed page needs on first load, in one (compressed) response.
+    GET /api/bootstrap/?main_category=ACTUALITY&page_size=10&lang=fr
+    
+    Each part is produced by its own endpoint's view (so its caches and
+    precomputed renderings apply) and equals what that endpoint returns:
+        categories    GET /api/categories/
+        feed          GET /api/articles/?cursor=&page_size=...&main_category=...
+        quote         GET /api/quotes/today/ for the user's quote_category
+                      (?quote_category= for anonymous users), or null
+        unread_count  GET /api/notifications/unread-count/ (null when anonymous)
+    """
+    FEED_PARAMS = ('main_category', 'category__slug', 'page_size', 'lang')
+    # Request headers not passed on to the parts: each is a plain GET
+    SKIPPED_HEADERS = ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'CONTENT_TYPE', 'CONTENT_LENGTH')
+    
+    def _component(self, request, view, url_name, params):
+        """Response data of `view` for a GET of `url_name` with `params`"""
+        from django.core.handlers.wsgi import WSGIRequest
+        from django.http import QueryDict
+        from django.urls import reverse
+        
+        # A new request built from the client's environ (as RequestFactory
+        # does) plus what the middleware attached, so no part sees or changes
+        # another's state
+        outer = request._request
+        query = QueryDict(mutable=True)
+        query.update(params)
+        environ = {key: value for key, value in outer.META.items() if key not in self.SKIPPED_HEADERS}
+        environ.update({
+            'REQUEST_METHOD': 'GET',
+            'SCRIPT_NAME': '',
+            'PATH_INFO': reverse(url_name),
+            'QUERY_STRING': query.urlencode(),
+            'wsgi.input': io.BytesIO(),
+            'wsgi.url_scheme': outer.scheme,
+        })
+        sub = WSGIRequest(environ)
+        sub.user = outer.user
+        if hasattr(outer, 'LANGUAGE_CODE'):
+            sub.LANGUAGE_CODE = outer.LANGUAGE_CODE
+        response = view(sub)
+        return response.data if response.status_code == 200 else None
+    
+    def get(self, request):
+        params = request.query_params
+        lang = {'lang': params['lang']} if 'lang' in params else {}
+        
+        quote_category = params.get('quote_category', 'GENERAL')
+        unread_count = None
+        if request.user.is_authenticated:
+            from .models import UserNotification
+            profile = getattr(request.user, 'profile', None)
+            quote_category = getattr(profile, 'quote_category', None) or 'GENERAL'
+            unread_count = UserNotification.objects.filter(user=request.user, is_read=False).count()
+        
+        return Response({
+            'categories': self._component(
+                request, ArticleCategoryViewSet.as_view({'get': 'list'}), 'articlecategory-list', {}
+            ),
+            'feed': self._component(
+                request, ArticleViewSet.as_view({'get': 'list'}), 'article-list',
+                {'cursor': '', **{name: params[name] for name in self.FEED_PARAMS if name in params}},
+            ),
+            'quote': self._component(
+                request, DailyQuoteViewSet.as_view({'get': 'today'}), 'dailyquote-today',
+                {'category': quote_category, **lang},
+            ),
+            'unread_count': unread_count,
+        })
+
+
 class MentorCategoriesView(APIView):
     """API endpoint for fetching mentor categories."""
     
+    @conditional_get(versions.MENTOR_CATEGORIES)
+    @cache_response(response_cache.MENTOR_CATEGORIES)
     def get(self, request):
         try:
             from web.models import MentorCategory
@@ -421,6 +1059,10 @@ class MentorCategoriesView(APIView):
 class MentorsView(APIView):
     """API endpoint for fetching mentors with optional category filter."""
     
+    @conditional_get(
+        versions.MENTORS, versions.MENTOR_CATEGORIES, versions.MENTOR_REQUESTS,
+        vary_on_user=True, extra=_current_hour_if_authenticated,
+    )
     def get(self, request):
         try:
             from web.models import Mentor, MentorRequest
@@ -696,6 +1338,7 @@ class DailyQuoteViewSet(viewsets.ModelViewSet):
     
     Query params:
         - lang: 'en' or 'fr' (default: 'en') - Returns content in specified language
+          (only that language when given explicitly)
     """
     from .models import DailyQuote
     from .serializers import DailyQuoteSerializer
@@ -706,6 +1349,14 @@ class DailyQuoteViewSet(viewsets.ModelViewSet):
     filterset_fields = ['category', 'date']
     ordering_fields = ['date', 'category', 'created_at']
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ['list', 'retrieve', 'today']:
+            serializer = self.get_serializer()
+            queryset = project_language(queryset, serializer)
+            queryset = defer_unused_fields(queryset, serializer, keep=('category', 'date'))
+        return queryset
+    
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             permission_classes = [HasAPIKey]
@@ -721,6 +1372,8 @@ class DailyQuoteViewSet(viewsets.ModelViewSet):
         return context
     
     @action(detail=False, methods=['get'])
+    @conditional_get(versions.DAILY_QUOTES, extra=_today)
+    @cache_response(_quote_cache_group, extra=_today)
     def today(self, request):
         """
         Get today's quote for a specific category.
@@ -729,25 +1382,22 @@ class DailyQuoteViewSet(viewsets.ModelViewSet):
             - category: GENERAL (default), CHRISTIAN, or ISLAMIC
             - lang: 'en' or 'fr' (default: 'en')
         """
-        from datetime import date
-        from .models import DailyQuote
+        from django.utils import timezone
         
         category = request.query_params.get('category', 'GENERAL').upper()
         if category not in ['GENERAL', 'CHRISTIAN', 'ISLAMIC']:
             category = 'GENERAL'
         
-        lang = request.query_params.get('lang', 'en')
-        if lang not in ['en', 'fr']:
-            lang = 'en'
-        
-        today = date.today()
+        # The same day as the ETag and cache key (_today)
+        today = timezone.localdate()
+        quotes = self.get_queryset()
         
         # Try to get today's quote
-        quote = DailyQuote.objects.filter(category=category, date=today).first()
+        quote = quotes.filter(category=category, date=today).first()
         
         # If no quote for today, get the most recent one
         if not quote:
-            quote = DailyQuote.objects.filter(category=category).order_by('-date').first()
+            quote = quotes.filter(category=category).order_by('-date').first()
         
         if not quote:
             return Response({
@@ -755,8 +1405,7 @@ class DailyQuoteViewSet(viewsets.ModelViewSet):
                 'message': 'No quotes found for this category'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        from .serializers import DailyQuoteSerializer
-        serializer = DailyQuoteSerializer(quote, context={'lang': lang})
+        serializer = self.get_serializer(quote)
         return Response(serializer.data)
 
 
@@ -773,7 +1422,7 @@ class UserNotificationViewSet(viewsets.ModelViewSet):
     DELETE /api/notifications/{id}/ - Delete notification
     
     Query params:
-        - lang: 'en' or 'fr' (default: 'en')
+        - lang: 'en' or 'fr' (default: 'en'); only that language when given explicitly
         - is_read: 'true' or 'false' to filter by read status
         - notification_type: Filter by type
     """
@@ -789,9 +1438,15 @@ class UserNotificationViewSet(viewsets.ModelViewSet):
         """Return notifications for the current user only"""
         from .models import UserNotification
         user = self.request.user
-        if user.is_authenticated:
-            return UserNotification.objects.filter(user=user)
-        return UserNotification.objects.none()
+        if not user.is_authenticated:
+            return UserNotification.objects.none()
+        
+        queryset = UserNotification.objects.filter(user=user)
+        if self.action in ['list', 'retrieve', 'read']:
+            serializer = self.get_serializer()
+            queryset = project_language(queryset, serializer)
+            queryset = defer_unused_fields(queryset, serializer, keep=('user', 'is_read', 'read_at'))
+        return queryset
     
     def get_permissions(self):
         """
@@ -0,0 +1,128 @@
+"""
+Negotiated response compression.
+
+`CompressionMiddleware` compresses API JSON and HTML responses with brotli
+when the client accepts it, gzip otherwise. Static files are served already
+compressed by WhiteNoise, which answers before this middleware runs.
+
+- Only text-like content types above MIN_SIZE bytes are compressed, and only
+  when the result is actually smaller.
+- Streaming responses, responses that already have a Content-Encoding and
+  `Cache-Control: no-transform` responses are left alone.
+- `Vary: Accept-Encoding` is added to every response whose body depends on
+  the negotiation.
+- Responses rendered with the CSRF token are gzipped with random header
+  padding, as GZipMiddleware does against BREACH, never brotli-compressed.
+- Strong ETags (api/conditional.py) become weak on compressed responses, as
+  GZipMiddleware does. Revalidation still gets its 304 because If-None-Match
+  is compared weakly, and the 304 echoes the weak form the client holds.
+
+Without the `brotli` package responses are gzipped only.
+"""
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# Below this the headers outweigh the savings
+MIN_SIZE = 1024
+
+# Quality 5 beats gzip -6 on size and speed; 9 and up cost 10-50x the CPU
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = (
+    'text/',
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'application/problem+json',
+    'image/svg+xml',
+)
+
+
+def accepted_encodings(header):
+    """{content coding: q} of an Accept-Encoding header, '*' included"""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding.strip():
+            accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+def negotiate(header, codings=None):
+    """
+    The coding of `codings` (default 'br' then 'gzip') the client prefers,
+    or None. '*' stands only for codings the header doesn't name, so an
+    explicit q=0 always refuses one; ties go to the earlier coding.
+    """
+    if codings is None:
+        codings = ('br', 'gzip') if brotli is not None else ('gzip',)
+    accepted = accepted_encodings(header)
+    wildcard = accepted.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for coding in codings:
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    # Random gzip header padding against BREACH, as GZipMiddleware
+    max_random_bytes = 100
+
+    def process_response(self, request, response):
+        if response.status_code == 304:
+            return self._not_modified(request, response)
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return response
+        if not response.get('Content-Type', '').startswith(COMPRESSIBLE_TYPES) or len(response.content) < MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        # A page that used the CSRF token may embed it: only gzip has room for
+        # the random padding that keeps its length from revealing it (BREACH)
+        codings = ('gzip',) if request.META.get('CSRF_COOKIE_NEEDS_UPDATE') else None
+        encoding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''), codings)
+        if encoding is None:
+            return response
+
+        if encoding == 'br':
+            compressed = brotli.compress(response.content, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+        else:
+            compressed = compress_string(response.content, max_random_bytes=self.max_random_bytes)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        response.headers['Content-Encoding'] = encoding
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        return response
+
+    def _not_modified(self, request, response):
+        """Give a 304 the ETag form and Vary of the compressed 200 it revalidates"""
+        etag = response.get('ETag')
+        if not etag or not etag.startswith('"'):
+            return response
+        if 'W/' + etag in request.META.get('HTTP_IF_NONE_MATCH', ''):
+            response.headers['ETag'] = 'W/' + etag
+            patch_vary_headers(response, ('Accept-Encoding',))
+        return response
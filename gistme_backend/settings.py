@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 from pathlib import Path
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -67,6 +68,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Serve static files in production
+    "gistme_backend.middleware.CompressionMiddleware",  # brotli/gzip for API JSON and pages
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",  # i18n: Language detection
     "django.middleware.common.CommonMiddleware",
@@ -167,6 +169,12 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 API_SECRET_CODE = os.environ.get("GIST_API_KEY", "gistfinder-secret-key-2024")
 
+# Zone of GistFinder's article timestamps that carry no UTC offset (see api/utils/timestamps.py)
+GISTFINDER_TIME_ZONE = os.environ.get("GISTFINDER_TIME_ZONE", "Africa/Douala")
+
+# Articles older than this move to the archive tables (see api/archive.py)
+ARTICLE_ARCHIVE_AFTER_DAYS = int(os.environ.get("ARTICLE_ARCHIVE_AFTER_DAYS", "365"))
+
 # Session Settings
 SESSION_ENGINE = "django.contrib.sessions.backends.db"
 SESSION_SAVE_EVERY_REQUEST = True
@@ -202,6 +210,34 @@ WEBPUSH_SETTINGS = {
 # Feed Settings
 AD_INTERVAL = 3  # Show an advertisement every N articles
 
+# Caches. API responses are evicted from model signals, so that cache must be
+# shared by every worker process (see api/response_cache.py)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "api_responses": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get(
+            "API_RESPONSE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "gistme_api_responses")
+        ),
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 2000},
+    },
+    # Marks a scheduled flush of the article view/reaction counters, so
+    # processes schedule one between them (see api/counters.py)
+    "counters": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get(
+            "ARTICLE_COUNTERS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "gistme_article_counters")
+        ),
+    },
+}
+
+# Article search: 'auto' picks the FTS5/tsvector backend for the database
+# (see api/search.py), a dotted path selects a backend class, None keeps icontains
+ARTICLE_SEARCH_BACKEND = os.environ.get('ARTICLE_SEARCH_BACKEND', 'auto') or None
+
 INSTALLED_APPS += [
     "django_q",
     "drf_spectacular",
@@ -215,6 +251,19 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Per client address, for the unauthenticated article view/reaction counters
+    'DEFAULT_THROTTLE_RATES': {
+        'article_counters': os.environ.get('ARTICLE_COUNTERS_RATE', '60/min'),
+    },
 }
 
 SPECTACULAR_SETTINGS = {
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("web", "0016_gameprogress"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="subscription",
+            index=models.Index(fields=["email", "subscribed_at"], name="web_subscription_email_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="paymenttransaction",
+            index=models.Index(fields=["status", "created_at"], name="web_payment_status_created_idx"),
+        ),
+        migrations.RemoveIndex(
+            model_name="gameprogress",
+            name="web_gamepro_score_7172cf_idx",
+        ),
+        migrations.AddIndex(
+            model_name="gameprogress",
+            index=models.Index(fields=["score", "user"], name="web_gameprogress_score_idx"),
+        ),
+    ]
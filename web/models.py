@@ -2,6 +2,7 @@ from django.db import models
 from django.utils import timezone
 from django.contrib.auth.models import User
 from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 
@@ -124,6 +125,10 @@ class Subscription(models.Model):
         ordering = ['-subscribed_at']
         verbose_name = 'Pro Subscription'
         verbose_name_plural = 'Pro Subscriptions'
+        indexes = [
+            # Subscription lookups by email take the newest first
+            models.Index(fields=['email', 'subscribed_at'], name='web_subscription_email_idx'),
+        ]
     
     @property
     def expiry_date(self):
@@ -242,6 +247,10 @@ class PaymentTransaction(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Payment Transaction'
         verbose_name_plural = 'Payment Transactions'
+        indexes = [
+            # Transactions by status, newest first (admin, reconciliation)
+            models.Index(fields=['status', 'created_at'], name='web_payment_status_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.status} - {self.email} - {self.final_amount} FCFA"
@@ -441,6 +450,26 @@ class MentorRequest(models.Model):
         return f"{status_emoji.get(self.status, '')} {self.user.email} → {self.mentor.name}"
 
 
+# Signals: bump content versions read by the mentor API ETags and evict cached responses
+@receiver(post_save, sender=MentorCategory)
+@receiver(post_delete, sender=MentorCategory)
+@receiver(post_save, sender=Mentor)
+@receiver(post_delete, sender=Mentor)
+@receiver(post_save, sender=MentorRequest)
+@receiver(post_delete, sender=MentorRequest)
+def bump_mentor_versions(sender, instance, **kwargs):
+    from api import versions
+    names = {
+        MentorCategory: versions.MENTOR_CATEGORIES,
+        Mentor: versions.MENTORS,
+        MentorRequest: versions.MENTOR_REQUESTS,
+    }
+    versions.bump(names[sender])
+    if sender is MentorCategory:
+        from api import response_cache
+        response_cache.evict(response_cache.MENTOR_CATEGORIES)
+
+
 class GameProgress(models.Model):
     """Tracks user's progress in the Relax mirror game"""
     
@@ -454,7 +483,8 @@ class GameProgress(models.Model):
         verbose_name = 'Game Progress'
         verbose_name_plural = 'Game Progress'
         indexes = [
-            models.Index(fields=['-score']),  # Fast leaderboard queries
+            # Leaderboard neighbours and rank: the user exclusion is checked in the index
+            models.Index(fields=['score', 'user'], name='web_gameprogress_score_idx'),
         ]
     
     def __str__(self):
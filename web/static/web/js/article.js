@@ -107,6 +107,9 @@ function articleApp() {
                     // Store raw data for audio
                     this.articleData = data;
 
+                    // Count the read (buffered server-side, applied in batches)
+                    fetch(`/api/articles/${articleId}/view/`, { method: 'POST' }).catch(() => {});
+
                     // Load chat history from LocalStorage or initialize with welcome message
                     this.loadChatHistory();
                 } else {
@@ -66,6 +66,7 @@ function feedApp() {
         articles: [],
         categories: [],  // All categories from API
         currentPage: 1,
+        nextPageUrl: null,
         hasNextPage: true,
         pageSize: 10,
 
@@ -171,18 +172,55 @@ function feedApp() {
                     self.removeBookmark(articleId);
                 };
 
-                // Load categories and articles from API
-                await this.loadCategories();
-                await this.loadArticles();
-
-                // Fetch notification count for badge
-                await this.fetchUnreadCount();
+                // Load categories, first articles and notification count in one request
+                if (!await this.loadBootstrap()) {
+                    await this.loadCategories();
+                    await this.loadArticles();
+                    await this.fetchUnreadCount();
+                }
 
                 // Setup infinite scroll
                 this.setupInfiniteScroll();
             });
         },
 
+        // First load: same data as loadCategories/loadArticles/fetchUnreadCount
+        async loadBootstrap() {
+            try {
+                let url = `/api/bootstrap/?page_size=${this.pageSize}`;
+                if (this.activeTab !== 'FOR_YOU') {
+                    url += `&main_category=${this.activeTab}`;
+                }
+                if (this.activeCategory !== 'all') {
+                    url += `&category__slug=${this.activeCategory}`;
+                }
+
+                const response = await fetch(url, { credentials: 'include' });
+                if (!response.ok) return false;
+                const data = await response.json();
+                if (!data.categories || !data.feed) return false;
+
+                this.categories = data.categories;
+                this.articles = data.feed.results.map(article => ({
+                    ...article,
+                    bookmarked: this.isBookmarked(article.id)
+                }));
+                this.nextPageUrl = data.feed.next;
+                this.hasNextPage = data.feed.next !== null;
+                this.currentPage = 1;
+                this.activeCardIndex = 0;
+                if (data.unread_count !== null) {
+                    this.unreadCount = data.unread_count;
+                    this.hasNewNotifications = this.unreadCount > 0;
+                }
+                this.$nextTick(() => this.calculateCardHeight());
+                return true;
+            } catch (e) {
+                console.error('Failed to load bootstrap data:', e);
+                return false;
+            }
+        },
+
         async loadCategories() {
             try {
                 const response = await fetch('/api/categories/');
@@ -202,10 +240,13 @@ function feedApp() {
             } else {
                 this.isLoading = true;
                 this.currentPage = 1;
+                this.nextPageUrl = null;
             }
 
             try {
-                let url = `/api/articles/?page=${this.currentPage}&page_size=${this.pageSize}`;
+                // Cursor mode: the server hands back the exact next page URL,
+                // so new articles arriving mid-scroll don't shift the feed
+                let url = `/api/articles/?cursor=&page_size=${this.pageSize}`;
 
                 // Add main category filter
                 if (this.activeTab !== 'FOR_YOU') {
@@ -217,6 +258,10 @@ function feedApp() {
                     url += `&category__slug=${this.activeCategory}`;
                 }
 
+                if (append && this.nextPageUrl) {
+                    url = this.nextPageUrl;
+                }
+
                 const response = await fetch(url);
                 if (response.ok) {
                     const data = await response.json();
@@ -239,6 +284,7 @@ function feedApp() {
                     }
 
                     // Check if there's a next page
+                    this.nextPageUrl = data.next;
                     this.hasNextPage = data.next !== null;
 
                     // Recalculate card height after new cards are rendered
@@ -518,13 +564,12 @@ function feedApp() {
                 return;
             }
 
-            // Fetch bookmarked articles from API
+            // Fetch bookmarked articles from API in one request
             try {
-                const promises = bookmarkIds.slice(0, 20).map(id =>
-                    fetch(`/api/articles/${id}/`).then(r => r.ok ? r.json() : null)
-                );
-                const results = await Promise.all(promises);
-                this.bookmarksList = results.filter(Boolean).map(a => ({
+                const ids = bookmarkIds.slice(0, 20).join(',');
+                const response = await fetch(`/api/articles/?ids=${ids}`);
+                const data = response.ok ? await response.json() : { results: [] };
+                this.bookmarksList = data.results.map(a => ({
                     ...a,
                     bookmarked: true,
                     title: this.getArticleTitle(a),
@@ -162,12 +162,13 @@ def article(request, article_id):
         return redirect(f'/login/?next=/article/{article_id}/')
     
     # Fetch article data for OG meta tags (server-side rendering for crawlers)
-    from api.models import Article as ArticleModel
+    from api.models import Article as ArticleModel, ArchivedArticle
     from django.utils.translation import get_language
     
     article_data = None
     try:
-        article_obj = ArticleModel.objects.get(id=article_id)
+        # Cold articles live in the archive (see api/archive.py)
+        article_obj = ArticleModel.objects.filter(id=article_id).first() or ArchivedArticle.objects.get(id=article_id)
         lang = get_language() or 'en'  # Get user's preferred language
         
         # Choose title based on language
@@ -188,7 +189,7 @@ def article(request, article_id):
             'description': description,
             'thumbnail': thumbnail,
         }
-    except ArticleModel.DoesNotExist:
+    except ArchivedArticle.DoesNotExist:
         pass
     
     return render(request, 'web/article.html', {